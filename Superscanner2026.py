@@ -8,14 +8,15 @@ import shutil
 import requests
 import ast
 import re
-from queue import Queue
-from PyQt5.QtCore import QTimer
 # Import QFont for font control
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, QTextEdit, QFileDialog, QLabel, QSpacerItem, QSizePolicy, QInputDialog
 import shlex
 # Import html for escaping text for safe display
 import html
+# Runs scanners with per-tool time and memory limits
+from process_limits import get_limits_for_command, run_limited
+from signal_queue import SignalingQueue, QueueDrainer
 
 
 class Application(QWidget):
@@ -37,7 +38,7 @@ class Application(QWidget):
         self.version_var = QComboBox(self)
         self.version_var.addItems(self.version_list)
         self.version_var.setCurrentIndex(0)
-        self.queue = Queue()
+        self.queue = SignalingQueue()
 
         # Title Labels for Static and Dynamic Scanners
         self.static_title = QLabel("Static Scanners")
@@ -147,9 +148,8 @@ class Application(QWidget):
 
         self.setLayout(main_layout)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_output)
-        self.timer.start(100)
+        # Output is drained when workers post to the queue instead of polling it on a timer.
+        self.output_drainer = QueueDrainer(self.queue, self.update_output, parent=self)
 
     def run_code(self):
         command = self.command_input.toPlainText()
@@ -449,28 +449,23 @@ contract {contract_name}Test is Test {{
                 args = shlex.split(command)
                 # Run the command in the specified directory (cwd) if provided
                 # This is more stable than os.chdir in a threaded GUI app
-                result = subprocess.run(
-                    args, 
-                    check=True, 
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT, 
-                    universal_newlines=True, 
-                    cwd=cwd
-                )
-                # Escape the raw stdout to prevent HTML injection and wrap in <pre>
-                escaped_stdout = html.escape(result.stdout)
-                formatted_output = f"<pre>{escaped_stdout}</pre>"
-                self.queue.put(formatted_output)
-
-            except subprocess.CalledProcessError as e:
-                # Escape the raw stderr to prevent HTML injection and wrap in <pre>
-                escaped_stderr = html.escape(e.output)
+                # Wall-clock and memory limits are enforced on the whole process group
+                limits = get_limits_for_command(args)
+                result = run_limited(args, cwd=cwd, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'])
+                # Escape the raw output to prevent HTML injection and wrap in <pre>
+                escaped_output = html.escape(result['output'])
+
+                if result['truncated']:
+                    # Keep whatever the scanner printed before it was stopped
+                    self.queue.put(f"<span style='color: orange;'>Truncated: {html.escape(result['truncated_reason'])}. Partial output:</span><br><pre>{escaped_output}</pre>")
+                elif result['returncode'] == 0:
+                    self.queue.put(f"<pre>{escaped_output}</pre>")
                 # Note: Wake uses non-zero exit codes for successful detections.
                 # Exit code 3 means detections were found. We can treat it as success.
-                if "wake" in command and e.returncode == 3:
-                     self.queue.put(f"<span style='color: green;'>Wake scan complete. Detections found (exit code 3):</span><br><pre>{escaped_stderr}</pre>")
+                elif "wake" in command and result['returncode'] == 3:
+                     self.queue.put(f"<span style='color: green;'>Wake scan complete. Detections found (exit code 3):</span><br><pre>{escaped_output}</pre>")
                 else:
-                     self.queue.put(f"<span style='color: red;'>Error (return code {e.returncode}):<br><pre>{escaped_stderr}</pre></span>")
+                     self.queue.put(f"<span style='color: red;'>Error (return code {result['returncode']}):<br><pre>{escaped_output}</pre></span>")
 
             except FileNotFoundError:
                 self.queue.put(f"<span style='color: red;'>Command not found: '{command.split()[0]}'. Ensure it's installed and in your PATH.</span><br>")
@@ -0,0 +1,268 @@
+import os
+import re
+import sys
+import html
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from report_pipeline import REPORT_SCANNERS, run_report_scanners, build_report_markdown
+from scan_cache import ScanCache
+from build_artifacts import get_build_export, load_build_export
+from slither_detectors import run_detectors_in_process
+from contract_map import build_contract_map, parse_slither_findings
+
+
+# =================================================================================
+# HEADLESS BATCH AUDIT
+# =================================================================================
+# Runs prepare -> map -> scan -> report on many projects across a process pool,
+# without PyQt5, for nightly audits on headless servers.
+#
+#   python3 batch_audit.py ~/audits/protocol-a ~/audits/protocol-b
+#   python3 batch_audit.py --manifest nightly.txt --workers 4 --output-dir reports/
+#
+# A manifest is either a text file with one project path per line (`#` starts a
+# comment) or a JSON list of paths / {"path": ..., "solc_version": ...} objects.
+# Relative paths in a manifest are resolved against the manifest's directory.
+AUDIT_STEPS = ['prepare', 'map', 'scan', 'report']
+IMPACT_ORDER = {"High": 0, "Medium": 1, "Low": 2, "Informational": 3, "Optimization": 4}
+
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def to_plain_text(message):
+    """Turns the HTML status messages shared with the GUI into terminal text."""
+    return html.unescape(TAG_RE.sub('', str(message))).strip()
+
+
+def load_manifest(path):
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, 'r') as f:
+        content = f.read()
+
+    if path.endswith('.json'):
+        entries = json.loads(content)
+        if isinstance(entries, dict):
+            entries = entries.get('projects', [])
+    else:
+        entries = [line.strip() for line in content.splitlines() if line.strip() and not line.strip().startswith('#')]
+
+    projects = []
+    for entry in entries:
+        project = {"path": entry} if isinstance(entry, str) else dict(entry)
+        project['path'] = os.path.abspath(os.path.join(base_dir, os.path.expanduser(project['path'])))
+        projects.append(project)
+    return projects
+
+
+def get_report_path(project_root, output_dir=None):
+    """Reports go next to the project like the GUI's, or into output_dir under a collision-free name."""
+    if not output_dir:
+        return os.path.join(project_root, 'Full_Security_Report.md')
+    project_id = hashlib.sha256(project_root.encode()).hexdigest()[:8]
+    return os.path.join(output_dir, f"{os.path.basename(project_root)}-{project_id}.md")
+
+
+def prepare_project(project_root, log):
+    """Installs JS and Solidity dependencies. Failures are logged and the audit continues."""
+    commands = []
+    if os.path.exists(os.path.join(project_root, 'yarn.lock')):
+        commands.append("yarn install")
+    elif os.path.exists(os.path.join(project_root, 'package.json')):
+        commands.append("npm install")
+    if os.path.exists(os.path.join(project_root, 'foundry.toml')):
+        commands.append("forge install")
+    else:
+        log("Warning: `foundry.toml` not found. Compilation will rely on crytic-compile's framework detection.")
+
+    for command in commands:
+        log(f"Running `{command}`...")
+        result = subprocess.run(command, shell=True, cwd=project_root, capture_output=True, text=True)
+        if result.returncode != 0:
+            log(f"`{command}` failed with exit code {result.returncode}, continuing.\n{(result.stdout + result.stderr).strip()}")
+
+
+def map_project(project_root, log):
+    from slither import Slither
+
+    export_path = get_build_export(project_root, log=log)
+    slither_instance = Slither(load_build_export(export_path)[0])
+    return slither_instance, build_contract_map(slither_instance, project_root)
+
+
+def format_slither_findings(findings):
+    if not findings:
+        return "(No findings or output from scanner)"
+    lines = []
+    for finding in sorted(findings, key=lambda f: (IMPACT_ORDER.get(f['impact'], 99), f['check'])):
+        lines.append(f"[{finding['impact']}] {finding['check']} in {finding['contract']}.{finding['function_name']}")
+        lines.append(f"    {finding['description'].strip()}")
+    return "\n".join(lines)
+
+
+def audit_project(project, options):
+    """
+    Audits one project in a worker process and returns a JSON-serialisable summary.
+    Never raises: a failing step is recorded in the summary instead.
+    """
+    project_root = project['path']
+    project_name = os.path.basename(project_root)
+    solc_version = project.get('solc_version') or options.get('solc_version')
+    steps = options['steps']
+
+    def log(message):
+        if not options.get('quiet'):
+            print(f"[{project_name}] {to_plain_text(message)}", flush=True)
+
+    summary = {
+        "project": project_root,
+        "status": "ok",
+        "error": None,
+        "step_times": {},
+        "contracts": None,
+        "findings": None,
+        "findings_by_impact": {},
+        "truncated": [],
+        "report": None,
+    }
+    if not os.path.isdir(project_root):
+        summary.update(status="failed", error="project directory not found")
+        return summary
+
+    cache = ScanCache() if options.get('use_cache', True) else None
+    slither_instance = None
+    contract_map = {}
+    results = []
+    slither_result = None
+    step = None
+    try:
+        for step in steps:
+            start = time.monotonic()
+            log(f"Step `{step}`...")
+
+            if step == 'prepare':
+                prepare_project(project_root, log)
+
+            elif step == 'map':
+                slither_instance, contract_map = map_project(project_root, log)
+                summary['contracts'] = len(contract_map)
+                log(f"Mapped {len(contract_map)} deployable contracts.")
+
+            elif step == 'scan':
+                scanners = REPORT_SCANNERS
+                if slither_instance is not None:
+                    # Slither runs in-process on the mapped instance, so the report pipeline skips its CLI run.
+                    slither_start = time.monotonic()
+                    slither_data = run_detectors_in_process(slither_instance, options.get('custom_detector_path'))
+                    findings = parse_slither_findings(slither_data, contract_map)
+                    slither_result = {
+                        "name": "Slither", "command": "slither (in-process)", "returncode": 0,
+                        "output": format_slither_findings(findings), "report_file": None, "error": None,
+                        "not_found": False, "cached": False, "elapsed": time.monotonic() - slither_start
+                    }
+                    summary['findings'] = len(findings)
+                    for finding in findings:
+                        impact = finding['impact']
+                        summary['findings_by_impact'][impact] = summary['findings_by_impact'].get(impact, 0) + 1
+                    scanners = [s for s in REPORT_SCANNERS if s['name'] != 'Slither']
+                results = run_report_scanners(project_root, scanners, log=log, max_workers=options.get('scanner_workers'), cache=cache, solc_version=solc_version)
+                if slither_result:
+                    results.insert(0, slither_result)
+                summary['truncated'] = [r['name'] for r in results if r.get('truncated')]
+
+            elif step == 'report':
+                report_path = get_report_path(project_root, options.get('output_dir'))
+                with open(report_path, 'w', errors='ignore') as f:
+                    f.write(build_report_markdown(project_name, results))
+                summary['report'] = report_path
+                log(f"Report saved to: {report_path}")
+
+            summary['step_times'][step] = round(time.monotonic() - start, 2)
+    except Exception as e:
+        summary.update(status="failed", error=f"{step}: {e}")
+        log(f"Audit failed during `{step}`: {e}")
+    return summary
+
+
+def collect_projects(args):
+    projects = [{"path": os.path.abspath(os.path.expanduser(p))} for p in args.projects]
+    for manifest in args.manifest:
+        projects.extend(load_manifest(manifest))
+
+    unique = {}
+    for project in projects:
+        unique.setdefault(project['path'], project)
+    return list(unique.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless SuperScanner batch audit (no GUI required).")
+    parser.add_argument('projects', nargs='*', help="Project directories to audit.")
+    parser.add_argument('--manifest', action='append', default=[], help="Text or JSON file listing projects. May be repeated.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Number of projects audited in parallel.")
+    parser.add_argument('--steps', default=",".join(AUDIT_STEPS), help=f"Comma-separated subset of: {', '.join(AUDIT_STEPS)}.")
+    parser.add_argument('--solc', dest='solc_version', help="Default solc version for projects that do not set one.")
+    parser.add_argument('--custom-detectors', dest='custom_detector_path', help="File or directory with custom Slither detectors.")
+    parser.add_argument('--output-dir', help="Write reports here instead of into each project.")
+    parser.add_argument('--summary', help="Path of the JSON run summary (default: batch_summary.json in the output dir or cwd).")
+    parser.add_argument('--no-cache', action='store_true', help="Do not reuse or store cached scan results.")
+    parser.add_argument('--quiet', action='store_true', help="Only print one line per finished project.")
+    args = parser.parse_args(argv)
+
+    steps = [s.strip() for s in args.steps.split(',') if s.strip()]
+    unknown = [s for s in steps if s not in AUDIT_STEPS]
+    if unknown:
+        parser.error(f"unknown steps: {', '.join(unknown)}")
+    steps = [s for s in AUDIT_STEPS if s in steps]
+
+    projects = collect_projects(args)
+    if not projects:
+        parser.error("no projects given. Pass project directories or --manifest.")
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    summary_path = args.summary or os.path.join(args.output_dir or os.getcwd(), 'batch_summary.json')
+
+    options = {
+        "steps": steps,
+        "solc_version": args.solc_version,
+        "custom_detector_path": args.custom_detector_path,
+        "output_dir": os.path.abspath(args.output_dir) if args.output_dir else None,
+        "use_cache": not args.no_cache,
+        "quiet": args.quiet,
+    }
+
+    workers = max(1, min(args.workers, len(projects)))
+    # Split the cores between projects so each project's scanners do not oversubscribe the machine.
+    options['scanner_workers'] = max(1, (os.cpu_count() or 1) // workers)
+    print(f"Auditing {len(projects)} projects with {workers} workers ({', '.join(steps)})...", flush=True)
+    started = datetime.now()
+    summaries = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(audit_project, project, options): project for project in projects}
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                # A worker process died (e.g. killed by the OOM killer).
+                summary = {"project": futures[future]['path'], "status": "failed", "error": f"worker crashed: {e}"}
+            summaries.append(summary)
+            status = "OK" if summary['status'] == "ok" else f"FAILED ({summary['error']})"
+            print(f"[{len(summaries)}/{len(projects)}] {summary['project']}: {status}", flush=True)
+
+    summaries.sort(key=lambda s: s['project'])
+    with open(summary_path, 'w') as f:
+        json.dump({"started": started.isoformat(), "finished": datetime.now().isoformat(),
+                   "steps": steps, "projects": summaries}, f, indent=2)
+    failed = sum(1 for s in summaries if s['status'] != "ok")
+    print(f"Done: {len(summaries) - failed} succeeded, {failed} failed. Summary: {summary_path}", flush=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import os
+import threading
+
+from scan_cache import make_cache_key, project_fingerprint
+
+
+# =================================================================================
+# SHARED COMPILATION EXPORTS
+# =================================================================================
+# One crytic-compile export is kept per build hash (sources + build config), so
+# contract mapping, Slither scans and the full report all reuse a single
+# `forge build` instead of each compiling the project again. Projects are compiled
+# with the Foundry platform, as the scanners always did; forge takes the solc
+# version from foundry.toml, which is part of the hash.
+COMPILE_FRAMEWORK = 'foundry'
+BUILD_EXPORT_DIR = os.path.join(os.path.expanduser('~'), '.superscanner', 'builds')
+MAX_BUILD_EXPORTS = 20
+
+_build_locks = {}
+_build_locks_guard = threading.Lock()
+
+
+def _noop_log(message):
+    pass
+
+
+def _lock_for(build_hash):
+    with _build_locks_guard:
+        return _build_locks.setdefault(build_hash, threading.Lock())
+
+
+def get_build_hash(target_path):
+    return make_cache_key(project_fingerprint(target_path), 'crytic-compile', 'compile', COMPILE_FRAMEWORK)
+
+
+def _prune_exports():
+    try:
+        exports = [os.path.join(BUILD_EXPORT_DIR, f) for f in os.listdir(BUILD_EXPORT_DIR) if f.endswith('.zip')]
+    except OSError:
+        return
+    exports.sort(key=os.path.getmtime, reverse=True)
+    for stale_export in exports[MAX_BUILD_EXPORTS:]:
+        try:
+            os.remove(stale_export)
+        except OSError:
+            pass
+
+
+def get_build_export(target_path, log=None):
+    """
+    Returns the path of the compilation export for the target's current sources.
+    The project is only compiled when no export exists for its build hash.
+    """
+    from crytic_compile import CryticCompile, save_to_zip
+
+    log = log or _noop_log
+    build_hash = get_build_hash(target_path)
+    export_path = os.path.join(BUILD_EXPORT_DIR, f"{build_hash}.zip")
+
+    # Concurrent callers for the same build wait for a single compilation.
+    with _lock_for(build_hash):
+        if os.path.exists(export_path):
+            os.utime(export_path, None)
+            log(f"<span style='color:#87CEEB;'>♻️ Reusing compiled artifacts for build {build_hash[:12]}.</span>")
+            return export_path
+
+        log(f"Compiling {os.path.basename(target_path)} once for build {build_hash[:12]}...")
+        compilation = CryticCompile(target_path, framework=COMPILE_FRAMEWORK)
+        os.makedirs(BUILD_EXPORT_DIR, exist_ok=True)
+        tmp_path = f"{export_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        save_to_zip([compilation], tmp_path)
+        os.replace(tmp_path, export_path)
+        _prune_exports()
+        return export_path
+
+
+def load_build_export(export_path):
+    """Loads the CryticCompile instances stored in an export, without recompiling."""
+    from crytic_compile.utils.zip import load_from_zip
+    return load_from_zip(export_path)
@@ -0,0 +1,99 @@
+import os
+
+
+# =================================================================================
+# CONTRACT MAP & SLITHER FINDINGS
+# =================================================================================
+# Qt-free helpers shared by the scanner GUI and the headless batch auditor.
+
+
+def _compiler_version(contract):
+    try:
+        return contract.compilation_unit.compiler_version.version or None
+    except AttributeError:
+        return None
+
+
+def _is_inside(path, root):
+    try:
+        return os.path.commonpath([os.path.abspath(path), root]) == root
+    except ValueError:
+        # Different drives on Windows.
+        return False
+
+
+def build_contract_map(slither_instance, project_root=None):
+    """
+    Returns {contract_name: {"name", "functions", "source_file_relative", "is_abstract", "solc_version"}}
+    for every non-library, non-interface contract. With a project root, only contracts
+    inside the project are kept.
+    """
+    contract_map = {}
+    valid_contracts = [c for c in slither_instance.contracts if not c.is_library and not c.is_interface]
+    if project_root:
+        # A string prefix test would also accept sibling directories such as <root>2/.
+        project_root = os.path.abspath(project_root)
+        valid_contracts = [c for c in valid_contracts if _is_inside(str(c.source_mapping.filename.absolute), project_root)]
+
+    for contract in valid_contracts:
+        source_file_full_path = str(contract.source_mapping.filename.absolute)
+
+        if project_root:
+            relative_path = os.path.relpath(source_file_full_path, project_root).replace('\\', '/')
+        else:
+            relative_path = os.path.basename(source_file_full_path)
+
+        contract_data = {"name": contract.name, "functions": [], "source_file_relative": relative_path,
+                         "is_abstract": bool(getattr(contract, 'is_abstract', False)),
+                         "solc_version": _compiler_version(contract)}
+
+        constructor = next((f for f in contract.functions_and_modifiers if f.is_constructor), None)
+        if constructor:
+            contract_data["functions"].append({
+                "name": "constructor", "signature": constructor.signature_str, "visibility": "public",
+                "parameters": [{"name": p.name or f'param{i}', "type": str(p.type)} for i, p in enumerate(constructor.parameters)]
+            })
+
+        for func in contract.functions_and_modifiers:
+            if func.is_constructor or func.visibility not in ['public', 'external']: continue
+            contract_data["functions"].append({
+                "name": func.name, "signature": func.signature_str, "visibility": str(func.visibility),
+                "parameters": [{"name": p.name or f'param{i}', "type": str(p.type)} for i, p in enumerate(func.parameters)]
+            })
+
+        contract_map[contract.name] = contract_data
+    return contract_map
+
+
+def parse_slither_findings(data, contract_map):
+    """Flattens Slither's JSON result into one finding per element, attributed to a contract and function."""
+    findings = []
+    if "results" not in data or "detectors" not in data["results"]:
+        return findings
+
+    for result in data["results"]["detectors"]:
+        impact = result.get('impact', 'Informational')
+        for element in result.get('elements', []):
+            finding = {
+                'check': result['check'],
+                'description': result['description'],
+                'impact': impact
+            }
+            if element.get('type') == 'function':
+                finding['function_name'] = element.get('name', '')
+                finding['contract'] = element.get('contract', {}).get('name', 'Unknown')
+            elif element.get('type') == 'contract':
+                finding['function_name'] = '(contract-level)'
+                finding['contract'] = element.get('name', 'Unknown')
+            else:
+                source_file = element.get('source_mapping', {}).get('filename_relative', '')
+                contract_name = 'Unknown'
+                for c_name, c_data in contract_map.items():
+                    if c_data.get('source_file_relative') == source_file:
+                        contract_name = c_name
+                        break
+                finding['function_name'] = '(file-level)'
+                finding['contract'] = contract_name
+
+            findings.append(finding)
+    return findings
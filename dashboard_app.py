@@ -15,11 +15,111 @@ import hashlib
 import threading
 import time
 import random
+import queue
+from contextlib import contextmanager
 
 # --- FLASK APP & DATABASE SETUP ---
 app = Flask(__name__)
 DB_FILE = "dashboard.db"
 
+# Applied to every connection. WAL (set once in init_db) lets Flask read while the
+# enrichment thread writes; NORMAL sync is durable across app crashes in WAL mode.
+DB_PRAGMAS = [
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -32000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 5000",
+]
+
+# Idle connections kept for reuse, and prepared statements cached per connection.
+DB_POOL_SIZE = 8
+DB_STATEMENT_CACHE = 256
+
+# Findings are listed most severe first; the rank is stored so SQLite can sort by index.
+SEVERITY_RANKS = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3, 'INFO': 4}
+UNKNOWN_SEVERITY_RANK = 99
+SEVERITY_RANK_SQL = "CASE level " + " ".join(f"WHEN '{level}' THEN {rank}" for level, rank in SEVERITY_RANKS.items()) + f" ELSE {UNKNOWN_SEVERITY_RANK} END"
+
+# /api/findings returns pages of the list columns; the Gemini text is fetched per finding.
+FINDINGS_PAGE_SIZE = 100
+FINDINGS_MAX_PAGE_SIZE = 500
+FINDING_LIST_COLUMNS = "id, scanner, title, level, severity_rank, description, location, enrichment_status, enrichment_error"
+
+# Full-text search over findings. Matches in the title count most, then the description,
+# the location and the Gemini analysis (weights in that column order, for bm25()).
+# project_id is indexed as well, with weight 0, so a search is scoped to a project inside
+# the index instead of by looking up every match in the findings table.
+SEARCH_FTS_COLUMNS = "title, description, location, gemini_info"
+SEARCH_COLUMN_WEIGHTS = "10.0, 4.0, 2.0, 1.0, 0.0"
+SEARCH_TEXT_FILTER = "{" + SEARCH_FTS_COLUMNS.replace(",", "") + "}"
+# Words are matched against porter stems (withdrawals finds withdraw). Prefix terms are not
+# stemmed by FTS5, so centraliz* would miss the stem "central"; queries with a prefix term
+# use a second index of the unstemmed words instead.
+SEARCH_STEMMED_TABLE = "findings_fts"
+SEARCH_PREFIX_TABLE = "findings_prefix_fts"
+SEARCH_PAGE_SIZE = 50
+SEARCH_MAX_PAGE_SIZE = 200
+# bm25 scores every match before it can sort, and a common word can match hundreds of
+# thousands of findings. Results are ranked among this many of the newest matches only.
+SEARCH_RANK_WINDOW = 10000
+SEARCH_WORD_RE = re.compile(r"\w+")
+# Marks matched words in snippets; the browser escapes the text and then turns these into <mark> tags.
+SNIPPET_START, SNIPPET_END = "\x01", "\x02"
+
+# Uploaded findings are collected in batches of this size and written with multi-row INSERTs.
+# FTS5 flushes its pending index data at the end of every statement, so inserting row by
+# row (executemany) would write and later merge a tiny index segment per finding. Each
+# statement stays within the 999 bound parameters allowed by SQLite builds before 3.32.
+UPLOAD_BATCH_SIZE = 1000
+SQLITE_MAX_VARIABLES = 999
+INSERT_FINDING_SQL = "INSERT INTO findings (project_id, scanner, title, level, severity_rank, description, location) VALUES "
+INSERT_FINDING_ROW = "(?, ?, ?, ?, ?, ?, ?)"
+INSERT_FINDING_ROWS_PER_STATEMENT = SQLITE_MAX_VARIABLES // INSERT_FINDING_ROW.count("?")
+
+def fts_index_statements(table, tokenizer):
+    """Creates an FTS5 index over the finding text, kept in sync with findings by triggers, and fills it."""
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5({SEARCH_FTS_COLUMNS}, project_id, content='findings', content_rowid='id', tokenize='{tokenizer}')",
+        f"""CREATE TRIGGER IF NOT EXISTS {table}_insert AFTER INSERT ON findings BEGIN
+            INSERT INTO {table} (rowid, {SEARCH_FTS_COLUMNS}, project_id) VALUES (new.id, new.title, new.description, new.location, new.gemini_info, new.project_id);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {table}_delete AFTER DELETE ON findings BEGIN
+            INSERT INTO {table} ({table}, rowid, {SEARCH_FTS_COLUMNS}, project_id) VALUES ('delete', old.id, old.title, old.description, old.location, old.gemini_info, old.project_id);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {table}_update AFTER UPDATE OF {SEARCH_FTS_COLUMNS}, project_id ON findings BEGIN
+            INSERT INTO {table} ({table}, rowid, {SEARCH_FTS_COLUMNS}, project_id) VALUES ('delete', old.id, old.title, old.description, old.location, old.gemini_info, old.project_id);
+            INSERT INTO {table} (rowid, {SEARCH_FTS_COLUMNS}, project_id) VALUES (new.id, new.title, new.description, new.location, new.gemini_info, new.project_id);
+        END""",
+        f"INSERT INTO {table} ({table}) VALUES ('rebuild')",
+        f"INSERT INTO {table} ({table}, rank) VALUES ('rank', 'bm25({SEARCH_COLUMN_WEIGHTS})')",
+    ]
+
+# Schema changes after the base tables, applied in order. PRAGMA user_version holds
+# how many have been applied, so each one runs exactly once per database.
+SCHEMA_MIGRATIONS = [
+    # 1: Indexes for the per-project findings queries (filters, enrichment queue).
+    [
+        "CREATE INDEX IF NOT EXISTS idx_findings_project_level ON findings (project_id, level)",
+        "CREATE INDEX IF NOT EXISTS idx_findings_project_scanner_level ON findings (project_id, scanner, level)",
+        "CREATE INDEX IF NOT EXISTS idx_findings_project_status ON findings (project_id, enrichment_status)",
+        "ANALYZE",
+    ],
+    # 2: Stored severity rank; the findings list is paged in (severity_rank, id) order off these indexes.
+    [
+        f"ALTER TABLE findings ADD COLUMN severity_rank INTEGER NOT NULL DEFAULT {UNKNOWN_SEVERITY_RANK}",
+        f"UPDATE findings SET severity_rank = {SEVERITY_RANK_SQL}",
+        "CREATE INDEX IF NOT EXISTS idx_findings_project_rank ON findings (project_id, severity_rank)",
+        "CREATE INDEX IF NOT EXISTS idx_findings_project_scanner_rank ON findings (project_id, scanner, severity_rank)",
+        "DROP INDEX IF EXISTS idx_findings_project_scanner_level",
+        "ANALYZE",
+    ],
+    # 3: FTS5 index over the stemmed finding text, stored as an external-content table.
+    fts_index_statements(SEARCH_STEMMED_TABLE, 'porter unicode61'),
+    # 4: The same index over the unstemmed words, for prefix searches.
+    fts_index_statements(SEARCH_PREFIX_TABLE, 'unicode61'),
+]
+
 # --- State Management for Background Task ---
 enrichment_lock = threading.Lock()
 # <<< CHANGED: Added 'wait_time' for UI feedback and a thread-safe stop event.
@@ -28,14 +128,69 @@ enrichment_stop_event = threading.Event()
 
 
 def get_db_conn():
-    """Gets a database connection."""
-    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    """Opens a new database connection. Routes and workers borrow pooled ones through db_connection()."""
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE)
     conn.row_factory = sqlite3.Row
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
+class ConnectionPool:
+    """
+    Reuses open connections, with their pragmas and statement caches, across requests and
+    enrichment updates. Borrowing never blocks: a new connection is opened when none is idle,
+    and connections beyond `size` are closed when returned.
+    """
+
+    def __init__(self, size=DB_POOL_SIZE):
+        self.size = size
+        # LIFO, so the most recently used connection (warm page cache) is handed out first.
+        self.idle = queue.LifoQueue()
+
+    def acquire(self):
+        while True:
+            try:
+                db_file, conn = self.idle.get_nowait()
+            except queue.Empty:
+                return DB_FILE, get_db_conn()
+            if db_file == DB_FILE:
+                return db_file, conn
+            conn.close()
+
+    def release(self, db_file, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        if self.idle.qsize() >= self.size or db_file != DB_FILE:
+            conn.close()
+        else:
+            self.idle.put((db_file, conn))
+
+    def close_all(self):
+        while True:
+            try:
+                self.idle.get_nowait()[1].close()
+            except queue.Empty:
+                return
+
+db_pool = ConnectionPool()
+
+@contextmanager
+def db_connection():
+    """Borrows a pooled connection; anything not committed is rolled back when it is returned."""
+    db_file, conn = db_pool.acquire()
+    try:
+        yield conn
+    finally:
+        db_pool.release(db_file, conn)
+
 def init_db():
-    """Initializes the database and creates tables if they don't exist."""
+    """Initializes the database, creates tables if they don't exist and applies pending migrations."""
     conn = get_db_conn()
+    create_tables(conn)
+    migrate_db(conn)
+    conn.close()
+
+def create_tables(conn):
     cursor = conn.cursor()
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS projects (
@@ -66,7 +221,30 @@ def init_db():
     except sqlite3.OperationalError:
         pass
     conn.commit()
-    conn.close()
+
+def migrate_db(conn):
+    """Enables WAL and applies the SCHEMA_MIGRATIONS newer than the database. Returns the versions applied."""
+    # The journal mode is stored in the database file, so this only has to succeed once.
+    conn.execute("PRAGMA journal_mode = WAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    applied = []
+    for version, statements in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+        conn.execute("BEGIN")
+        try:
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
+
+def insert_findings(cursor, rows):
+    for start in range(0, len(rows), INSERT_FINDING_ROWS_PER_STATEMENT):
+        chunk = rows[start:start + INSERT_FINDING_ROWS_PER_STATEMENT]
+        cursor.execute(INSERT_FINDING_SQL + ", ".join([INSERT_FINDING_ROW] * len(chunk)), [value for row in chunk for value in row])
 
 # --- HTML & JAVASCRIPT TEMPLATE ---
 # <<< CHANGED: Added a Stop button and logic to display the wait countdown.
@@ -86,6 +264,7 @@ HTML_TEMPLATE = """
         #drop-zone { border: 2px dashed #4A5568; transition: all 0.3s; }
         #drop-zone.drag-over { border-color: #3B82F6; background-color: #252c3b; }
         .filter-select, .input-field { background-color: #374151; border-color: #4B5563; color: #D1D5DB; }
+        .snippet mark { background-color: #CA8A04; color: #111827; border-radius: 2px; padding: 0 1px; }
         .loader { border: 2px solid #4A5568; border-top: 2px solid #3B82F6; border-radius: 50%; width: 16px; height: 16px; animation: spin 1s linear infinite; }
         @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
     </style>
@@ -132,7 +311,12 @@ HTML_TEMPLATE = """
                     <option value="all">All</option><option value="CRITICAL">Critical</option><option value="HIGH">High</option><option value="MEDIUM">Medium</option><option value="LOW">Low</option><option value="INFO">Info</option>
                 </select>
             </div>
+            <div class="flex items-center gap-2">
+                <label for="search-input" class="font-medium text-gray-300">Search:</label>
+                <input id="search-input" type="search" placeholder="e.g. reentrancy withdraw" class="input-field rounded-md px-3 py-1.5 w-64">
+            </div>
         </div>
+        <div id="search-status" class="text-center text-sm text-gray-400 mb-4 h-5"></div>
         
         <div id="enrichment-controls" class="hidden text-center mb-8 p-4 bg-gray-800 rounded-lg">
             <button id="enrich-btn" class="bg-green-600 hover:bg-green-700 text-white font-semibold px-4 py-2 rounded-md">Start Enrichment</button>
@@ -144,6 +328,9 @@ HTML_TEMPLATE = """
         </div>
 
         <div id="report-cards" class="grid grid-cols-1 md:grid-cols-2 xl:grid-cols-3 gap-6"></div>
+        <div class="text-center mt-8">
+            <button id="load-more-btn" class="hidden bg-gray-700 hover:bg-gray-600 text-white font-semibold px-4 py-2 rounded-md">Load More Findings</button>
+        </div>
     </div>
 
     <script>
@@ -162,8 +349,18 @@ HTML_TEMPLATE = """
         const enrichmentStatus = document.getElementById('enrichment-status');
         const progressBarContainer = document.getElementById('progress-bar-container');
         const progressBar = document.getElementById('progress-bar');
+        const loadMoreBtn = document.getElementById('load-more-btn');
+        const searchInput = document.getElementById('search-input');
+        const searchStatus = document.getElementById('search-status');
         
         let statusInterval = null;
+        // Keyset cursor for the next page of findings, and a counter that discards responses to superseded requests.
+        let nextCursor = null;
+        let findingsRequest = 0;
+        // Offset of the next page of search results, and the timer that waits for typing to pause.
+        let nextSearchOffset = null;
+        let searchTimer = null;
+        const SEARCH_DEBOUNCE_MS = 250;
 
         document.addEventListener('DOMContentLoaded', () => {
             loadProjects();
@@ -178,13 +375,18 @@ HTML_TEMPLATE = """
             if (e.dataTransfer.files.length > 0) handleFileUpload(e.dataTransfer.files[0]);
         });
         fileInput.addEventListener('change', () => { if (fileInput.files.length > 0) handleFileUpload(fileInput.files[0]); });
-        projectFilter.addEventListener('change', () => loadFindingsForProject(projectFilter.value));
+        projectFilter.addEventListener('change', () => searchInput.value.trim() ? searchFindings() : loadFindingsForProject(projectFilter.value));
         scannerFilter.addEventListener('change', () => loadFindingsForProject(projectFilter.value));
         ratingFilter.addEventListener('change', () => loadFindingsForProject(projectFilter.value));
         apiKeyInput.addEventListener('change', () => localStorage.setItem('geminiApiKey', apiKeyInput.value));
         testApiKeyBtn.addEventListener('click', testApiKey);
         enrichBtn.addEventListener('click', startEnrichment);
         stopBtn.addEventListener('click', stopEnrichment);
+        loadMoreBtn.addEventListener('click', () => searchInput.value.trim() ? loadMoreSearchResults() : loadMoreFindings());
+        searchInput.addEventListener('input', () => {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => searchInput.value.trim() ? searchFindings() : loadFindingsForProject(projectFilter.value), SEARCH_DEBOUNCE_MS);
+        });
 
         function testApiKey() {
             const apiKey = apiKeyInput.value.trim();
@@ -311,6 +513,15 @@ HTML_TEMPLATE = """
         }
 
         function loadFindingsForProject(projectId, force_refresh = false) {
+            if (searchInput.value.trim()) {
+                // A search is shown instead of the project list; refresh it rather than replacing it.
+                if (force_refresh) searchFindings(true);
+                return;
+            }
+            const requestId = ++findingsRequest;
+            nextCursor = null;
+            searchStatus.textContent = '';
+            loadMoreBtn.classList.add('hidden');
             if (!projectId) {
                 cardsContainer.innerHTML = '';
                 uploadStatus.textContent = '';
@@ -321,13 +532,11 @@ HTML_TEMPLATE = """
                  cardsContainer.innerHTML = '<div class="col-span-full flex justify-center"><div class="loader"></div></div>';
             }
             
-            const scanner = scannerFilter.value;
-            const rating = ratingFilter.value;
-            
-            fetch(`/api/findings/${projectId}?scanner=${scanner}&rating=${rating}`).then(res => res.json()).then(cards => {
-                renderCards(cards);
-                const hasPending = cards.some(c => c.enrichment_status === 'PENDING' || c.enrichment_status === 'FAILED');
-                if (hasPending) {
+            fetch(findingsUrl(projectId)).then(res => res.json()).then(page => {
+                if (requestId !== findingsRequest) return;
+                renderCards(page.findings);
+                updateLoadMore(page);
+                if (page.has_pending) {
                     enrichmentControls.classList.remove('hidden');
                 } else {
                     enrichmentControls.classList.add('hidden');
@@ -335,9 +544,114 @@ HTML_TEMPLATE = """
             });
         }
 
-        function renderCards(cards) {
-            cardsContainer.innerHTML = '';
-            if (!cards || cards.length === 0) {
+        function findingsUrl(projectId, cursor) {
+            const params = new URLSearchParams({ scanner: scannerFilter.value, rating: ratingFilter.value });
+            if (cursor) params.set('cursor', cursor);
+            return `/api/findings/${projectId}?${params}`;
+        }
+
+        function loadMoreFindings() {
+            const projectId = projectFilter.value;
+            if (!projectId || !nextCursor) return;
+            const requestId = findingsRequest;
+            loadMoreBtn.disabled = true;
+            loadMoreBtn.textContent = 'Loading...';
+            fetch(findingsUrl(projectId, nextCursor)).then(res => res.json()).then(page => {
+                if (requestId !== findingsRequest) return;
+                renderCards(page.findings, true);
+                updateLoadMore(page);
+            });
+        }
+
+        function updateLoadMore(page) {
+            nextCursor = page.next_cursor;
+            loadMoreBtn.disabled = false;
+            loadMoreBtn.textContent = 'Load More Findings';
+            loadMoreBtn.classList.toggle('hidden', !nextCursor);
+        }
+
+        function searchUrl(offset) {
+            const params = new URLSearchParams({ q: searchInput.value.trim() });
+            if (projectFilter.value) params.set('project_id', projectFilter.value);
+            if (offset) params.set('offset', offset);
+            return `/api/search?${params}`;
+        }
+
+        function searchFindings(force_refresh = false) {
+            const requestId = ++findingsRequest;
+            nextSearchOffset = null;
+            loadMoreBtn.classList.add('hidden');
+            enrichmentControls.classList.add('hidden');
+            if (!force_refresh) {
+                cardsContainer.innerHTML = '<div class="col-span-full flex justify-center"><div class="loader"></div></div>';
+            }
+            fetch(searchUrl()).then(res => res.json()).then(page => {
+                if (requestId !== findingsRequest) return;
+                if (page.error) {
+                    searchStatus.textContent = page.error;
+                    cardsContainer.innerHTML = '';
+                    return;
+                }
+                const scope = projectFilter.value ? 'in this project' : 'across all projects';
+                searchStatus.textContent = page.more_matches
+                    ? `Best matches among the ${page.matches} most recent ${scope}; add words to narrow the search.`
+                    : `${page.matches} matching finding${page.matches === 1 ? '' : 's'} ${scope}.`;
+                renderSearchResults(page.results);
+                updateSearchLoadMore(page);
+            });
+        }
+
+        function loadMoreSearchResults() {
+            if (nextSearchOffset === null) return;
+            const requestId = findingsRequest;
+            loadMoreBtn.disabled = true;
+            loadMoreBtn.textContent = 'Loading...';
+            fetch(searchUrl(nextSearchOffset)).then(res => res.json()).then(page => {
+                if (requestId !== findingsRequest) return;
+                renderSearchResults(page.results || [], true);
+                updateSearchLoadMore(page);
+            });
+        }
+
+        function updateSearchLoadMore(page) {
+            nextSearchOffset = page.next_offset;
+            loadMoreBtn.disabled = false;
+            loadMoreBtn.textContent = 'Load More Results';
+            loadMoreBtn.classList.toggle('hidden', nextSearchOffset === null || nextSearchOffset === undefined);
+        }
+
+        function escapeHtml(text) {
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }
+
+        function highlightSnippet(snippet) {
+            // The server marks matched words with \\x01 and \\x02 around otherwise unescaped text.
+            return escapeHtml(snippet || '').replace(/\\x01/g, '<mark>').replace(/\\x02/g, '</mark>');
+        }
+
+        function renderSearchResults(results, append = false) {
+            if (!append) cardsContainer.innerHTML = '';
+            if (!append && results.length === 0) {
+                cardsContainer.innerHTML = '<p class="text-center text-gray-500 col-span-full">No findings match this search.</p>';
+                return;
+            }
+            results.forEach(result => {
+                const cardElement = document.createElement('div');
+                cardElement.className = 'card bg-gray-800 rounded-xl border border-gray-700 p-6 flex flex-col';
+                renderSingleCard(cardElement, result);
+                const match = document.createElement('div');
+                match.className = 'mb-3 text-sm';
+                match.innerHTML = `<span class="text-xs font-mono bg-gray-700 px-2 py-1 rounded">${escapeHtml(result.project_name)}</span><p class="snippet text-gray-300 mt-2">${highlightSnippet(result.snippet)}</p>`;
+                cardElement.prepend(match);
+                cardsContainer.appendChild(cardElement);
+            });
+        }
+
+        function renderCards(cards, append = false) {
+            if (!append) cardsContainer.innerHTML = '';
+            if (!append && (!cards || cards.length === 0)) {
                 cardsContainer.innerHTML = '<p class="text-center text-gray-500 col-span-full">No findings match current filters.</p>';
                 return;
             }
@@ -354,7 +668,10 @@ HTML_TEMPLATE = """
             const threatClass = threatColorClasses[card.level] || 'bg-gray-700 text-gray-200';
             
             let geminiSection = '';
-            if (card.enrichment_status === 'COMPLETED') {
+            if (card.enrichment_status === 'COMPLETED' && card.gemini_info === undefined) {
+                // The list leaves out the Gemini text; it is loaded from the detail endpoint when asked for.
+                geminiSection = '<button class="show-analysis mt-4 bg-indigo-600 hover:bg-indigo-700 text-white text-sm font-semibold px-3 py-1.5 rounded-md">Show Gemini Analysis</button>';
+            } else if (card.enrichment_status === 'COMPLETED') {
                 geminiSection = `
                         <div><h3 class="font-semibold text-gray-300 border-b border-gray-700 pb-1 mb-2 mt-4">Gemini Analysis</h3><p class="whitespace-pre-wrap text-sm">${card.gemini_info || 'N/A'}</p></div>
                         <div><h3 class="font-semibold text-gray-300 border-b border-gray-700 pb-1 mb-2 mt-4">Forge Test Example</h3><pre class="bg-gray-900 p-3 rounded-md overflow-x-auto text-xs"><code>${card.gemini_test || 'N/A'}</code></pre></div>`;
@@ -374,6 +691,21 @@ HTML_TEMPLATE = """
                     <div><h3 class="font-semibold text-gray-300 border-b border-gray-700 pb-1 mb-2">Location</h3><p class="font-mono break-words">${card.location}</p></div>
                     <div class="gemini-section">${geminiSection}</div>
                 </div>`;
+
+            const showAnalysisBtn = cardElement.querySelector('.show-analysis');
+            if (showAnalysisBtn) {
+                showAnalysisBtn.addEventListener('click', () => {
+                    showAnalysisBtn.disabled = true;
+                    showAnalysisBtn.textContent = 'Loading...';
+                    fetch(`/api/finding/${card.id}`).then(res => res.json()).then(detail => {
+                        if (detail.error) {
+                            showAnalysisBtn.textContent = detail.error;
+                            return;
+                        }
+                        renderSingleCard(cardElement, detail);
+                    });
+                });
+            }
         }
     </script>
 </body>
@@ -395,7 +727,8 @@ def parse_slither_report(content):
         lines = [line.strip() for line in block.strip().split('\n') if line.strip()]
         if not lines: continue
         location_line = lines[0]
-        description, location = (re.match(r"(.+?)\s*\((.*?)\)", location_line).groups() if re.match(r"(.+?)\s*\((.*?)\)", location_line) else (location_line, "N/A"))
+        location_match = re.match(r"(.+?)\s*\((.*?)\)", location_line)
+        description, location = location_match.groups() if location_match else (location_line, "N/A")
         ref_match = re.search(r"Reference: https://.+?#(.+)", block)
         detector_name = ref_match.group(1) if ref_match else "Unknown Issue"
         cards.append({'scanner': 'Slither', 'title': detector_name.replace('-', ' ').title(), 'level': get_severity_from_slither(detector_name), 'description': description.strip(), 'location': location.strip()})
@@ -426,15 +759,121 @@ def parse_wake_report(content):
         cards.append({'scanner': 'Wake', 'title': issue_type.replace('-', ' ').title(), 'level': level, 'description': description, 'location': location.strip()})
     return cards
 
+# A scanner's section runs from its "## <Scanner> Analysis" heading to the next such heading.
+REPORT_SECTION_RE = re.compile(r"##\s*(\w+)\s*Analysis")
+REPORT_SECTION_PARSERS = {'Slither': parse_slither_report, 'Aderyn': parse_aderyn_report, 'Wake': parse_wake_report}
+ADERYN_ISSUE_RE = re.compile(r"##\s*(H|L)-\d+:")
+# A block that never closes (e.g. a truncated Wake box) is parsed once it grows this large.
+MAX_REPORT_BLOCK_CHARS = 4 * 1024 * 1024
+
+def _starts_report_block(section, line):
+    if section == 'Slither': return 'INFO:Detectors:' in line
+    if section == 'Aderyn': return ADERYN_ISSUE_RE.search(line) is not None
+    return '╭─' in line
+
+def iter_report_cards(lines):
+    """
+    Parses a report from an iterable of lines one finding block at a time, so memory depends on
+    the largest block rather than on the report. Each block goes through its scanner's parser.
+    Only the first section of each scanner is used.
+    """
+    section, seen_sections = None, set()
+    block, block_chars = [], 0
+    for line in lines:
+        heading = REPORT_SECTION_RE.search(line) if 'Analysis' in line else None
+        if heading:
+            if block: yield from REPORT_SECTION_PARSERS[section]("".join(block))
+            block, block_chars = [], 0
+            name = heading.group(1)
+            section = name if name in REPORT_SECTION_PARSERS and name not in seen_sections else None
+            seen_sections.add(name)
+            line = line[heading.end():]
+        if section is None or not line: continue
+        if block and (_starts_report_block(section, line) or block_chars > MAX_REPORT_BLOCK_CHARS):
+            yield from REPORT_SECTION_PARSERS[section]("".join(block))
+            block, block_chars = [], 0
+        block.append(line)
+        block_chars += len(line)
+        if section == 'Wake' and '╰─' in line:
+            yield from parse_wake_report("".join(block))
+            block, block_chars = [], 0
+    if block: yield from REPORT_SECTION_PARSERS[section]("".join(block))
+
 def parse_markdown_report(md_content):
-    all_cards = []
-    slither_content = re.search(r"## Slither Analysis(.*?)(?=##\s*\w+\s*Analysis|\Z)", md_content, re.DOTALL)
-    aderyn_content = re.search(r"## Aderyn Analysis(.*?)(?=##\s*\w+\s*Analysis|\Z)", md_content, re.DOTALL)
-    wake_content = re.search(r"## Wake Analysis(.*?)(?=##\s*\w+\s*Analysis|\Z)", md_content, re.DOTALL)
-    if slither_content: all_cards.extend(parse_slither_report(slither_content.group(1)))
-    if aderyn_content: all_cards.extend(parse_aderyn_report(aderyn_content.group(1)))
-    if wake_content: all_cards.extend(parse_wake_report(wake_content.group(1)))
-    return all_cards
+    return list(iter_report_cards(md_content.splitlines(True)))
+
+# --- FULL-TEXT SEARCH ---
+def build_search_query(text):
+    """
+    Turns what the user typed into (fts_table, FTS5 query), or (None, '') if it has no words.
+    Every whitespace-separated term must match; a term with punctuation (Vault.sol#42) matches
+    as a phrase, and a trailing * makes it a prefix. Quoting every term keeps FTS5 operators
+    and syntax errors out of user input, and the column filter keeps numbers from matching
+    the indexed project_id.
+    """
+    terms = []
+    has_prefix = False
+    for chunk in text.split():
+        words = SEARCH_WORD_RE.findall(chunk)
+        if words:
+            is_prefix = chunk.endswith('*')
+            has_prefix = has_prefix or is_prefix
+            terms.append('"' + ' '.join(words) + '"' + (' *' if is_prefix else ''))
+    if not terms: return None, ''
+    return (SEARCH_PREFIX_TABLE if has_prefix else SEARCH_STEMMED_TABLE), f"{SEARCH_TEXT_FILTER} : ({' '.join(terms)})"
+
+def search_findings(conn, text, project_id=None, limit=SEARCH_PAGE_SIZE, offset=0):
+    """
+    Findings matching `text`, best match first, with their project name and a snippet of the
+    best-matching column. Returns (results, matches); `matches` stops at SEARCH_RANK_WINDOW.
+    """
+    table, fts_query = build_search_query(text)
+    if not fts_query: return [], 0
+    scoped_query = fts_query if project_id is None else f'{fts_query} AND project_id : "{int(project_id)}"'
+    ranked = conn.execute(
+        "SELECT id, COUNT(*) OVER () AS matches FROM ("
+        f"SELECT rowid AS id, rank FROM {table} WHERE {table} MATCH ? ORDER BY rowid DESC LIMIT ?"
+        ") ORDER BY rank LIMIT ? OFFSET ?", (scoped_query, SEARCH_RANK_WINDOW, limit, offset)).fetchall()
+    if not ranked: return [], 0
+    # snippet() only works in the query that runs the MATCH. FTS5 seeks each rowid of an IN list
+    # separately, which is slow for prefix terms, so it scans the page's rowid range and SQLite
+    # filters it with the list (the + keeps the IN from being handed to FTS5).
+    ids = [row['id'] for row in ranked]
+    columns = ", ".join(f"findings.{column.strip()}" for column in FINDING_LIST_COLUMNS.split(','))
+    rows = conn.execute(
+        f"SELECT {columns}, findings.project_id, projects.name AS project_name, "
+        f"snippet({table}, -1, '{SNIPPET_START}', '{SNIPPET_END}', '…', 16) AS snippet "
+        f"FROM {table} JOIN findings ON findings.id = {table}.rowid JOIN projects ON projects.id = findings.project_id "
+        f"WHERE {table} MATCH ? AND {table}.rowid BETWEEN ? AND ? AND +{table}.rowid IN ({', '.join('?' * len(ids))})",
+        [fts_query, min(ids), max(ids)] + ids)
+    by_id = {row['id']: dict(row) for row in rows}
+    return [by_id[finding_id] for finding_id in ids if finding_id in by_id], ranked[0]['matches']
+
+# --- FINDINGS LIST ---
+def findings_page_query(project_id, scanner='all', rating='all', after=None, limit=FINDINGS_PAGE_SIZE):
+    """
+    SQL and parameters for one /api/findings page in (severity_rank, id) order, starting after
+    the (rank, id) pair `after`. Selects limit + 1 rows, so the caller can tell if there is a next page.
+    """
+    query = f"SELECT {FINDING_LIST_COLUMNS} FROM findings WHERE project_id = ?"
+    params = [project_id]
+    if scanner != 'all':
+        query += " AND scanner = ?"
+        params.append(scanner)
+    if rating != 'all':
+        query += " AND severity_rank = ? AND level = ?"
+        params += [SEVERITY_RANKS.get(rating, UNKNOWN_SEVERITY_RANK), rating]
+    if after:
+        # With the rank fixed by the filter, comparing ids alone keeps the scan on the index.
+        if rating != 'all':
+            query += " AND id > ?"
+            params.append(after[1])
+        else:
+            query += " AND (severity_rank, id) > (?, ?)"
+            params += list(after)
+    query += " ORDER BY severity_rank, id LIMIT ?"
+    params.append(limit + 1)
+    return query, params
 
 # --- GEMINI API HELPER ---
 def enrich_finding_with_gemini(finding, api_key):
@@ -488,14 +927,13 @@ def enrich_findings_in_background(project_id, api_key):
         enrichment_stop_event.clear()
         enrichment_status_global = {"is_running": True, "progress": 0, "total": 0, "message": "Preparing...", "wait_time": 0}
 
-    conn = get_db_conn()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE findings SET enrichment_status = 'SKIPPED', enrichment_error = 'Informational finding, skipped.' WHERE project_id = ? AND level = 'INFO' AND (enrichment_status = 'PENDING' OR enrichment_status = 'FAILED')", (project_id,))
-    cursor.execute("UPDATE findings SET enrichment_status = 'PENDING' WHERE project_id = ? AND enrichment_status = 'FAILED'", (project_id,))
-    conn.commit()
-    cursor.execute("SELECT * FROM findings WHERE project_id = ? AND enrichment_status = 'PENDING'", (project_id,))
-    findings_to_enrich = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE findings SET enrichment_status = 'SKIPPED', enrichment_error = 'Informational finding, skipped.' WHERE project_id = ? AND level = 'INFO' AND (enrichment_status = 'PENDING' OR enrichment_status = 'FAILED')", (project_id,))
+        cursor.execute("UPDATE findings SET enrichment_status = 'PENDING' WHERE project_id = ? AND enrichment_status = 'FAILED'", (project_id,))
+        conn.commit()
+        cursor.execute("SELECT * FROM findings WHERE project_id = ? AND enrichment_status = 'PENDING'", (project_id,))
+        findings_to_enrich = [dict(row) for row in cursor.fetchall()]
 
     if not findings_to_enrich:
         with enrichment_lock:
@@ -515,10 +953,9 @@ def enrich_findings_in_background(project_id, api_key):
         
         gemini_info, gemini_test, status, error = call_gemini_with_backoff(finding, api_key)
         
-        conn = get_db_conn()
-        conn.cursor().execute("UPDATE findings SET gemini_info = ?, gemini_test = ?, enrichment_status = ?, enrichment_error = ? WHERE id = ?", (gemini_info, gemini_test, status, error, finding['id']))
-        conn.commit()
-        conn.close()
+        with db_connection() as conn:
+            conn.execute("UPDATE findings SET gemini_info = ?, gemini_test = ?, enrichment_status = ?, enrichment_error = ? WHERE id = ?", (gemini_info, gemini_test, status, error, finding['id']))
+            conn.commit()
         
         if status == "COMPLETED":
             time.sleep(2) # Proactive 2-second delay to stay under limits
@@ -546,28 +983,64 @@ def test_gemini():
 
 @app.route('/api/projects', methods=['GET'])
 def get_projects():
-    conn = get_db_conn()
-    projects = [dict(row) for row in conn.cursor().execute("SELECT id, name FROM projects ORDER BY name")]
-    conn.close()
+    with db_connection() as conn:
+        projects = [dict(row) for row in conn.execute("SELECT id, name FROM projects ORDER BY name")]
     return jsonify(projects)
 
 @app.route('/api/findings/<int:project_id>', methods=['GET'])
 def get_findings(project_id):
+    """
+    One page of a project's findings, most severe first, without the Gemini text. Pass the
+    returned `next_cursor` as `cursor` for the next page; it is null on the last page.
+    """
     scanner = request.args.get('scanner', 'all')
     rating = request.args.get('rating', 'all')
-    conn = get_db_conn()
-    query = "SELECT * FROM findings WHERE project_id = ?"
-    params = [project_id]
-    if scanner != 'all':
-        query += " AND scanner = ?"
-        params.append(scanner)
-    if rating != 'all':
-        query += " AND level = ?"
-        params.append(rating)
-    findings = [dict(row) for row in conn.cursor().execute(query, params)]
-    conn.close()
-    findings.sort(key=lambda x: {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3, 'INFO': 4}.get(x['level'], 99))
-    return jsonify(findings)
+    cursor = request.args.get('cursor')
+    try:
+        limit = min(max(int(request.args.get('limit', FINDINGS_PAGE_SIZE)), 1), FINDINGS_MAX_PAGE_SIZE)
+        after_rank, after_id = (int(part) for part in cursor.split('.')) if cursor else (None, None)
+    except ValueError:
+        return jsonify({'error': 'Invalid limit or cursor.'}), 400
+
+    query, params = findings_page_query(project_id, scanner, rating, (after_rank, after_id) if cursor else None, limit)
+    with db_connection() as conn:
+        findings = [dict(row) for row in conn.execute(query, params)]
+        has_pending = None
+        if not cursor:
+            has_pending = bool(conn.execute("SELECT EXISTS (SELECT 1 FROM findings WHERE project_id = ? AND enrichment_status IN ('PENDING', 'FAILED'))", (project_id,)).fetchone()[0])
+    next_cursor = None
+    if len(findings) > limit:
+        findings = findings[:limit]
+        next_cursor = f"{findings[-1]['severity_rank']}.{findings[-1]['id']}"
+    return jsonify({'findings': findings, 'next_cursor': next_cursor, 'has_pending': has_pending})
+
+@app.route('/api/finding/<int:finding_id>', methods=['GET'])
+def get_finding_detail(finding_id):
+    """Every column of one finding, including the Gemini analysis and test."""
+    with db_connection() as conn:
+        row = conn.execute("SELECT * FROM findings WHERE id = ?", (finding_id,)).fetchone()
+    if row is None:
+        return jsonify({'error': 'Finding not found.'}), 404
+    return jsonify(dict(row))
+
+@app.route('/api/search', methods=['GET'])
+def search_route():
+    """
+    Ranked full-text search over all projects, or one with `project_id`. Page with `offset`;
+    `next_offset` is null on the last page. `matches` is capped at SEARCH_RANK_WINDOW.
+    """
+    text = request.args.get('q', '')
+    if not build_search_query(text)[1]: return jsonify({'error': 'A search query is required.'}), 400
+    try:
+        project_id = int(request.args['project_id']) if request.args.get('project_id') else None
+        limit = min(max(int(request.args.get('limit', SEARCH_PAGE_SIZE)), 1), SEARCH_MAX_PAGE_SIZE)
+        offset = max(int(request.args.get('offset', 0)), 0)
+    except ValueError:
+        return jsonify({'error': 'Invalid project_id, limit or offset.'}), 400
+    with db_connection() as conn:
+        results, matches = search_findings(conn, text, project_id, limit, offset)
+    next_offset = offset + limit if offset + limit < matches else None
+    return jsonify({'results': results, 'matches': matches, 'more_matches': matches >= SEARCH_RANK_WINDOW, 'next_offset': next_offset})
 
 @app.route('/api/enrich/<int:project_id>', methods=['POST'])
 def start_enrichment_route(project_id):
@@ -592,34 +1065,49 @@ def get_enrichment_status():
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
+    """Parses the report while it is read and inserts its findings in batches, in one transaction."""
     project_name = request.form.get('projectName')
     file = request.files.get('file')
     if not all([project_name, file]): return jsonify({'error': 'Project name and file are required.'}), 400
-    md_content = file.read()
-    report_hash = hashlib.sha256(md_content).hexdigest()
-    conn = get_db_conn()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id FROM projects WHERE name = ? AND report_hash = ?", (project_name, report_hash))
-    if cursor.fetchone():
-        conn.close()
-        return jsonify({'error': 'This exact report has already been uploaded for this project.'}), 409
-    try:
-        cursor.execute("INSERT INTO projects (name, report_hash) VALUES (?, ?)", (project_name, report_hash))
-        project_id = cursor.lastrowid
-        cards = parse_markdown_report(md_content.decode('utf-8'))
-        if not cards:
-            conn.rollback()
-            return jsonify({'error': 'Could not find any valid findings in the report file.'}), 400
-        for card in cards:
-            cursor.execute("INSERT INTO findings (project_id, scanner, title, level, description, location) VALUES (?, ?, ?, ?, ?, ?)", (project_id, card['scanner'], card['title'], card['level'], card['description'], card['location']))
-        conn.commit()
-        return jsonify({'message': f'Successfully uploaded report for {project_name}.', 'project_id': project_id})
-    except sqlite3.IntegrityError:
-        return jsonify({'error': f'A project named "{project_name}" already exists. Please use a new name.'}), 409
-    except Exception as e:
-        return jsonify({'error': f'An internal error occurred: {e}'}), 500
-    finally:
-        conn.close()
+    report_hash = hashlib.sha256()
+    def report_lines():
+        for raw_line in file.stream:
+            report_hash.update(raw_line)
+            yield raw_line.decode('utf-8')
+    with db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT report_hash FROM projects WHERE name = ?", (project_name,))
+        existing = cursor.fetchone()
+        if existing:
+            for _ in report_lines(): pass
+            if existing['report_hash'] == report_hash.hexdigest():
+                return jsonify({'error': 'This exact report has already been uploaded for this project.'}), 409
+            return jsonify({'error': f'A project named "{project_name}" already exists. Please use a new name.'}), 409
+        try:
+            # The hash is only known once the whole report has been read; it is filled in before the commit.
+            cursor.execute("INSERT INTO projects (name, report_hash) VALUES (?, '')", (project_name,))
+            project_id = cursor.lastrowid
+            inserted = 0
+            batch = []
+            for card in iter_report_cards(report_lines()):
+                batch.append((project_id, card['scanner'], card['title'], card['level'], SEVERITY_RANKS.get(card['level'], UNKNOWN_SEVERITY_RANK), card['description'], card['location']))
+                if len(batch) >= UPLOAD_BATCH_SIZE:
+                    insert_findings(cursor, batch)
+                    inserted += len(batch)
+                    batch = []
+            if batch:
+                insert_findings(cursor, batch)
+                inserted += len(batch)
+            if not inserted:
+                conn.rollback()
+                return jsonify({'error': 'Could not find any valid findings in the report file.'}), 400
+            cursor.execute("UPDATE projects SET report_hash = ? WHERE id = ?", (report_hash.hexdigest(), project_id))
+            conn.commit()
+            return jsonify({'message': f'Successfully uploaded report for {project_name} ({inserted} findings).', 'project_id': project_id})
+        except sqlite3.IntegrityError:
+            return jsonify({'error': f'A project named "{project_name}" already exists. Please use a new name.'}), 409
+        except Exception as e:
+            return jsonify({'error': f'An internal error occurred: {e}'}), 500
 
 # --- MAIN EXECUTION ---
 if __name__ == '__main__':
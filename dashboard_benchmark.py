@@ -0,0 +1,292 @@
+import os
+import sys
+import time
+import random
+import sqlite3
+import resource
+import argparse
+import tempfile
+import threading
+import statistics
+
+import dashboard_app
+
+
+# =================================================================================
+# DASHBOARD DATABASE BENCHMARK
+# =================================================================================
+# Fills a scratch dashboard.db with synthetic findings and times the dashboard's
+# hot queries on the original schema (no indexes, rollback journal), then again
+# after init_db's migration (composite indexes, WAL, connection pragmas). The
+# findings list is timed with /api/findings' own keyset-paginated query; on the
+# original schema its severity_rank is computed from the level instead.
+#
+#   python3 dashboard_benchmark.py
+#   python3 dashboard_benchmark.py --findings 100000 --projects 50 --runs 20
+#
+# It also measures read latency while a writer commits single-row updates, the
+# way the enrichment thread does while the browser polls for findings, and times
+# full-text searches through /api/search's query on the migrated database.
+#
+#   python3 dashboard_benchmark.py --report-mb 100
+#
+# instead writes a synthetic report of that size (mostly Slither informational
+# findings, as from a large monorepo) and times its upload through /upload,
+# including the peak memory of the process.
+DEFAULT_FINDINGS = 1000000
+DEFAULT_PROJECTS = 200
+DEFAULT_RUNS = 30
+DEFAULT_CONTENTION_SECONDS = 3
+
+SCANNERS = ["Slither", "Aderyn", "Wake"]
+LEVELS = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
+LEVEL_WEIGHTS = [1, 4, 10, 25, 60]
+STATUSES = ["PENDING", "COMPLETED", "FAILED", "SKIPPED"]
+STATUS_WEIGHTS = [50, 35, 5, 10]
+
+ISSUES = ["Reentrancy in withdraw", "Unchecked return value of transfer", "Oracle price can be manipulated",
+          "Missing access control on sweep", "Divide before multiply", "Variable is not in mixedCase",
+          "Centralization risk for trusted owners", "Unsafe ERC20 approve", "Strict equality on balance"]
+FUNCTIONS = ["withdraw", "deposit", "sweep", "liquidate", "claim", "setOracle", "mint", "burn", "swap", "harvest"]
+ANALYSES = ["An attacker can re-enter before the balance is updated and drain the vault.",
+            "A stale or manipulated oracle price lets a flash loan skew collateral values.",
+            "Anyone can call the function and move funds held by the contract.",
+            "Rounding loses precision, so rewards are slightly underpaid."]
+
+# name -> (project_id, highest finding id) -> (sql, params). The findings pages are built exactly
+# as /api/findings builds them; "after" cursors halfway through the ids land deep in a project's list.
+QUERIES = {
+    "findings first page": lambda p, n: dashboard_app.findings_page_query(p),
+    "findings page, cursor in LOW": lambda p, n: dashboard_app.findings_page_query(p, after=(3, n // 2)),
+    "scanner + severity page": lambda p, n: dashboard_app.findings_page_query(p, random.choice(SCANNERS), random.choice(LEVELS[:3])),
+    "severity page, cursor": lambda p, n: dashboard_app.findings_page_query(p, rating="LOW", after=(3, n // 2)),
+    "enrichment queue": lambda p, n: ("SELECT * FROM findings WHERE project_id = ? AND enrichment_status = 'PENDING'", (p,)),
+    "pending check": lambda p, n: ("SELECT EXISTS (SELECT 1 FROM findings WHERE project_id = ? AND enrichment_status IN ('PENDING', 'FAILED'))", (p,)),
+}
+
+# (label, search text, whether to scope it to one project)
+SEARCHES = [
+    ("common words, all projects", "reentrancy withdraw", False),
+    ("common word, all projects", "oracle", False),
+    ("common word, one project", "oracle", True),
+    ("selective, all projects", "contract17 sweep", False),
+    ("prefix, all projects", "liquid*", False),
+    ("truncated word prefix", "centraliz*", False),
+    ("analysis text, all projects", "flash loan", False),
+]
+
+
+def write_synthetic_report(path, megabytes):
+    """Writes a markdown report of about `megabytes` MB in the format the dashboard parses. Returns the card count."""
+    detectors = ["naming-convention", "solc-version", "unused-state", "reentrancy-eth", "calls-inside-a-loop", "divide-before-multiply"]
+    target = megabytes * 1024 * 1024
+    cards = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Security Report\n\n## Slither Analysis\n\n```\n")
+        while f.tell() < target * 0.9:
+            detector = detectors[0] if cards % 10 else random.choice(detectors)
+            f.write(f"INFO:Detectors:\nVariable Vault{cards}.amount_{cards} (src/module{cards % 800}/Vault.sol#{cards % 900}) is not in mixedCase\n"
+                    f"\t- src/module{cards % 800}/Vault.sol#{cards % 900}\n\t- src/module{cards % 800}/Vault.sol#{cards % 900 + 1}\n"
+                    f"Reference: https://github.com/crytic/slither/wiki/Detector-Documentation#{detector}\n")
+            cards += 1
+        f.write("```\n\n## Aderyn Analysis\n\n")
+        while f.tell() < target * 0.95:
+            f.write(f"## {'H' if cards % 4 == 0 else 'L'}-{cards}: Centralization risk {cards}\n\nContracts have owners with privileged rights.\n\n"
+                    f"- Found in src/Owned{cards}.sol [Line: {cards % 300}]\n\n")
+            cards += 1
+        f.write("## Wake Analysis\n\n")
+        while f.tell() < target:
+            f.write(f"╭─ [LOW][HIGH] [unused-contract] ─────────────╮\n│ ❱ {cards % 500} contract Unused{cards} {{}}            │\n"
+                    f"╰─ contracts/Unused{cards}.sol ──────────────────╯\n\n")
+            cards += 1
+    return cards
+
+
+def check_prefix_search(conn, text="centraliz*"):
+    """A truncated word must still match: prefix terms are looked up among the unstemmed words."""
+    _, matches = dashboard_app.search_findings(conn, text)
+    print(f"  prefix search {text!r}: {matches} matches{'' if matches else ' (FAIL: expected matches)'}")
+    return matches > 0
+
+
+def time_upload(report_mb):
+    with tempfile.TemporaryDirectory(prefix="dashboard-upload-bench-") as tmp:
+        report_path = os.path.join(tmp, "report.md")
+        print(f"Writing a {report_mb} MB synthetic report...", flush=True)
+        expected = write_synthetic_report(report_path, report_mb)
+        dashboard_app.DB_FILE = os.path.join(tmp, "dashboard.db")
+        dashboard_app.init_db()
+        client = dashboard_app.app.test_client()
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        start = time.time()
+        with open(report_path, 'rb') as report:
+            response = client.post('/upload', data={'projectName': 'upload-benchmark', 'file': (report, 'report.md')})
+        elapsed = time.time() - start
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        conn = dashboard_app.get_db_conn()
+        stored = conn.execute("SELECT COUNT(*) FROM findings").fetchone()[0]
+        print(f"  status {response.status_code}: {response.get_json()}")
+        print(f"  {stored} of {expected} findings stored in {elapsed:.1f}s ({stored / max(elapsed, 1e-9):.0f} findings/s, "
+              f"{report_mb / max(elapsed, 1e-9):.1f} MB/s)")
+        print(f"  peak RSS {rss_after:.0f} MB ({rss_after - rss_before:+.0f} MB during the upload)")
+        prefix_ok = check_prefix_search(conn)
+        conn.close()
+    return 0 if stored == expected and prefix_ok else 1
+
+
+def fill_database(path, findings, projects):
+    conn = sqlite3.connect(path)
+    dashboard_app.create_tables(conn)
+    conn.executemany("INSERT INTO projects (name, report_hash) VALUES (?, ?)",
+                     ((f"project-{i}", f"{i:064x}") for i in range(projects)))
+    rng = random.Random(1)
+    levels = rng.choices(LEVELS, LEVEL_WEIGHTS, k=findings)
+    statuses = rng.choices(STATUSES, STATUS_WEIGHTS, k=findings)
+    rows = ((rng.randrange(1, projects + 1), rng.choice(SCANNERS), rng.choice(ISSUES), levels[i],
+             f"Finding {i}: {rng.choice(FUNCTIONS)}() in Contract{i % 311} was flagged by the scanner.",
+             f"src/Contract{i % 311}.sol#L{i % 900}", statuses[i],
+             rng.choice(ANALYSES) if statuses[i] == "COMPLETED" else None) for i in range(findings))
+    conn.executemany("INSERT INTO findings (project_id, scanner, title, level, description, location, enrichment_status, gemini_info) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def without_rank_column(sql):
+    """The original schema has no severity_rank column; it computes the rank from the level instead."""
+    return sql.replace("severity_rank", f"({dashboard_app.SEVERITY_RANK_SQL})")
+
+
+def time_queries(conn, projects, runs, rewrite=None):
+    results = {}
+    rng_state = random.getstate()
+    max_id = conn.execute("SELECT MAX(id) FROM findings").fetchone()[0]
+    for name, build in QUERIES.items():
+        random.seed(name)
+        timings = []
+        for _ in range(runs):
+            sql, args = build(random.randrange(1, projects + 1), max_id)
+            sql = rewrite(sql) if rewrite else sql
+            start = time.perf_counter()
+            conn.execute(sql, args).fetchall()
+            timings.append(time.perf_counter() - start)
+        results[name] = statistics.median(timings)
+    random.setstate(rng_state)
+    return results
+
+
+def time_searches(conn, projects, runs):
+    """Median time of each search, with the number of matches it ranked."""
+    results = {}
+    for name, text, scoped in SEARCHES:
+        timings = []
+        for run in range(runs):
+            project_id = run % projects + 1 if scoped else None
+            start = time.perf_counter()
+            _, matches = dashboard_app.search_findings(conn, text, project_id)
+            timings.append(time.perf_counter() - start)
+        results[name] = (statistics.median(timings), matches)
+    return results
+
+
+def time_reads_under_writes(connect, projects, seconds, rewrite=None):
+    """Median and worst first-page latency while another connection commits one update at a time."""
+    stop = threading.Event()
+    writes = [0]
+
+    def writer():
+        conn = connect()
+        finding_count = conn.execute("SELECT MAX(id) FROM findings").fetchone()[0]
+        while not stop.is_set():
+            try:
+                conn.execute("UPDATE findings SET enrichment_status = 'COMPLETED', gemini_info = ? WHERE id = ?",
+                             ("x" * 2000, random.randrange(1, finding_count + 1)))
+                conn.commit()
+                writes[0] += 1
+            except sqlite3.OperationalError:
+                pass
+        conn.close()
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    conn = connect()
+    timings, errors = [], 0
+    deadline = time.time() + seconds
+    while time.time() < deadline:
+        start = time.perf_counter()
+        try:
+            sql, args = dashboard_app.findings_page_query(random.randrange(1, projects + 1))
+            conn.execute(rewrite(sql) if rewrite else sql, args).fetchall()
+            timings.append(time.perf_counter() - start)
+        except sqlite3.OperationalError:
+            errors += 1
+    stop.set()
+    thread.join()
+    conn.close()
+    timings.sort()
+    return {"median": statistics.median(timings) if timings else 0, "max": timings[-1] if timings else 0,
+            "reads": len(timings), "errors": errors, "writes": writes[0]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Times dashboard.db queries before and after the index/WAL migration.")
+    parser.add_argument('--findings', type=int, default=DEFAULT_FINDINGS, help="Number of synthetic findings.")
+    parser.add_argument('--projects', type=int, default=DEFAULT_PROJECTS, help="Number of projects they are spread over.")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help="Timed executions per query.")
+    parser.add_argument('--contention', type=float, default=DEFAULT_CONTENTION_SECONDS,
+                        help="Seconds of reads under concurrent writes per phase (0 to skip).")
+    parser.add_argument('--keep', metavar='PATH', help="Build the database at PATH and keep it instead of a temporary file.")
+    parser.add_argument('--report-mb', type=int, help="Benchmark uploading a synthetic report of this size instead.")
+    args = parser.parse_args(argv)
+    if args.report_mb:
+        return time_upload(args.report_mb)
+
+    with tempfile.TemporaryDirectory(prefix="dashboard-bench-") as tmp:
+        path = args.keep or os.path.join(tmp, "dashboard.db")
+        print(f"Building {args.findings} findings in {args.projects} projects...", flush=True)
+        start = time.time()
+        fill_database(path, args.findings, args.projects)
+        print(f"  done in {time.time() - start:.1f}s ({os.path.getsize(path) / 1e6:.0f} MB)")
+
+        def connect_plain():
+            # The pre-migration setup: default pragmas and rollback journal.
+            return sqlite3.connect(path, check_same_thread=False, timeout=5)
+
+        def connect_tuned():
+            dashboard_app.DB_FILE = path
+            return dashboard_app.get_db_conn()
+
+        conn = connect_plain()
+        before = time_queries(conn, args.projects, args.runs, without_rank_column)
+        conn.close()
+        before_contention = time_reads_under_writes(connect_plain, args.projects, args.contention, without_rank_column) if args.contention else None
+
+        conn = connect_tuned()
+        start = time.time()
+        dashboard_app.migrate_db(conn)
+        print(f"Migration (indexes, ANALYZE, full-text indexes, WAL) took {time.time() - start:.1f}s")
+        after = time_queries(conn, args.projects, args.runs)
+        searches = time_searches(conn, args.projects, args.runs)
+        prefix_ok = check_prefix_search(conn)
+        conn.close()
+        after_contention = time_reads_under_writes(connect_tuned, args.projects, args.contention) if args.contention else None
+
+        width = max(len(name) for name in QUERIES)
+        print(f"\n{'query'.ljust(width)}  {'before':>10}  {'after':>10}  speedup")
+        for name in QUERIES:
+            print(f"{name.ljust(width)}  {before[name] * 1000:8.2f}ms  {after[name] * 1000:8.2f}ms  {before[name] / max(after[name], 1e-9):6.1f}x")
+        print("\nFull-text search (after):")
+        width = max(len(name) for name, _, _ in SEARCHES)
+        for name, text, _ in SEARCHES:
+            elapsed, matches = searches[name]
+            print(f"  {name.ljust(width)}  {text!r:22}  {elapsed * 1000:8.2f}ms  {matches} ranked")
+        if args.contention:
+            print("\nReads while the enrichment-style writer commits:")
+            for label, result in (("before", before_contention), ("after", after_contention)):
+                print(f"  {label:6}  median {result['median'] * 1000:.2f}ms  max {result['max'] * 1000:.2f}ms  "
+                      f"reads {result['reads']}  lock errors {result['errors']}  writes {result['writes']}")
+    return 0 if prefix_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
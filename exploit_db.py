@@ -7,9 +7,7 @@ from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPu
 
 import shlex
 import html
-from queue import Queue
 import threading
-from PyQt5.QtCore import QTimer
 import re
 import shutil
 
@@ -26,6 +24,9 @@ except ImportError:
     print("Warning: exploit_db.py not found. Exploit generation will be limited.")
     EXPLOIT_TEMPLATES = {}
 
+from terminal_log import log_record, render_entry
+from signal_queue import SignalingQueue, QueueDrainer
+
 
 # =================================================================================
 # TROPHY EXPLOIT DEFINITIONS
@@ -500,7 +501,7 @@ class Application(QWidget):
         self.processed_slither_findings = []
         self.selected_project_path = None
         self.selected_contract = None
-        self.terminal_queue = Queue()
+        self.terminal_queue = SignalingQueue()
         self.is_map_ready = False
         self.map_lock = threading.Lock()
 
@@ -549,9 +550,8 @@ class Application(QWidget):
         main_layout.addWidget(main_splitter)
         self.setLayout(main_layout)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_output)
-        self.timer.start(100)
+        # Output is drained when workers post to the queue instead of polling it on a timer.
+        self.output_drainer = QueueDrainer(self.terminal_queue, self.update_output, parent=self)
 
     def setup_left_panel(self):
         single_file_group = QGroupBox("Single File Analysis")
@@ -938,7 +938,7 @@ class Application(QWidget):
                 text = self.terminal_queue.get_nowait()
                 if text == "FILTER_AND_UPDATE_VULNS": self.filter_and_update_slither_dropdown()
                 elif text == "UPDATE_EXPLOIT_UI": self.update_exploit_params()
-                else: self.terminal_output.append(text)
+                else: self.terminal_output.append(render_entry([text]))
             except Exception: pass
 
     def copy_terminal_output(self):
@@ -1005,8 +1005,9 @@ class Application(QWidget):
                 self.terminal_queue.put(log_msg)
 
                 process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=cwd, bufsize=1, universal_newlines=True)
+                source = command.split()[0] if command.split() else command
                 for line in iter(process.stdout.readline, ''):
-                    self.terminal_queue.put(html.escape(line).replace('\n', '<br>'))
+                    self.terminal_queue.put(log_record(source, line))
                 process.wait()
                 if process.returncode != 0:
                     self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {process.returncode}</span>")
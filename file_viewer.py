@@ -0,0 +1,344 @@
+import os
+import re
+import html
+import mmap
+import threading
+from array import array
+from queue import Queue, Empty
+
+from PyQt5.QtCore import Qt, QEvent, pyqtSignal
+from PyQt5.QtGui import QFontMetrics
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QScrollBar, QLabel
+
+
+# =================================================================================
+# PAGED FILE VIEWER
+# =================================================================================
+# Flattened sources and build-info JSON files can be tens of MB, often on a single
+# line. The file is memory-mapped and indexed by line offset in a background
+# thread, only the lines that fit in the window are decoded, and the highlighted
+# HTML for a page is computed off the GUI thread and swapped in when it is ready.
+
+# Longer lines are split into several viewer lines so one page never holds megabytes.
+MAX_LINE_BYTES = 4096
+# The scrollbar is extended each time this many bytes have been indexed.
+INDEX_PROGRESS_BYTES = 4 * 1024 * 1024
+HIGHLIGHT_CACHE_PAGES = 64
+
+LANGUAGES = {'.sol': 'solidity', '.js': 'javascript', '.ts': 'javascript', '.json': 'json', '.toml': 'toml'}
+
+COLORS = {
+    'keyword': '#569CD6',
+    'type': '#4EC9B0',
+    'string': '#CE9178',
+    'number': '#B5CEA8',
+    'comment': '#6A9955',
+    'key': '#9CDCFE',
+    'section': '#C586C0',
+    'lineno': '#666666',
+}
+
+SOLIDITY_KEYWORDS = {
+    'pragma', 'import', 'contract', 'interface', 'library', 'abstract', 'is', 'function', 'modifier', 'event',
+    'error', 'struct', 'enum', 'mapping', 'constructor', 'fallback', 'receive', 'returns', 'return', 'if', 'else',
+    'for', 'while', 'do', 'break', 'continue', 'emit', 'revert', 'require', 'assert', 'new', 'delete', 'using',
+    'public', 'private', 'internal', 'external', 'view', 'pure', 'payable', 'virtual', 'override', 'constant',
+    'immutable', 'memory', 'storage', 'calldata', 'indexed', 'anonymous', 'unchecked', 'assembly', 'try', 'catch',
+    'type', 'true', 'false', 'this', 'super', 'as', 'from',
+}
+SOLIDITY_TYPE_RE = re.compile(r'^(?:address|bool|string|bytes\d*|u?int\d*|u?fixed[\dx]*)$')
+JAVASCRIPT_KEYWORDS = {
+    'const', 'let', 'var', 'function', 'return', 'if', 'else', 'for', 'while', 'do', 'break', 'continue', 'class',
+    'extends', 'new', 'this', 'super', 'import', 'export', 'from', 'default', 'async', 'await', 'try', 'catch',
+    'finally', 'throw', 'typeof', 'instanceof', 'in', 'of', 'true', 'false', 'null', 'undefined', 'interface',
+    'type', 'enum', 'public', 'private', 'readonly', 'as',
+}
+
+CODE_TOKEN_RE = re.compile(
+    r'(?P<comment>//.*|/\*.*?\*/|/\*.*)'
+    r'|(?P<string>"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?|`(?:\\.|[^`\\])*`?)'
+    r'|(?P<number>\b(?:0x[0-9a-fA-F]+|\d[\d_]*(?:\.\d+)?(?:e\d+)?)\b)'
+    r'|(?P<word>[A-Za-z_$][\w$]*)'
+)
+JSON_TOKEN_RE = re.compile(
+    r'(?P<key>"(?:\\.|[^"\\])*"(?=\s*:))'
+    r'|(?P<string>"(?:\\.|[^"\\])*"?)'
+    r'|(?P<number>-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b)'
+    r'|(?P<keyword>\b(?:true|false|null)\b)'
+)
+TOML_TOKEN_RE = re.compile(
+    r'(?P<comment>#.*)'
+    r'|(?P<section>^\s*\[[^\]]*\]+)'
+    r'|(?P<key>^\s*[\w.-]+(?=\s*=))'
+    r'|(?P<string>"(?:\\.|[^"\\])*"?|\'[^\']*\'?)'
+    r'|(?P<number>\b\d[\d_]*(?:\.\d+)?\b)'
+    r'|(?P<keyword>\b(?:true|false)\b)'
+)
+
+
+def language_for(path):
+    return LANGUAGES.get(os.path.splitext(path)[1].lower())
+
+
+class PagedFile:
+    """Memory-mapped file with a line-offset index. Safe to read while the index is still being built."""
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.offsets = array('q', [0])
+        self.indexed = self.size == 0
+
+    def build_index(self, on_progress=None, max_line_bytes=MAX_LINE_BYTES):
+        mm, size, offsets = self._mm, self.size, self.offsets
+        pos = 0
+        next_progress = INDEX_PROGRESS_BYTES
+        while pos < size:
+            newline = mm.find(b'\n', pos)
+            end = size if newline == -1 else newline + 1
+            while end - pos > max_line_bytes:
+                cut = pos + max_line_bytes
+                # Never split inside a UTF-8 sequence.
+                while cut > pos + 1 and (mm[cut] & 0xC0) == 0x80:
+                    cut -= 1
+                offsets.append(cut)
+                pos = cut
+            if end < size:
+                offsets.append(end)
+            pos = end
+            if on_progress and pos >= next_progress:
+                next_progress = pos + INDEX_PROGRESS_BYTES
+                on_progress(self.line_count())
+        self.indexed = True
+        if on_progress:
+            on_progress(self.line_count())
+
+    def line_count(self):
+        if not self.size:
+            return 0
+        # Until indexing finishes, the end of the last known line is not known yet.
+        return len(self.offsets) if self.indexed else len(self.offsets) - 1
+
+    def read_lines(self, start, count):
+        end_line = min(start + count, self.line_count())
+        lines = []
+        for i in range(max(start, 0), end_line):
+            begin = self.offsets[i]
+            end = self.offsets[i + 1] if i + 1 < len(self.offsets) else self.size
+            lines.append(self._mm[begin:end].rstrip(b'\r\n').decode('utf-8', errors='replace'))
+        return lines
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+
+def _span(kind, text):
+    return f"<span style='color:{COLORS[kind]};'>{html.escape(text)}</span>"
+
+
+def _highlight_tokens(line, token_re, classify):
+    parts, pos = [], 0
+    for match in token_re.finditer(line):
+        kind = classify(match)
+        if kind is None:
+            continue
+        parts.append(html.escape(line[pos:match.start()]))
+        parts.append(_span(kind, match.group()))
+        pos = match.end()
+    parts.append(html.escape(line[pos:]))
+    return "".join(parts)
+
+
+def highlight_lines(lines, language):
+    """Returns one HTML fragment per line. Block comments are tracked within the page only."""
+    if language == 'json':
+        return [_highlight_tokens(line, JSON_TOKEN_RE, lambda m: m.lastgroup) for line in lines]
+    if language == 'toml':
+        return [_highlight_tokens(line, TOML_TOKEN_RE, lambda m: m.lastgroup) for line in lines]
+    if language not in ('solidity', 'javascript'):
+        return [html.escape(line) for line in lines]
+
+    keywords = SOLIDITY_KEYWORDS if language == 'solidity' else JAVASCRIPT_KEYWORDS
+
+    def classify(match):
+        if match.lastgroup != 'word':
+            return match.lastgroup
+        word = match.group()
+        if word in keywords:
+            return 'keyword'
+        if language == 'solidity' and SOLIDITY_TYPE_RE.match(word):
+            return 'type'
+        return None
+
+    result, in_block = [], False
+    for line in lines:
+        prefix = ""
+        if in_block:
+            close = line.find('*/')
+            if close == -1:
+                result.append(_span('comment', line))
+                continue
+            prefix, line, in_block = _span('comment', line[:close + 2]), line[close + 2:], False
+        highlighted = _highlight_tokens(line, CODE_TOKEN_RE, classify)
+        last_open, last_close = line.rfind('/*'), line.rfind('*/')
+        if last_open != -1 and last_open > last_close and '//' not in line[:last_open]:
+            in_block = True
+        result.append(prefix + highlighted)
+    return result
+
+
+class FileViewerDialog(QDialog):
+    index_progress = pyqtSignal(int)
+    index_failed = pyqtSignal(str)
+    page_highlighted = pyqtSignal(int, int, str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(os.path.basename(path))
+        self.resize(1000, 700)
+        self.path = path
+        self.language = language_for(path)
+        self.paged_file = PagedFile(path)
+        self.page_start = 0
+        self.page_lines = 40
+        self.generation = 0
+        self.highlight_cache = {}
+        self.highlight_requests = Queue()
+
+        layout = QVBoxLayout(self)
+        body = QHBoxLayout()
+        self.text = QTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setLineWrapMode(QTextEdit.NoWrap)
+        self.text.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.text.setStyleSheet("background-color: #1a1a1a; color: #f0f0f0; font-family: 'monospace'; font-size: 10pt;")
+        self.text.viewport().installEventFilter(self)
+        self.text.installEventFilter(self)
+        body.addWidget(self.text)
+        self.scrollbar = QScrollBar(Qt.Vertical)
+        self.scrollbar.valueChanged.connect(self.render_page)
+        body.addWidget(self.scrollbar)
+        layout.addLayout(body)
+        self.status_label = QLabel("Indexing...")
+        layout.addWidget(self.status_label)
+
+        self.index_progress.connect(self.on_index_progress)
+        self.index_failed.connect(lambda error: self.status_label.setText(f"Could not index file: {error}"))
+        self.page_highlighted.connect(self.on_page_highlighted)
+        self.finished.connect(self.release)
+        threading.Thread(target=self._index_worker, daemon=True).start()
+        threading.Thread(target=self._highlight_worker, daemon=True).start()
+
+    # --- Background work --------------------------------------------------------
+
+    def _index_worker(self):
+        try:
+            self.paged_file.build_index(self.index_progress.emit)
+        except (ValueError, OSError) as e:
+            # ValueError: the dialog was closed and the map released while indexing.
+            self.index_failed.emit(str(e))
+
+    def _highlight_worker(self):
+        requests = self.highlight_requests
+        while True:
+            request = requests.get()
+            # Only the most recent page matters; skip pages the user has already scrolled past.
+            try:
+                while True:
+                    request = requests.get_nowait()
+            except Empty:
+                pass
+            if request is None:
+                return
+            generation, start, lines = request
+            body = "\n".join(self._numbered(start, highlight_lines(lines, self.language)))
+            self.page_highlighted.emit(generation, start, body)
+
+    # --- Rendering --------------------------------------------------------------
+
+    def _numbered(self, start, fragments):
+        width = len(str(max(self.paged_file.line_count(), 1)))
+        return [f"{_span('lineno', str(start + i + 1).rjust(width))}  {fragment}" for i, fragment in enumerate(fragments)]
+
+    def _show(self, body):
+        horizontal = self.text.horizontalScrollBar().value()
+        self.text.setHtml(f"<pre style='margin:0;'>{body}</pre>")
+        self.text.horizontalScrollBar().setValue(horizontal)
+
+    def on_index_progress(self, line_count):
+        self.scrollbar.setRange(0, max(line_count - self.page_lines, 0))
+        self.update_status()
+        # The first page is shown as soon as it has been indexed.
+        if line_count and not self.text.toPlainText():
+            self.render_page()
+
+    def update_status(self):
+        total = self.paged_file.line_count()
+        last = min(self.page_start + self.page_lines, total)
+        state = "" if self.paged_file.indexed else " (indexing...)"
+        self.status_label.setText(f"{self.path} | lines {self.page_start + 1 if total else 0}-{last} of {total}{state}")
+
+    def render_page(self):
+        if self.highlight_requests is None:
+            return
+        self.page_start = self.scrollbar.value()
+        self.generation += 1
+        cached = self.highlight_cache.get(self.page_start)
+        if cached is not None and cached[0] == self.page_lines:
+            self._show(cached[1])
+        else:
+            lines = self.paged_file.read_lines(self.page_start, self.page_lines)
+            self._show("\n".join(self._numbered(self.page_start, [html.escape(line) for line in lines])))
+            if self.language:
+                self.highlight_requests.put((self.generation, self.page_start, lines))
+        self.update_status()
+
+    def on_page_highlighted(self, generation, start, body):
+        if len(self.highlight_cache) >= HIGHLIGHT_CACHE_PAGES:
+            self.highlight_cache.pop(next(iter(self.highlight_cache)))
+        self.highlight_cache[start] = (self.page_lines, body)
+        if generation == self.generation:
+            self._show(body)
+
+    # --- Events -----------------------------------------------------------------
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        line_height = max(QFontMetrics(self.text.font()).lineSpacing(), 1)
+        page_lines = max(self.text.viewport().height() // line_height - 1, 1)
+        if page_lines != self.page_lines:
+            self.page_lines = page_lines
+            self.highlight_cache.clear()
+            self.scrollbar.setPageStep(page_lines)
+            self.scrollbar.setRange(0, max(self.paged_file.line_count() - page_lines, 0))
+            self.render_page()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Wheel:
+            delta = event.angleDelta().y()
+            steps = int(delta / 120) or (delta > 0) - (delta < 0)
+            self.scrollbar.setValue(self.scrollbar.value() - steps * 3)
+            return True
+        if event.type() == QEvent.KeyPress:
+            moves = {Qt.Key_PageDown: self.page_lines, Qt.Key_PageUp: -self.page_lines, Qt.Key_Down: 1, Qt.Key_Up: -1}
+            if event.key() in moves:
+                self.scrollbar.setValue(self.scrollbar.value() + moves[event.key()])
+                return True
+            if event.key() == Qt.Key_Home and event.modifiers() & Qt.ControlModifier:
+                self.scrollbar.setValue(0)
+                return True
+            if event.key() == Qt.Key_End and event.modifiers() & Qt.ControlModifier:
+                self.scrollbar.setValue(self.scrollbar.maximum())
+                return True
+        return super().eventFilter(obj, event)
+
+    def release(self):
+        if self.highlight_requests is None:
+            return
+        self.highlight_requests.put(None)
+        self.highlight_requests = None
+        self.paged_file.close()
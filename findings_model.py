@@ -0,0 +1,150 @@
+import itertools
+from bisect import bisect_left
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QColor
+
+
+# =================================================================================
+# FINDINGS LIST MODEL
+# =================================================================================
+# Backs the findings QListView. Rows are rendered on demand by the view, new
+# findings are inserted in sorted position without rebuilding the list, and a
+# filter that only narrows the previous one (e.g. typing more characters) is
+# applied to the rows that are currently visible instead of to every finding.
+IMPACT_ORDER = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3, "Informational": 4}
+IMPACT_COLORS = {"Critical": "#ff4d4d", "High": "#ff7f50", "Medium": "orange", "Low": "#87CEEB", "Informational": "#aaaaaa"}
+
+# Above this many new rows a single model reset is cheaper than per-row inserts.
+BULK_INSERT_THRESHOLD = 500
+
+_sequence = itertools.count()
+
+
+def finding_display_text(item):
+    finding = item['finding']
+    poc_ready_signal = "[PoC Ready] " if item.get('exploit') else ""
+    prefix = f"[{item['display_impact'].upper()}] "
+    location_name = f"{finding.get('contract', 'Unknown')}.{finding.get('function_name', '')}"
+    if ".(" in location_name:
+        location_name = finding.get('contract', 'Unknown')
+    source = finding.get('source')
+    source_tag = f"{source}:" if source and source != 'slither' else ""
+    return f"{poc_ready_signal}{prefix}{source_tag}{finding['check']} in {location_name}"
+
+
+class FindingsListModel(QAbstractListModel):
+    ItemRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._visible = []
+        self._visible_keys = []
+        self._impact = "All"
+        self._terms = []
+        self._query = ""
+
+    # --- Qt model interface -----------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._visible):
+            return None
+        item = self._visible[index.row()]
+        if role == Qt.DisplayRole:
+            return finding_display_text(item)
+        if role == Qt.ForegroundRole:
+            return QColor(IMPACT_COLORS.get(item['display_impact'], "#e0e0e0"))
+        if role == Qt.ToolTipRole:
+            return item['finding'].get('description', '').strip()
+        if role == self.ItemRole:
+            return item
+        return None
+
+    # --- Items ------------------------------------------------------------------
+
+    @staticmethod
+    def _prepare(item):
+        """Adds the sort key and lowercase search text once, so sorting and filtering never recompute them."""
+        if '_sort_key' not in item:
+            finding = item['finding']
+            item['_sort_key'] = (IMPACT_ORDER.get(item['display_impact'], 99), finding['check'], next(_sequence))
+            item['_search_text'] = " ".join(str(finding.get(k, '')) for k in ('check', 'contract', 'function_name', 'source')).lower()
+        return item
+
+    def _matches(self, item):
+        if self._impact != "All" and item['display_impact'] != self._impact:
+            return False
+        return all(term in item['_search_text'] for term in self._terms)
+
+    def _rebuild_visible(self, candidates):
+        self._visible = [item for item in candidates if self._matches(item)]
+        self._visible_keys = [item['_sort_key'] for item in self._visible]
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self._items = sorted((self._prepare(item) for item in items), key=lambda item: item['_sort_key'])
+        self._rebuild_visible(self._items)
+        self.endResetModel()
+
+    def add_items(self, items):
+        """Inserts new findings in sorted position; visible rows are inserted one by one so selection is kept."""
+        items = [self._prepare(item) for item in items]
+        if not items:
+            return
+        if len(items) > BULK_INSERT_THRESHOLD:
+            self.set_items(self._items + items)
+            return
+        for item in items:
+            key = item['_sort_key']
+            self._items.insert(self._bisect_items(key), item)
+            if not self._matches(item):
+                continue
+            row = bisect_left(self._visible_keys, key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._visible.insert(row, item)
+            self._visible_keys.insert(row, key)
+            self.endInsertRows()
+
+    def _bisect_items(self, key):
+        lo, hi = 0, len(self._items)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._items[mid]['_sort_key'] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # --- Filtering --------------------------------------------------------------
+
+    def set_filter(self, impact="All", query=""):
+        """
+        Filters by impact and by space-separated terms matched against detector, contract,
+        function and scanner. A query that extends the previous one only re-checks visible rows.
+        """
+        query = query.strip().lower()
+        narrowing = impact == self._impact and query.startswith(self._query)
+        if narrowing and query == self._query:
+            return
+        self._impact = impact
+        self._query = query
+        self._terms = query.split()
+        self.beginResetModel()
+        self._rebuild_visible(self._visible if narrowing else self._items)
+        self.endResetModel()
+
+    def item_at(self, row):
+        return self._visible[row] if 0 <= row < len(self._visible) else None
+
+    def row_of(self, item):
+        if item is None or '_sort_key' not in item:
+            return -1
+        row = bisect_left(self._visible_keys, item['_sort_key'])
+        return row if row < len(self._visible) and self._visible[row] is item else -1
+
+    def total_count(self):
+        return len(self._items)
@@ -0,0 +1,184 @@
+import os
+import re
+import json
+import hashlib
+
+from scan_cache import hash_file, iter_solidity_files
+
+
+# =================================================================================
+# SOLIDITY IMPORT GRAPH & SLITHER RESULT MERGING
+# =================================================================================
+# Each file is hashed together with everything it transitively imports. When no
+# closure changed since the last successful Slither run its results are reused and
+# Slither is not run at all. Otherwise Slither still compiles and analyzes the whole
+# project: --include-paths only filters which results it reports, and those replace
+# the previous results for the changed files.
+SCAN_STATE_DIR = os.path.join(os.path.expanduser('~'), '.superscanner', 'scan_state')
+
+IMPORT_RE = re.compile(r'^\s*import\s+(?:[^;"\']*?\bfrom\s+)?["\']([^"\']+)["\']', re.MULTILINE)
+COMMENT_RE = re.compile(r'/\*.*?\*/|//[^\n]*', re.DOTALL)
+
+
+def load_foundry_profile(project_root):
+    """Returns the default profile from foundry.toml, or {} if there is none. toml is imported on first use."""
+    toml_path = os.path.join(project_root, 'foundry.toml')
+    if not os.path.isfile(toml_path):
+        return {}
+    try:
+        import toml
+        with open(toml_path, 'r') as f:
+            return toml.load(f).get('profile', {}).get('default', {})
+    except Exception:
+        return {}
+
+
+def load_remappings(project_root):
+    """Collects `prefix=target` remappings from remappings.txt and foundry.toml."""
+    remappings = []
+    remappings_path = os.path.join(project_root, 'remappings.txt')
+    if os.path.isfile(remappings_path):
+        with open(remappings_path, 'r', errors='ignore') as f:
+            remappings.extend(line.strip() for line in f if '=' in line)
+
+    remappings.extend(load_foundry_profile(project_root).get('remappings', []))
+
+    parsed = []
+    for remapping in remappings:
+        # Context-specific remappings look like `context:prefix=target`.
+        prefix, _, target = remapping.split(':', 1)[-1].partition('=')
+        if prefix and target:
+            parsed.append((prefix, target))
+    # Longest prefix wins, as in solc.
+    parsed.sort(key=lambda r: len(r[0]), reverse=True)
+    return parsed
+
+
+def parse_imports(path):
+    with open(path, 'r', errors='ignore') as f:
+        source = COMMENT_RE.sub('', f.read())
+    return IMPORT_RE.findall(source)
+
+
+def resolve_import(importing_file, import_path, project_root, remappings):
+    if import_path.startswith('.'):
+        candidates = [os.path.join(os.path.dirname(importing_file), import_path)]
+    else:
+        candidates = []
+        for prefix, target in remappings:
+            if import_path.startswith(prefix):
+                candidates.append(os.path.join(project_root, target + import_path[len(prefix):]))
+                break
+        candidates += [os.path.join(project_root, import_path),
+                       os.path.join(project_root, 'lib', import_path),
+                       os.path.join(project_root, 'node_modules', import_path)]
+    for candidate in candidates:
+        candidate = os.path.normpath(candidate)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def build_import_graph(project_root):
+    """Returns {relative_file: set(relative_imports)} for every Solidity file in the project."""
+    project_root = os.path.abspath(project_root)
+    remappings = load_remappings(project_root)
+    graph = {}
+    for path in iter_solidity_files(project_root):
+        rel_path = os.path.relpath(path, project_root).replace('\\', '/')
+        deps = set()
+        for import_path in parse_imports(path):
+            resolved = resolve_import(path, import_path, project_root, remappings)
+            # A string prefix test would also accept sibling directories such as <root>2/.
+            if resolved and os.path.commonpath([resolved, project_root]) == project_root:
+                deps.add(os.path.relpath(resolved, project_root).replace('\\', '/'))
+        graph[rel_path] = deps
+    return graph
+
+
+def transitive_closure(graph, rel_path):
+    seen = set()
+    stack = [rel_path]
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        stack.extend(graph.get(node, ()))
+    return seen
+
+
+def closure_hashes(project_root, graph):
+    """Hashes each file together with everything it transitively imports."""
+    file_hashes = {rel_path: hash_file(os.path.join(project_root, rel_path)) for rel_path in graph}
+    hashes = {}
+    for rel_path in graph:
+        h = hashlib.sha256()
+        for dep in sorted(transitive_closure(graph, rel_path)):
+            h.update(f"{dep}:{file_hashes.get(dep, '')}\n".encode())
+        hashes[rel_path] = h.hexdigest()
+    return hashes
+
+
+def changed_files(previous_hashes, current_hashes):
+    """Files that are new, removed, or whose import closure hash changed."""
+    changed = {f for f, h in current_hashes.items() if previous_hashes.get(f) != h}
+    changed |= set(previous_hashes) - set(current_hashes)
+    return changed
+
+
+def _state_path(project_root):
+    project_id = hashlib.sha256(os.path.abspath(project_root).encode()).hexdigest()
+    return os.path.join(SCAN_STATE_DIR, f"{project_id}.json")
+
+
+def load_scan_state(project_root):
+    try:
+        with open(_state_path(project_root), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_scan_state(project_root, state):
+    path = _state_path(project_root)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def result_files(result):
+    return {e['source_mapping']['filename_relative'].replace('\\', '/') for e in result.get('elements', [])
+            if e.get('source_mapping', {}).get('filename_relative')}
+
+
+def include_paths_arg(files):
+    """
+    Builds Slither's comma-separated `--include-paths` regex list for the given files. It only
+    filters the reported results; Slither still compiles and analyzes every file.
+    """
+    return ",".join(re.escape(f) for f in sorted(files))
+
+
+def merge_slither_results(previous_detectors, new_data, changed):
+    """
+    Merges the results Slither reported for `changed` files with the previous full result set.
+    Previous findings are kept only if none of their elements touch a changed or removed file.
+    """
+    merged = []
+    seen_ids = set()
+    for result in new_data.get('results', {}).get('detectors', []):
+        merged.append(result)
+        seen_ids.add(result.get('id'))
+    for result in previous_detectors:
+        files = result_files(result)
+        if files & changed or result.get('id') in seen_ids:
+            continue
+        merged.append(result)
+        seen_ids.add(result.get('id'))
+    merged_data = dict(new_data)
+    merged_data['results'] = dict(new_data.get('results', {}))
+    merged_data['results']['detectors'] = merged
+    return merged_data
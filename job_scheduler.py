@@ -0,0 +1,261 @@
+import os
+import json
+import heapq
+import itertools
+import threading
+import time
+import uuid
+
+
+# =================================================================================
+# PERSISTENT SCAN JOB SCHEDULER
+# =================================================================================
+# Every command goes through one queue instead of a fresh thread per click.
+# Jobs are persisted to disk on every state change, so queued and interrupted
+# jobs are picked up again after a crash or restart. Heavy tools are capped
+# individually (e.g. at most 2 Mythril runs) on top of a global worker limit.
+# Jobs can carry a group (the GUI session that queued them); within a priority,
+# groups take turns, so one session queueing a long batch does not hold back the
+# jobs of the others sharing the same workers.
+JOBS_FILE = os.path.join(os.path.expanduser('~'), '.superscanner', 'jobs.json')
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+PRIORITY_NAMES = {"High": PRIORITY_HIGH, "Normal": PRIORITY_NORMAL, "Low": PRIORITY_LOW}
+
+DEFAULT_TOOL_LIMITS = {
+    "mythril": 2,
+    "slither": 4,
+    "aderyn": 2,
+    "wake": 2,
+    # Concurrent forge builds in one project overwrite each other's `out/` and `cache/`.
+    "forge": 1,
+    "solc-select": 1,
+}
+DEFAULT_TOOL_LIMIT = 4
+
+# Executables whose tool name differs from the first word of the command.
+TOOL_ALIASES = {
+    "myth": "mythril",
+    "yarn": "npm",
+    "npx": "npm",
+}
+
+# How many finished jobs are kept in the state file for inspection.
+MAX_FINISHED_JOBS = 200
+
+
+def tool_for_command(command):
+    executable = os.path.basename(command.strip().split()[0]) if command.strip() else ""
+    return TOOL_ALIASES.get(executable, executable)
+
+
+class JobScheduler:
+    """
+    Runs jobs through `runner(job)` on worker threads, highest priority first and
+    alternating between groups, while keeping at most `tool_limits[tool]` jobs per
+    tool and `max_workers` jobs overall.
+    `on_update(job)` is called from worker threads whenever a job changes state.
+    """
+
+    def __init__(self, runner, state_file=JOBS_FILE, tool_limits=None, max_workers=None, on_update=None):
+        self.runner = runner
+        self.state_file = state_file
+        self.tool_limits = dict(DEFAULT_TOOL_LIMITS)
+        self.tool_limits.update(tool_limits or {})
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.on_update = on_update
+
+        self.jobs = {}
+        self.queue = []
+        self.running = {}
+        self.counter = itertools.count()
+        # Last fair sequence number given to each group, and the highest one dispatched so far.
+        self.group_seqs = {}
+        self.dispatched_seq = 0
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.dispatcher = None
+
+    # --- Persistence ------------------------------------------------------------
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f).get('jobs', [])
+        except (OSError, ValueError):
+            return []
+
+    def _save(self):
+        finished = [j for j in self.jobs.values() if j['status'] not in ('queued', 'running')]
+        finished.sort(key=lambda j: j.get('finished_at') or 0)
+        for job in finished[:-MAX_FINISHED_JOBS]:
+            del self.jobs[job['id']]
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            tmp_path = f"{self.state_file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({"jobs": sorted(self.jobs.values(), key=lambda j: j['seq'])}, f, indent=1)
+            os.replace(tmp_path, self.state_file)
+        except OSError:
+            pass
+
+    # --- Public API -------------------------------------------------------------
+
+    def start(self):
+        """Reloads persisted jobs, re-queues unfinished ones and starts dispatching. Returns the resumed jobs."""
+        resumed = []
+        with self.condition:
+            for job in self._load():
+                job['seq'] = next(self.counter)
+                self.jobs[job['id']] = job
+                if job['status'] in ('queued', 'running'):
+                    # A job that was running when the process died is started again from scratch.
+                    job['resumed'] = job.get('resumed', 0) + (job['status'] == 'running')
+                    job['status'] = 'queued'
+                    self._push(job)
+                    resumed.append(job)
+            self._save()
+            self.stopped = False
+        self.dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True, name="job-dispatcher")
+        self.dispatcher.start()
+        return resumed
+
+    def submit(self, command, cwd=None, tool=None, priority=PRIORITY_NORMAL, data=None, group=None):
+        job = {
+            "id": uuid.uuid4().hex,
+            "command": command,
+            "cwd": cwd,
+            "tool": tool or tool_for_command(command),
+            "priority": priority,
+            "group": group,
+            "data": data or {},
+            "status": "queued",
+            "returncode": None,
+            "error": None,
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+        }
+        with self.condition:
+            job['seq'] = next(self.counter)
+            self.jobs[job['id']] = job
+            self._push(job)
+            self._save()
+            self.condition.notify_all()
+        self._notify(job)
+        return job
+
+    def cancel(self, job_id):
+        """Cancels a job that has not started yet. Running jobs are left alone."""
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if not job or job['status'] != 'queued':
+                return False
+            job['status'] = 'cancelled'
+            job['finished_at'] = time.time()
+            self._save()
+        self._notify(job)
+        return True
+
+    def cancel_group(self, group):
+        """Cancels every queued job of `group`. Returns how many were cancelled."""
+        with self.condition:
+            queued = [j['id'] for j in self.jobs.values() if j.get('group') == group and j['status'] == 'queued']
+        return sum(self.cancel(job_id) for job_id in queued)
+
+    def pending(self, group=None):
+        with self.condition:
+            return [dict(j) for j in self.jobs.values()
+                    if j['status'] in ('queued', 'running') and (group is None or j.get('group') == group)]
+
+    def running_counts(self):
+        with self.condition:
+            counts = {}
+            for job in self.running.values():
+                counts[job['tool']] = counts.get(job['tool'], 0) + 1
+            return counts
+
+    def shutdown(self):
+        """Stops dispatching new jobs. Queued jobs stay on disk and resume on the next start()."""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+
+    # --- Dispatching ------------------------------------------------------------
+
+    def _push(self, job):
+        # Each group continues from where dispatching is now, so a group's backlog only delays its own later jobs.
+        fair_seq = max(self.group_seqs.get(job.get('group'), -1) + 1, self.dispatched_seq)
+        self.group_seqs[job.get('group')] = fair_seq
+        job['fair_seq'] = fair_seq
+        heapq.heappush(self.queue, (job['priority'], fair_seq, job['seq'], job['id']))
+
+    def limit_for(self, tool):
+        return self.tool_limits.get(tool, DEFAULT_TOOL_LIMIT)
+
+    def _next_runnable(self):
+        """Pops the highest priority job whose tool is below its cap; blocked jobs keep their place."""
+        counts = {}
+        for job in self.running.values():
+            counts[job['tool']] = counts.get(job['tool'], 0) + 1
+
+        skipped = []
+        runnable = None
+        while self.queue:
+            entry = heapq.heappop(self.queue)
+            job = self.jobs.get(entry[-1])
+            if not job or job['status'] != 'queued':
+                continue
+            if counts.get(job['tool'], 0) < self.limit_for(job['tool']):
+                runnable = job
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(self.queue, entry)
+        return runnable
+
+    def _dispatch_loop(self):
+        while True:
+            with self.condition:
+                job = None
+                while not self.stopped:
+                    if len(self.running) < self.max_workers:
+                        job = self._next_runnable()
+                        if job:
+                            break
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                job['status'] = 'running'
+                job['started_at'] = time.time()
+                self.dispatched_seq = max(self.dispatched_seq, job['fair_seq'])
+                self.running[job['id']] = job
+                self._save()
+            self._notify(job)
+            threading.Thread(target=self._run_job, args=(job,), daemon=True, name=f"job-{job['tool']}").start()
+
+    def _run_job(self, job):
+        returncode = None
+        error = None
+        try:
+            returncode = self.runner(job)
+        except Exception as e:
+            error = str(e)
+        with self.condition:
+            job['returncode'] = returncode
+            job['error'] = error
+            job['status'] = 'failed' if error or (returncode not in (None, 0)) else 'done'
+            job['finished_at'] = time.time()
+            self.running.pop(job['id'], None)
+            self._save()
+            self.condition.notify_all()
+        self._notify(job)
+
+    def _notify(self, job):
+        if self.on_update:
+            try:
+                self.on_update(dict(job))
+            except Exception:
+                pass
@@ -0,0 +1,173 @@
+import os
+import re
+import html
+import json
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from import_graph import load_remappings, load_foundry_profile
+from process_limits import get_limits, run_limited
+from report_pipeline import SCANNER_OUTPUT_DIR
+
+
+# =================================================================================
+# PROJECT-WIDE MYTHRIL
+# =================================================================================
+# Enumerates the deployable contracts from the contract map and runs one
+# `myth analyze <file>:<Contract>` per contract across all cores. Every run gets
+# the solc version its contract was compiled with and a standard-json settings
+# file built from the project's remappings and optimizer configuration.
+MYTHRIL_OUTPUT_DIR = 'mythril'
+DEFAULT_EXECUTION_TIMEOUT = 600
+
+# Sources under these folders are tests, scripts or dependencies, never deploy targets.
+NON_DEPLOYABLE_DIRS = ('test/', 'tests/', 'script/', 'scripts/', 'lib/', 'node_modules/')
+NON_DEPLOYABLE_SUFFIXES = ('.t.sol', '.s.sol')
+
+SEVERITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
+
+
+def _noop_log(message):
+    pass
+
+
+def get_deployable_contracts(contract_map):
+    """Concrete contracts from the map whose source is project code, sorted by file and name."""
+    contracts = []
+    for name, data in contract_map.items():
+        source = data.get('source_file_relative', '')
+        if data.get('is_abstract') or source.startswith(NON_DEPLOYABLE_DIRS) or source.endswith(NON_DEPLOYABLE_SUFFIXES):
+            continue
+        contracts.append(data)
+    contracts.sort(key=lambda c: (c['source_file_relative'], c['name']))
+    return contracts
+
+
+def build_solc_settings(project_root):
+    """Builds the standard-json `settings` Mythril passes to solc from remappings and foundry.toml."""
+    settings = {}
+    remappings = load_remappings(project_root)
+    if remappings:
+        settings['remappings'] = [f"{prefix}={target}" for prefix, target in remappings]
+
+    profile = load_foundry_profile(project_root)
+    if profile.get('optimizer'):
+        settings['optimizer'] = {"enabled": True, "runs": int(profile.get('optimizer_runs', 200))}
+    if profile.get('evm_version'):
+        settings['evmVersion'] = profile['evm_version']
+    if profile.get('via_ir'):
+        settings['viaIR'] = True
+    return settings
+
+
+def parse_mythril_output(output):
+    """Extracts Mythril's `-o json` document from the combined output. Returns None if there is none."""
+    for line in reversed(output.splitlines()):
+        line = line.strip()
+        if line.startswith('{'):
+            try:
+                return json.loads(line)
+            except ValueError:
+                continue
+    return None
+
+
+def output_filename(contract):
+    """Raw output file for a contract, e.g. src/tokens/Token.sol:Token -> src_tokens_Token.sol_Token.txt.
+    Contract names are only unique per file, so the source path is part of the name."""
+    stem = re.sub(r'[^A-Za-z0-9_.-]', '_', f"{contract['source_file_relative']}_{contract['name']}")
+    return f"{stem}.txt"
+
+
+def run_mythril_for_contract(project_root, contract, settings_path, solc_version=None, execution_timeout=DEFAULT_EXECUTION_TIMEOUT):
+    source = contract['source_file_relative']
+    solc_version = contract.get('solc_version') or solc_version
+    target = f"{source}:{contract['name']}"
+    command = f"myth analyze {shlex.quote(target)} -o json --solc-json {shlex.quote(settings_path)}"
+    command += f" --execution-timeout {int(execution_timeout)}"
+    if solc_version:
+        command += f" --solv {shlex.quote(solc_version)}"
+
+    result = {
+        "contract": contract['name'],
+        "file": source,
+        "solc_version": solc_version,
+        "command": command,
+        "returncode": None,
+        "issues": [],
+        "error": None,
+        "truncated": False,
+        "truncated_reason": None,
+        "elapsed": 0.0,
+    }
+    limits = get_limits('mythril')
+    start = time.monotonic()
+    try:
+        process = run_limited(command, cwd=project_root, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'])
+    except Exception as e:
+        result['error'] = str(e)
+        result['elapsed'] = time.monotonic() - start
+        return result
+
+    result.update(returncode=process['returncode'], truncated=process['truncated'],
+                  truncated_reason=process['truncated_reason'], elapsed=process['elapsed'])
+    report = parse_mythril_output(process['output'])
+    if process['returncode'] == 127:
+        result['error'] = "`myth` command not found"
+    elif report is None:
+        result['error'] = process['truncated_reason'] or process['output'].strip()[-2000:] or "no JSON output from Mythril"
+    else:
+        result['error'] = report.get('error')
+        for issue in report.get('issues', []):
+            issue = dict(issue)
+            issue.setdefault('contract', contract['name'])
+            issue['analyzed_contract'] = contract['name']
+            result['issues'].append(issue)
+
+    output_dir = os.path.join(project_root, SCANNER_OUTPUT_DIR, MYTHRIL_OUTPUT_DIR)
+    try:
+        with open(os.path.join(output_dir, output_filename(contract)), 'w', errors='ignore') as f:
+            f.write(process['output'])
+    except OSError:
+        pass
+    return result
+
+
+def run_mythril_project(project_root, contracts, log=None, max_workers=None, solc_version=None,
+                        execution_timeout=DEFAULT_EXECUTION_TIMEOUT):
+    """
+    Runs Mythril on every contract concurrently and returns (per-contract results, aggregated issues).
+    Results keep the order of `contracts`; issues are sorted by severity.
+    """
+    log = log or _noop_log
+    if not contracts:
+        return [], []
+    max_workers = max_workers or min(len(contracts), os.cpu_count() or 1)
+
+    output_dir = os.path.join(project_root, SCANNER_OUTPUT_DIR, MYTHRIL_OUTPUT_DIR)
+    os.makedirs(output_dir, exist_ok=True)
+    settings_path = os.path.join(output_dir, 'solc_settings.json')
+    with open(settings_path, 'w') as f:
+        json.dump(build_solc_settings(project_root), f, indent=2)
+
+    results = [None] * len(contracts)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mythril") as pool:
+        futures = {pool.submit(run_mythril_for_contract, project_root, contract, settings_path, solc_version, execution_timeout): i
+                   for i, contract in enumerate(contracts)}
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[futures[future]] = result
+            prefix = f"[{done}/{len(contracts)}] {result['contract']}"
+            if result['error']:
+                log(f"<span style='color:red;'>{prefix}: failed after {result['elapsed']:.1f}s: {html.escape(str(result['error']))}</span>")
+            elif result['truncated']:
+                log(f"<span style='color:orange;'>{prefix}: truncated ({result['truncated_reason']}), {len(result['issues'])} issues so far.</span>")
+            else:
+                log(f"<span style='color:green;'>✅ {prefix}: {len(result['issues'])} issues in {result['elapsed']:.1f}s.</span>")
+
+    issues = [issue for result in results for issue in result['issues']]
+    issues.sort(key=lambda i: (SEVERITY_ORDER.get(i.get('severity'), 99), i.get('analyzed_contract', ''), i.get('lineno') or 0))
+    with open(os.path.join(output_dir, 'findings.json'), 'w') as f:
+        json.dump({"results": results, "issues": issues}, f, indent=2)
+    return results, issues
@@ -2,32 +2,70 @@ import sys
 import os
 import subprocess
 import json
-from PyQt5.QtCore import QDir, QPoint, Qt
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, QTextEdit, QFileDialog, QLabel, QSpacerItem, QSizePolicy, QInputDialog, QFormLayout, QGroupBox, QCheckBox, QTreeView, QFileSystemModel, QSplitter, QMenu, QMessageBox, QLineEdit, QScrollArea, QGridLayout, QTextBrowser, QDialog, QDialogButtonBox
+from PyQt5.QtCore import QDir, QPoint, Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QComboBox, QTextEdit, QFileDialog, QLabel, QSpacerItem, QSizePolicy, QInputDialog, QFormLayout, QGroupBox, QCheckBox, QTreeView, QFileSystemModel, QSplitter, QMenu, QMessageBox, QLineEdit, QScrollArea, QGridLayout, QTextBrowser, QDialog, QDialogButtonBox, QListView, QListWidget, QListWidgetItem, QTabWidget
 
 import shlex
 import html
-from queue import Queue
+import time
+import uuid
 import threading
-from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QTextCursor, QTextDocument
+from PyQt5.QtCore import QRegularExpression, QTimer
 import re
 import shutil
-import toml
+import importlib.util
 from datetime import datetime
 
 
-try:
+# Slither (with crytic-compile and solc-select), toml and the exploit templates are
+# imported on first use so the window can appear before they are loaded.
+def load_slither():
     from slither import Slither
     from slither.exceptions import SlitherError
-except ImportError:
-    print("Error: Py-Slither is not installed. Please run 'pip install slither-analyzer'.")
-    sys.exit(1)
+    return Slither, SlitherError
 
-try:
-    from exploit_db import EXPLOIT_TEMPLATES
-except ImportError:
-    print("Warning: exploit_db.py not found. Exploit generation will be limited.")
-    EXPLOIT_TEMPLATES = {}
+
+_exploit_templates = None
+
+
+def load_exploit_templates():
+    """
+    Imports the exploit templates once. exploit_db is a Qt module, so this is called on the
+    GUI thread before work that processes findings starts; worker threads only read them.
+    """
+    global _exploit_templates
+    if _exploit_templates is None:
+        try:
+            from exploit_db import EXPLOIT_TEMPLATES as templates
+        except (Exception, SystemExit) as e:
+            # exploit_db calls sys.exit when Slither is missing.
+            print(f"Warning: could not load exploit templates from exploit_db ({type(e).__name__}: {e}). Exploit generation will be limited.")
+            templates = {}
+        _exploit_templates = templates
+    return _exploit_templates
+
+
+def get_exploit_templates():
+    """The templates loaded by load_exploit_templates(), or none if they have not been loaded."""
+    return _exploit_templates or {}
+
+from report_pipeline import REPORT_SCANNERS, SCANNER_OUTPUT_DIR, run_report_scanners, build_report_markdown
+from build_artifacts import get_build_export, load_build_export, get_build_hash
+from slither_detectors import run_detectors_in_process
+from contract_map import build_contract_map, parse_slither_findings
+from job_scheduler import PRIORITY_NAMES, tool_for_command
+from station_services import StationServices
+from process_limits import get_limits, get_limits_for_command, run_limited
+from streaming_findings import get_stream_parser
+from terminal_log import (TerminalBatcher, ScrollbackBuffer, LogSearchIndex, entry_to_text, log_record, render_entry,
+                          make_record_filter, normalize_line, LEVEL_INFO, LEVEL_WARNING, LEVEL_ERROR)
+from findings_model import FindingsListModel
+from file_viewer import FileViewerDialog
+from signal_queue import SignalingQueue, QueueDrainer
+from mythril_project import get_deployable_contracts, run_mythril_project, MYTHRIL_OUTPUT_DIR
+from import_graph import (build_import_graph, closure_hashes, changed_files, include_paths_arg,
+                          load_scan_state, save_scan_state, merge_slither_results, result_files)
 
 
 # =================================================================================
@@ -480,32 +518,42 @@ class TrophyConfigDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save configuration file:\n{e}")
 
-class Application(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Smart Contract Vulnerability Scanner - The Six-Shooter")
-        self.setGeometry(100, 100, 1800, 1000)
+class ScannerSession(QWidget):
+    """
+    One project audit: its own findings, contract map, terminal and queued jobs. Sessions are
+    shown as tabs of the station window and share its job workers, scan cache and Slither builds.
+    """
+    # Emitted with a short name for the tab when a project or contract is selected.
+    title_changed = pyqtSignal(str)
 
-        self.setStyleSheet("""
-            QWidget { background-color: #0d0d0d; color: #e0e0e0; font-family: 'monospace'; }
-            QGroupBox { font-weight: bold; border: 1px solid #444; border-radius: 5px; margin-top: 10px; }
-            QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }
-            QPushButton { background-color: #333; border: 1px solid #555; padding: 5px; border-radius: 3px; }
-            QPushButton:hover { background-color: #454545; }
-            QPushButton:pressed { background-color: #222; }
-            QComboBox, QLineEdit { background-color: #222; border: 1px solid #555; padding: 3px; }
-            QTextEdit, QTextBrowser { background-color: #1a1a1a; border: 1px solid #555; }
-        """)
+    def __init__(self, services, parent=None):
+        super().__init__(parent)
+        self.services = services
+        self.session_id = uuid.uuid4().hex
 
         self.home_dir = os.path.expanduser('~')
         self.contract_map_data = {}
         self.slither_findings = []
+        self.tool_findings = []
         self.processed_slither_findings = []
+        # Guards the findings lists, which scanner threads extend while results stream in.
+        self.findings_lock = threading.Lock()
+        self.vuln_update_pending = False
+        self.pending_findings_delta = []
+        self.findings_reset_pending = False
+        self.file_viewers = []
         self.selected_project_path = None
         self.selected_contract = None
-        self.terminal_queue = Queue()
+        self.terminal_queue = SignalingQueue()
+        self.terminal_batcher = TerminalBatcher(self.terminal_queue, control_messages=("FILTER_AND_UPDATE_VULNS", "UPDATE_EXPLOIT_UI", "UPDATE_TERMINAL_SOURCES"))
+        # Commands whose output has reached the terminal, offered in the source filter.
+        self.terminal_sources = set()
+        self.terminal_record_filter = None
         self.is_map_ready = False
         self.map_lock = threading.Lock()
+        self.scan_cache = services.scan_cache
+        self.slither_instance = None
+        self.slither_build_hash = None
 
         self.version_list = [f"0.{i}.{j}" for i in range(8, 3, -1) for j in range(27, -1, -1)]
 
@@ -533,15 +581,60 @@ class Application(QWidget):
         self.terminal_output.setReadOnly(True)
         self.terminal_output.setStyleSheet("background-color: #1a1a1a; color: #f0f0f0; font-family: 'monospace'; font-size: 10pt;")
         self.terminal_output.setOpenExternalLinks(True)
+        terminal_filter_layout = QHBoxLayout()
+        terminal_filter_layout.addWidget(QLabel("Show:"))
+        self.terminal_level_dropdown = QComboBox()
+        self.terminal_level_dropdown.addItem("All output", LEVEL_INFO)
+        self.terminal_level_dropdown.addItem("Warnings and errors", LEVEL_WARNING)
+        self.terminal_level_dropdown.addItem("Errors only", LEVEL_ERROR)
+        self.terminal_level_dropdown.currentIndexChanged.connect(self.apply_terminal_filter)
+        terminal_filter_layout.addWidget(self.terminal_level_dropdown)
+        self.terminal_source_dropdown = QComboBox()
+        self.terminal_source_dropdown.addItem("All commands", None)
+        self.terminal_source_dropdown.currentIndexChanged.connect(self.apply_terminal_filter)
+        terminal_filter_layout.addWidget(self.terminal_source_dropdown)
+        terminal_layout.addLayout(terminal_filter_layout)
+        terminal_search_layout = QHBoxLayout()
+        self.terminal_search_input = QLineEdit()
+        self.terminal_search_input.setPlaceholderText("Search output (detector, revert reason, address...)")
+        # Typing searches the indexed recent output; Enter also reads older output back from the spill file.
+        self.terminal_search_input.textChanged.connect(lambda: self.search_terminal_output(include_spilled=False))
+        self.terminal_search_input.returnPressed.connect(self.search_terminal_output)
+        terminal_search_layout.addWidget(self.terminal_search_input)
+        self.terminal_search_label = QLabel("")
+        terminal_search_layout.addWidget(self.terminal_search_label)
+        terminal_layout.addLayout(terminal_search_layout)
+        self.terminal_search_results = QListWidget()
+        self.terminal_search_results.setMaximumHeight(150)
+        self.terminal_search_results.setUniformItemSizes(True)
+        self.terminal_search_results.itemActivated.connect(lambda item: self.jump_to_terminal_line(item.data(Qt.UserRole)))
+        self.terminal_search_results.itemClicked.connect(lambda item: self.jump_to_terminal_line(item.data(Qt.UserRole)))
+        self.terminal_search_results.hide()
+        terminal_layout.addWidget(self.terminal_search_results)
         terminal_layout.addWidget(self.terminal_output)
+        # Only recent output stays in the widget; older output is spilled to disk and reloaded when scrolling up.
+        self.scrollback = ScrollbackBuffer()
+        # Indexes every line shown in the terminal for the search bar; spilled lines are searched through the scrollback.
+        self.search_index = LogSearchIndex(self.scrollback)
+        self.history_blocks = 0
+        self.next_history_page = -1
+        self.loading_history = False
+        # Spilled page shown after jumping to an old search hit; None while following live output.
+        self.history_view_page = None
+        self.terminal_output.verticalScrollBar().valueChanged.connect(self.on_terminal_scrolled)
 
         terminal_button_layout = QHBoxLayout()
         self.copy_terminal_button = QPushButton("Copy to Clipboard")
         self.copy_terminal_button.clicked.connect(self.copy_terminal_output)
         terminal_button_layout.addWidget(self.copy_terminal_button)
 
+        self.live_output_button = QPushButton("Back to Live Output")
+        self.live_output_button.clicked.connect(self.show_live_output)
+        self.live_output_button.hide()
+        terminal_button_layout.addWidget(self.live_output_button)
+
         clear_terminal_button = QPushButton("Clear Terminal")
-        clear_terminal_button.clicked.connect(self.terminal_output.clear)
+        clear_terminal_button.clicked.connect(self.clear_output)
         terminal_button_layout.addWidget(clear_terminal_button)
         terminal_layout.addLayout(terminal_button_layout)
 
@@ -552,9 +645,14 @@ class Application(QWidget):
         main_layout.addWidget(main_splitter)
         self.setLayout(main_layout)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_output)
-        self.timer.start(100)
+        # Output is drained when workers post to the queue instead of polling it on a timer.
+        self.output_drainer = QueueDrainer(self.terminal_queue, self.update_output, parent=self)
+
+        # Commands from run_command go through the station's shared scheduler and are routed back here.
+        self.job_scheduler = services.job_scheduler
+        services.register_session(self.session_id, self._execute_job, self.get_project_root)
+        if importlib.util.find_spec("slither") is None:
+            self.terminal_queue.put("<span style='color:red;'>Py-Slither is not installed. Mapping and Slither scans are unavailable until you run 'pip install slither-analyzer'.</span>")
 
     def setup_left_panel(self):
         single_file_group = QGroupBox("Single File Analysis")
@@ -632,6 +730,25 @@ class Application(QWidget):
         self.custom_detector_path_input.setPlaceholderText("Optional: /path/to/custom_detectors")
         detector_path_layout.addRow("Custom Detector Path:", self.custom_detector_path_input)
         project_layout.addLayout(detector_path_layout)
+
+        self.use_scan_cache_checkbox = QCheckBox("Reuse cached results when sources are unchanged")
+        self.use_scan_cache_checkbox.setToolTip("Results are keyed by the project's .sol files, remappings, solc version and scanner version.")
+        self.use_scan_cache_checkbox.setChecked(True)
+        project_layout.addWidget(self.use_scan_cache_checkbox)
+
+        priority_layout = QHBoxLayout()
+        priority_layout.addWidget(QLabel("Job Priority:"))
+        self.job_priority_dropdown = QComboBox()
+        self.job_priority_dropdown.addItems(list(PRIORITY_NAMES.keys()))
+        self.job_priority_dropdown.setCurrentText("Normal")
+        self.job_priority_dropdown.setToolTip("Priority of newly started commands in the job queue.")
+        priority_layout.addWidget(self.job_priority_dropdown)
+        project_layout.addLayout(priority_layout)
+
+        self.inprocess_slither_checkbox = QCheckBox("Run Slither detectors in-process")
+        self.inprocess_slither_checkbox.setToolTip("Runs detectors on the Slither instance built for the contract map instead of spawning `slither`.")
+        self.inprocess_slither_checkbox.setChecked(True)
+        project_layout.addWidget(self.inprocess_slither_checkbox)
         
         project_group.setLayout(project_layout)
         self.left_panel_layout.addWidget(project_group)
@@ -742,21 +859,31 @@ class Application(QWidget):
         exploit_generation_group = QGroupBox("Exploit Generation (from Slither)")
         main_exploit_layout = QVBoxLayout()
 
-        impact_filter_group = QGroupBox("Filter by Impact")
+        impact_filter_group = QGroupBox("Filter Findings")
         impact_filter_layout = QHBoxLayout()
         self.impact_filter_dropdown = QComboBox()
         self.impact_filter_dropdown.addItems(["All", "Critical", "High", "Medium", "Low", "Informational"])
-        self.impact_filter_dropdown.currentIndexChanged.connect(self.filter_and_update_slither_dropdown)
+        self.impact_filter_dropdown.currentIndexChanged.connect(self.filter_findings_list)
         impact_filter_layout.addWidget(self.impact_filter_dropdown)
+        self.findings_filter_input = QLineEdit()
+        self.findings_filter_input.setPlaceholderText("Detector, contract or function...")
+        self.findings_filter_input.textChanged.connect(self.filter_findings_list)
+        impact_filter_layout.addWidget(self.findings_filter_input)
         impact_filter_group.setLayout(impact_filter_layout)
         main_exploit_layout.addWidget(impact_filter_group)
 
         slither_group = QGroupBox("Slither Vulnerabilities Found")
         slither_group_layout = QVBoxLayout()
-        self.slither_vuln_dropdown = QComboBox()
-        self.slither_vuln_dropdown.setEnabled(False)
-        self.slither_vuln_dropdown.currentIndexChanged.connect(self.on_vulnerability_selected)
-        slither_group_layout.addWidget(self.slither_vuln_dropdown)
+        self.findings_model = FindingsListModel(self)
+        self.slither_vuln_list = QListView()
+        self.slither_vuln_list.setModel(self.findings_model)
+        # Uniform rows let the view lay out 100k findings without measuring each one.
+        self.slither_vuln_list.setUniformItemSizes(True)
+        self.slither_vuln_list.setMinimumHeight(180)
+        self.slither_vuln_list.selectionModel().currentChanged.connect(self.on_vulnerability_selected)
+        slither_group_layout.addWidget(self.slither_vuln_list)
+        self.findings_count_label = QLabel("No findings yet")
+        slither_group_layout.addWidget(self.findings_count_label)
         slither_group.setLayout(slither_group_layout)
         main_exploit_layout.addWidget(slither_group)
 
@@ -781,11 +908,9 @@ class Application(QWidget):
         explorer_group = QGroupBox("Project Explorer")
         explorer_layout = QVBoxLayout()
         self.fs_model = QFileSystemModel()
-        self.fs_model.setRootPath(QDir.rootPath())
         self.file_explorer = QTreeView()
-        self.file_explorer.setModel(self.fs_model)
-        self.file_explorer.setRootIndex(self.fs_model.index(self.home_dir))
-        self.file_explorer.setColumnWidth(0, 250)
+        # Watching the file system and listing the home folder waits until the window is on screen.
+        QTimer.singleShot(0, self.attach_file_explorer_model)
         self.file_explorer.doubleClicked.connect(self.on_file_explorer_activated)
         self.file_explorer.setContextMenuPolicy(Qt.CustomContextMenu)
         self.file_explorer.customContextMenuRequested.connect(self.explorer_context_menu)
@@ -801,80 +926,41 @@ class Application(QWidget):
             return
         
         self.clear_output()
-        threading.Thread(target=self._generate_full_report_thread, daemon=True).start()
+        threading.Thread(target=self._generate_full_report_thread, args=(self.get_active_scan_cache(), self.version_var.currentText()), daemon=True).start()
         
-    def _generate_full_report_thread(self):
+    def get_active_scan_cache(self):
+        return self.scan_cache if self.use_scan_cache_checkbox.isChecked() else None
+
+    def _generate_full_report_thread(self, cache=None, solc_version=None):
         project_root = self.get_project_root()
         project_name = os.path.basename(project_root)
         report_path = os.path.join(project_root, 'Full_Security_Report.md')
         
         self.terminal_queue.put(f"<b>🚀 Starting Full Report Generation for {project_name}...</b>")
-        
-        report_content = []
-        report_content.append(f"# Full Security Report: {project_name}\n")
-        report_content.append(f"**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-        scanners = [
-            {"name": "Slither", "command": "slither ."},
-            {"name": "Aderyn", "command": "aderyn", "output_file": "report.md"},
-            {"name": "Wake", "command": "wake detect all"}
-        ]
+        self.terminal_queue.put(f"<hr><b>Running {', '.join(s['name'] for s in REPORT_SCANNERS)} concurrently...</b>")
 
-        for scanner in scanners:
-            self.terminal_queue.put(f"<hr><b>Running {scanner['name']}...</b>")
-            report_content.append(f"## {scanner['name']} Analysis\n\n")
-            try:
-                result = subprocess.run(scanner['command'], shell=True, cwd=project_root, capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    self.terminal_queue.put(f"<span style='color:orange;'>{scanner['name']} finished with a non-zero exit code.</span>")
-                    report_content.append(f"**⚠️ {scanner['name']} finished with errors. Output:**\n\n")
-                
-                # Handle Aderyn's specific markdown output
-                if 'output_file' in scanner:
-                    aderyn_report_path = os.path.join(project_root, scanner['output_file'])
-                    if os.path.exists(aderyn_report_path):
-                        with open(aderyn_report_path, 'r', errors='ignore') as f:
-                            aderyn_content = f.read()
-                        report_content.append(aderyn_content + "\n\n")
-                        self.terminal_queue.put(f"<span style='color:green;'>✅ Parsed {scanner['name']}'s report.md</span>")
-                    else:
-                        report_content.append("Could not find Aderyn's `report.md` file.\n\n")
-                        self.terminal_queue.put(f"<span style='color:red;'>Error: Could not find Aderyn's report file.</span>")
-
-                # Handle stdout for other tools
-                else:
-                    output = result.stdout + result.stderr
-                    if not output.strip():
-                        output = "(No findings or output from scanner)"
-                    report_content.append(f"```text\n{output}\n```\n\n")
-                    self.terminal_queue.put(f"<span style='color:green;'>✅ Captured {scanner['name']} output.</span>")
-            
-            except FileNotFoundError:
-                self.terminal_queue.put(f"<span style='color:red;'>Error: `{scanner['command'].split()[0]}` command not found. Is {scanner['name']} installed and in your PATH?</span>")
-                report_content.append(f"**❌ ERROR: `{scanner['command'].split()[0]}` not found.**\n\n")
-            except Exception as e:
-                self.terminal_queue.put(f"<span style='color:red;'>An unexpected error occurred while running {scanner['name']}: {e}</span>")
-                report_content.append(f"**❌ ERROR: An unexpected error occurred: {e}**\n\n")
+        results = run_report_scanners(project_root, REPORT_SCANNERS, log=self.terminal_queue.put, cache=cache, solc_version=solc_version)
+        report_content = build_report_markdown(project_name, results)
 
         # Write the final consolidated report
         try:
             with open(report_path, 'w', errors='ignore') as f:
-                f.write("".join(report_content))
+                f.write(report_content)
             
             clickable_path = f"<a href='file:///{report_path}'>{report_path}</a>"
             self.terminal_queue.put(f"<hr><b style='color:lightgreen;'>🎉 Full Report Generated Successfully! 🎉</b>")
+            self.terminal_queue.put("Scanner times: " + ", ".join(f"{r['name']} {r['elapsed']:.1f}s" for r in results))
             self.terminal_queue.put(f"Report saved to: {clickable_path}")
 
         except Exception as e:
             self.terminal_queue.put(f"<span style='color:red;'>Error writing final report: {e}</span>")
 
     def generate_slither_exploit(self):
-        if self.slither_vuln_dropdown.currentIndex() < 0:
-            QMessageBox.warning(self, "No Vulnerability Selected", "Please select a vulnerability from the dropdown.")
+        data = self.selected_finding_item()
+        if data is None:
+            QMessageBox.warning(self, "No Vulnerability Selected", "Please select a vulnerability from the findings list.")
             return
 
-        data = self.slither_vuln_dropdown.currentData()
         if not data or not data.get('exploit'):
             QMessageBox.information(self, "No Exploit Available", "No automated PoC template is available for the selected finding.")
             return
@@ -1009,43 +1095,29 @@ class Application(QWidget):
         self.run_command(command, cwd=project_root)
 
     def _generate_contract_map_thread(self, target_path):
+        try:
+            Slither, SlitherError = load_slither()
+        except ImportError:
+            self.terminal_queue.put("<span style='color: red;'>Py-Slither is not installed. Please run 'pip install slither-analyzer'.</span>")
+            self.is_map_ready = False
+            return
         try:
             self.terminal_queue.put("Initializing Slither for contract mapping...")
-            slither_instance = Slither(target_path, crytic_compile_kwargs={'framework': 'foundry'})
+            build_hash = None
+            try:
+                export_path = get_build_export(target_path, log=self.terminal_queue.put)
+                build_hash = os.path.splitext(os.path.basename(export_path))[0]
+                # Another session that mapped the same build already holds a loaded instance.
+                slither_instance = self.services.slither_instances.get(build_hash, lambda: Slither(load_build_export(export_path)[0]))
+            except Exception as e:
+                self.terminal_queue.put(f"<span style='color:orange;'>Could not use shared build artifacts ({html.escape(str(e))}). Compiling directly...</span>")
+                build_hash = None
+                slither_instance = Slither(target_path, crytic_compile_kwargs={'framework': 'foundry'})
 
-            with self.map_lock:
-                self.contract_map_data = {}
-                project_root = self.get_project_root()
-                
-                valid_contracts = [c for c in slither_instance.contracts if not c.is_library and not c.is_interface]
-                if project_root: 
-                    valid_contracts = [c for c in valid_contracts if str(c.source_mapping.filename.absolute).startswith(project_root)]
-
-                for contract in valid_contracts:
-                    source_file_full_path = str(contract.source_mapping.filename.absolute)
-                    
-                    if project_root:
-                        relative_path = os.path.relpath(source_file_full_path, project_root).replace('\\', '/')
-                    else:
-                        relative_path = os.path.basename(source_file_full_path)
-                    
-                    contract_data = {"name": contract.name, "functions": [], "source_file_relative": relative_path}
-                    
-                    constructor = next((f for f in contract.functions_and_modifiers if f.is_constructor), None)
-                    if constructor:
-                         contract_data["functions"].append({
-                            "name": "constructor", "signature": constructor.signature_str, "visibility": "public", 
-                            "parameters": [{"name": p.name or f'param{i}', "type": str(p.type)} for i, p in enumerate(constructor.parameters)]
-                        })
-
-                    for func in contract.functions_and_modifiers:
-                        if func.is_constructor or func.visibility not in ['public', 'external']: continue
-                        contract_data["functions"].append({
-                            "name": func.name, "signature": func.signature_str, "visibility": str(func.visibility), 
-                            "parameters": [{"name": p.name or f'param{i}', "type": str(p.type)} for i, p in enumerate(func.parameters)]
-                        })
-
-                    self.contract_map_data[contract.name] = contract_data
+            with self.map_lock, self.services.slither_instances.lock_for(build_hash):
+                self.slither_instance = slither_instance
+                self.slither_build_hash = build_hash
+                self.contract_map_data = build_contract_map(slither_instance, self.get_project_root())
 
                 self.is_map_ready = True
                 self.terminal_queue.put("<span style='color: green;'><br>✅ Map generated. Exploit parameters updated.</span>")
@@ -1058,16 +1130,179 @@ class Application(QWidget):
             self.is_map_ready = False
 
     def update_output(self):
-        while not self.terminal_queue.empty():
-            try:
-                text = self.terminal_queue.get_nowait()
-                if text == "FILTER_AND_UPDATE_VULNS": self.filter_and_update_slither_dropdown()
-                elif text == "UPDATE_EXPLOIT_UI": self.update_exploit_params()
-                else: self.terminal_output.append(text)
-            except Exception: pass 
+        self.terminal_batcher.render(self.append_terminal_entry, self.handle_terminal_control)
+        # Output left over after the frame budget is rendered on the next frame.
+        return bool(self.terminal_batcher.pending)
+
+    def show_terminal_entry(self, entry):
+        """Renders an entry through the current filter and returns how many widget blocks it added."""
+        rendered = render_entry(entry, self.terminal_record_filter)
+        if not rendered:
+            return 0
+        document = self.terminal_output.document()
+        before = 0 if document.isEmpty() else document.blockCount()
+        self.terminal_output.append(rendered)
+        return document.blockCount() - before
+
+    def append_terminal_entry(self, entry):
+        self.search_index.add_entry(entry)
+        if self.history_view_page is not None:
+            # The widget shows an older page; new output is kept and shown on return to live output.
+            self.scrollback.append(entry, 0)
+            return
+        document = self.terminal_output.document()
+        spilled_blocks = self.scrollback.append(entry, self.show_terminal_entry(entry))
+        if spilled_blocks:
+            # Drop the spilled entries and any reloaded history from the top of the widget.
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.Start)
+            cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, self.history_blocks + spilled_blocks)
+            cursor.removeSelectedText()
+            self.history_blocks = 0
+            self.next_history_page = len(self.scrollback.pages) - 1
+
+    def on_terminal_scrolled(self, value):
+        scrollbar = self.terminal_output.verticalScrollBar()
+        if self.loading_history or value != scrollbar.minimum() or scrollbar.maximum() == 0 or self.next_history_page < 0:
+            return
+        self.load_older_terminal_output()
+
+    def load_older_terminal_output(self):
+        """Prepends the next older page from the session's spill file, keeping the view in place."""
+        entries = self.scrollback.load_page(self.next_history_page)
+        self.next_history_page -= 1
+        if not entries:
+            return
+        self.loading_history = True
+        try:
+            scrollbar = self.terminal_output.verticalScrollBar()
+            document = self.terminal_output.document()
+            before_blocks, before_maximum = document.blockCount(), scrollbar.maximum()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.Start)
+            cursor.insertHtml("<br>".join(filter(None, (render_entry(entry, self.terminal_record_filter) for entry in entries))))
+            cursor.insertBlock()
+            self.history_blocks += document.blockCount() - before_blocks
+            scrollbar.setValue(scrollbar.maximum() - before_maximum)
+        finally:
+            self.loading_history = False
+
+    def show_history_page(self, page_index):
+        """Replaces the widget with one spilled page; scrolling up from there loads the pages before it."""
+        self.history_view_page = page_index
+        self.live_output_button.show()
+        self.terminal_output.clear()
+        self.history_blocks = 0
+        self.next_history_page = page_index
+        self.load_older_terminal_output()
+
+    def last_loaded_entry(self):
+        if self.history_view_page is None:
+            return self.scrollback.spilled_count + len(self.scrollback.entries) - 1
+        return sum(count for _, _, count in self.scrollback.pages[:self.history_view_page + 1]) - 1
+
+    def first_loaded_entry(self):
+        """Number of the oldest scrollback entry currently shown in the widget."""
+        if self.next_history_page < len(self.scrollback.pages) - 1:
+            return sum(count for _, _, count in self.scrollback.pages[:self.next_history_page + 1])
+        return self.scrollback.spilled_count
+
+    def search_terminal_output(self, include_spilled=True):
+        query = self.terminal_search_input.text()
+        self.terminal_search_results.clear()
+        if len(query.strip()) < 2:
+            self.terminal_search_results.hide()
+            self.terminal_search_label.setText("")
+            return
+        start = time.monotonic()
+        hits, more = self.search_index.search(query, include_spilled=include_spilled)
+        elapsed = (time.monotonic() - start) * 1000
+        for line_no, text in hits:
+            item = QListWidgetItem(f"{line_no + 1}: {normalize_line(text)[:200]}")
+            item.setData(Qt.UserRole, line_no)
+            self.terminal_search_results.addItem(item)
+        backlog = self.search_index.backlog()
+        status = f"{len(hits)}{'+' if more else ''} hits in {elapsed:.0f} ms"
+        if not include_spilled and self.search_index.first_entry:
+            status += " in recent output, Enter searches all"
+        self.terminal_search_label.setText(status + (f" (indexing {backlog} batches...)" if backlog else ""))
+        self.terminal_search_results.setVisible(bool(hits))
+
+    def jump_to_terminal_line(self, line_no):
+        """Scrolls the terminal to a search hit, reloading spilled pages and clearing filters that hide it."""
+        hit = self.search_index.lines_between(line_no, line_no + 1)
+        if not hit or not normalize_line(hit[0][2]):
+            return
+        _, line, text = hit[0]
+        needle = normalize_line(text)
+        if self.terminal_record_filter and not isinstance(line, str) and not self.terminal_record_filter(line):
+            self.terminal_level_dropdown.setCurrentIndex(0)
+            self.terminal_source_dropdown.setCurrentIndex(0)
+        target_entry = self.search_index.entry_of(line_no)
+        if not self.first_loaded_entry() <= target_entry <= self.last_loaded_entry():
+            page_index = self.scrollback.page_of_entry(target_entry)
+            if page_index is None:
+                self.show_live_output()
+            else:
+                self.show_history_page(page_index)
+
+        # The widget has no line numbers, so find the hit by text: count how often the same text
+        # appears in visible lines before it and take that occurrence in the document.
+        occurrences = 0
+        for _, earlier_line, earlier_text in self.search_index.lines_between(self.search_index.entry_first_line[self.first_loaded_entry()], line_no):
+            if self.terminal_record_filter and not isinstance(earlier_line, str) and not self.terminal_record_filter(earlier_line):
+                continue
+            occurrences += normalize_line(earlier_text).count(needle)
+        pattern = QRegularExpression(r"\s+".join(QRegularExpression.escape(part) for part in needle.split(" ")))
+        document = self.terminal_output.document()
+        cursor = QTextCursor(document)
+        for _ in range(occurrences + 1):
+            cursor = document.find(pattern, cursor, QTextDocument.FindCaseSensitively)
+            if cursor.isNull():
+                return
+        self.terminal_output.setTextCursor(cursor)
+        self.terminal_output.ensureCursorVisible()
+
+    def handle_terminal_control(self, message):
+        try:
+            if message == "FILTER_AND_UPDATE_VULNS":
+                self.vuln_update_pending = False
+                self.refresh_findings_list()
+            elif message == "UPDATE_EXPLOIT_UI": self.update_exploit_params()
+            elif message == "UPDATE_TERMINAL_SOURCES": self.update_terminal_sources()
+        except Exception: pass
+
+    def register_terminal_source(self, source):
+        if source not in self.terminal_sources:
+            self.terminal_sources.add(source)
+            self.terminal_queue.put("UPDATE_TERMINAL_SOURCES")
+
+    def update_terminal_sources(self):
+        known = {self.terminal_source_dropdown.itemData(i) for i in range(self.terminal_source_dropdown.count())}
+        for source in sorted(self.terminal_sources - known):
+            self.terminal_source_dropdown.addItem(source, source)
+
+    def apply_terminal_filter(self):
+        """Re-renders the in-memory scrollback with the selected level and source filter."""
+        self.terminal_record_filter = make_record_filter(self.terminal_level_dropdown.currentData() or LEVEL_INFO,
+                                                         self.terminal_source_dropdown.currentData())
+        self.show_live_output()
+
+    def show_live_output(self):
+        """Shows the in-memory scrollback again, leaving the history view if a search jumped into one."""
+        self.history_view_page = None
+        self.live_output_button.hide()
+        self.terminal_output.clear()
+        self.history_blocks = 0
+        self.next_history_page = len(self.scrollback.pages) - 1
+        self.scrollback.replay(self.show_terminal_entry)
+        # A narrow filter can leave nothing to scroll; pull in older pages until there is.
+        while self.next_history_page >= 0 and self.terminal_output.verticalScrollBar().maximum() == 0:
+            self.load_older_terminal_output()
 
     def copy_terminal_output(self):
-        QApplication.clipboard().setText(self.terminal_output.toPlainText())
+        # Includes output that was already spilled to the session log.
+        QApplication.clipboard().setText("\n".join(entry_to_text(entry) for _, entry in self.scrollback.iter_entries()))
         self.terminal_queue.put("Terminal output copied to clipboard.")
 
     def _write_test_file(self, filename, content):
@@ -1093,23 +1328,73 @@ class Application(QWidget):
             self.terminal_queue.put(f"<span style='color: red;'>Error writing test file: {e}</span>")
             return None
 
-    def run_command(self, command, cwd=None):
-        def target():
-            try:
-                log_msg = f"<b>Executing:</b> <span style='color:#87CEEB;'>{command}</span>" + (f" in {cwd}" if cwd else "") + "\n"
-                self.terminal_queue.put(log_msg)
-
-                process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=cwd, bufsize=1, universal_newlines=True)
-                for line in iter(process.stdout.readline, ''):
-                    self.terminal_queue.put(html.escape(line).replace('\n', '<br>'))
-                process.wait()
-                if process.returncode != 0:
-                    self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {process.returncode}</span>")
-            except Exception as e:
-                self.terminal_queue.put(f"<span style='color:red;'>Error executing command: {e}</span>\n")
+    def run_command(self, command, cwd=None, cache_scanner=None, stream_findings=None):
+        # With cache_scanner set, output for unchanged sources is replayed from the scan cache.
+        # With stream_findings set to a scanner name, its findings are parsed from the live output.
+        tool = tool_for_command(command)
+        if stream_findings:
+            load_exploit_templates()
+        data = {"cache_scanner": cache_scanner, "solc_version": self.version_var.currentText(),
+                "use_cache": self.get_active_scan_cache() is not None, "stream_findings": stream_findings}
+        priority = PRIORITY_NAMES[self.job_priority_dropdown.currentText()]
+        busy = self.job_scheduler.running_counts().get(tool, 0)
+        if busy >= self.job_scheduler.limit_for(tool):
+            self.terminal_queue.put(f"<span style='color:orange;'>Queued: {busy} {html.escape(tool)} job(s) already running. <span style='color:#87CEEB;'>{html.escape(command)}</span> will start when a slot frees up.</span>")
+        self.job_scheduler.submit(command, cwd=cwd, tool=tool, priority=priority, data=data, group=self.session_id)
+
+    def _execute_job(self, job):
+        """Runs a queued command on a scheduler worker thread and streams its output to the terminal."""
+        command, cwd, data = job['command'], job['cwd'], job['data']
+        cache_scanner = data.get('cache_scanner')
+        cache = self.scan_cache if cache_scanner and data.get('use_cache') else None
+        parser = get_stream_parser(data.get('stream_findings'), self.file_to_contract) if data.get('stream_findings') else None
+        if parser:
+            self.reset_streamed_findings(parser.source)
+
+        source = job.get('tool') or tool_for_command(command)
+        self.register_terminal_source(source)
+
+        def on_line(line):
+            self.terminal_queue.put(log_record(source, line))
+            if parser:
+                self.publish_findings(parser.feed(line), parser.source)
 
-        threading.Thread(target=target, daemon=True).start()
+        try:
+            log_msg = f"<b>Executing:</b> <span style='color:#87CEEB;'>{command}</span>" + (f" in {cwd}" if cwd else "") + "\n"
+            self.terminal_queue.put(log_msg)
+
+            cache_key = cache.key_for(cwd, cache_scanner, command, data.get('solc_version')) if cache and cwd else None
+            cached = cache.get(cache_key) if cache_key else None
+            if cached:
+                self.terminal_queue.put("<span style='color:#87CEEB;'>♻️ Sources unchanged since the last run. Showing cached output.</span>")
+                for line in cached['output'].splitlines(True):
+                    self.terminal_queue.put(log_record(source, line))
+                    if parser:
+                        self.publish_findings(parser.feed(line), parser.source)
+                returncode = cached['returncode']
+            else:
+                limits = get_limits_for_command(command)
+                result = run_limited(command, cwd=cwd, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'], on_line=on_line)
+                returncode = result['returncode']
+                if result['truncated']:
+                    self.terminal_queue.put(f"<span style='color:orange;'><b>⚠️ Truncated:</b> {html.escape(result['truncated_reason'])}. The output above is partial.</span>")
+                elif cache_key and returncode != 127:
+                    cache.put(cache_key, {"returncode": returncode, "output": result['output']})
+            if parser:
+                self.publish_findings(parser.finish(), parser.source)
+            if returncode != 0:
+                self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {returncode}</span>")
+            return returncode
+        except Exception as e:
+            self.terminal_queue.put(f"<span style='color:red;'>Error executing command: {e}</span>\n")
+            raise
     
+    def attach_file_explorer_model(self):
+        self.fs_model.setRootPath(QDir.rootPath())
+        self.file_explorer.setModel(self.fs_model)
+        self.file_explorer.setRootIndex(self.fs_model.index(self.home_dir))
+        self.file_explorer.setColumnWidth(0, 250)
+
     def explorer_context_menu(self, position):
         index = self.file_explorer.indexAt(position)
         if not index.isValid(): return
@@ -1141,13 +1426,16 @@ class Application(QWidget):
     def on_file_explorer_activated(self, index):
         file_path = self.fs_model.filePath(index)
         if os.path.isfile(file_path) and file_path.endswith(('.sol', '.toml', '.json', '.js', '.ts')):
-            self.clear_output()
-            self.terminal_queue.put(f"<b>Displaying content for:</b> {os.path.basename(file_path)}\n")
             try:
-                with open(file_path, 'r', errors='ignore') as f:
-                    content = f.read()
-                self.terminal_queue.put(f"<pre>{html.escape(content)}</pre>")
-            except Exception as e: self.terminal_queue.put(f"<span style='color:red;'>Could not read file: {e}</span>")
+                viewer = FileViewerDialog(file_path, self)
+            except Exception as e:
+                self.terminal_queue.put(f"<span style='color:red;'>Could not read file: {e}</span>")
+                return
+            # Keep a reference until the viewer is closed; it is not modal.
+            self.file_viewers.append(viewer)
+            viewer.finished.connect(lambda _result, v=viewer: self.file_viewers.remove(v))
+            viewer.show()
+            self.terminal_queue.put(f"<b>Opened viewer for:</b> {os.path.basename(file_path)}")
 
     def select_project_folder(self):
         folder_name = QFileDialog.getExistingDirectory(self, "Select Project Folder", self.home_dir)
@@ -1157,6 +1445,7 @@ class Application(QWidget):
             self.clear_output()
             self.terminal_queue.put(f"<b>Selected Project:</b> {folder_name}\n")
             self.file_explorer.setRootIndex(self.fs_model.index(folder_name))
+            self.title_changed.emit(os.path.basename(os.path.normpath(folder_name)))
             
     def select_contract(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Select Contract", self.home_dir, "Solidity Files (*.sol)")
@@ -1166,11 +1455,12 @@ class Application(QWidget):
             self.clear_output()
             self.terminal_queue.put(f"<b>Selected Single File:</b> {filename}\n")
             self.file_explorer.setRootIndex(self.fs_model.index(os.path.dirname(filename)))
+            self.title_changed.emit(os.path.basename(filename))
             self.generate_contract_map()
     
-    def on_vulnerability_selected(self, index):
-        if self.slither_vuln_dropdown.currentIndex() >= 0:
-            data = self.slither_vuln_dropdown.itemData(index)
+    def on_vulnerability_selected(self, current, previous=None):
+        if current.isValid():
+            data = self.findings_model.item_at(current.row())
             if data:
                 self.generate_exploit_button.setEnabled(data.get('exploit') is not None)
                 self.update_exploit_params(data.get('finding'))
@@ -1232,9 +1522,7 @@ class Application(QWidget):
         
         if not finding_data: return
 
-        data_index = self.slither_vuln_dropdown.findText(self.slither_vuln_dropdown.currentText())
-        if data_index == -1: return
-        data = self.slither_vuln_dropdown.itemData(data_index)
+        data = self.selected_finding_item()
         if not data or not data.get('exploit'): return
 
         current_target_name = self.exploit_param_widgets.get('target_contract_name').currentText()
@@ -1269,33 +1557,105 @@ class Application(QWidget):
             return
             
         self.clear_output()
+        load_exploit_templates()
         self.terminal_queue.put(f"<b>Starting Slither scan for: {target_path}</b>\n")
+        custom_detector_path = self.custom_detector_path_input.text().strip()
+        # Custom detectors can change without any Solidity source changing, so they bypass the cache.
+        cache = None if custom_detector_path else self.get_active_scan_cache()
+        solc_version = self.version_var.currentText()
+        in_process = self.inprocess_slither_checkbox.isChecked()
         def scan_thread():
             try:
-                self.terminal_queue.put("<b>Running Slither... (This may take a moment)</b>\n")
                 results_dir = os.path.dirname(target_path) if os.path.isfile(target_path) else target_path
                 json_path = os.path.join(results_dir, "slither_results.json")
                 
-                command = f"slither ." if self.get_project_root() else f"slither {shlex.quote(target_path)}"
-                
-                custom_detector_path = self.custom_detector_path_input.text().strip()
-                if custom_detector_path:
-                    command += f" --detect {shlex.quote(custom_detector_path)}"
+                scan_target = "." if self.get_project_root() else shlex.quote(target_path)
+                scan_options = f" --detect {shlex.quote(custom_detector_path)}" if custom_detector_path else ""
                 
-                command += f" --json {shlex.quote(json_path)}"
-                
-                cwd = self.get_project_root() or os.path.dirname(target_path)
-                process = subprocess.run(command, shell=True, cwd=cwd, capture_output=True, text=True)
+                base_command = f"slither {scan_target}{scan_options}"
+                self.reset_streamed_findings('slither')
+                cache_key = cache.key_for(target_path, 'slither', base_command, solc_version) if cache else None
+                cached = cache.get(cache_key) if cache_key else None
+
+                if cached:
+                    self.terminal_queue.put("<span style='color:#87CEEB;'>♻️ Sources unchanged since the last scan. Using cached Slither results.</span>\n")
+                    output = cached['output']
+                    slither_findings = cached['results']
+                else:
+                    plan = self._plan_slither_result_merge(target_path, base_command, solc_version) if self.get_project_root() else None
+                    changed = plan['changed'] if plan else None
+                    slither_findings = None
+                    if changed is not None and not changed:
+                        self.terminal_queue.put("<span style='color:#87CEEB;'>♻️ No import closure changed since the last scan. Reusing previous findings.</span>\n")
+                        output = ""
+                        slither_findings = plan['previous']
+                    else:
+                        if changed:
+                            self.terminal_queue.put(f"<b>{len(changed)} of {len(plan['hashes'])} files changed their import closure.</b> Slither still analyzes the whole project; "
+                                                    "only findings in these files are taken from this run and merged with the previous results.")
+                            changed_contracts = sorted(name for name, data in self.contract_map_data.items() if data.get('source_file_relative') in changed)
+                            if changed_contracts:
+                                self.terminal_queue.put(f"   - Affected contracts: {html.escape(', '.join(changed_contracts))}")
+                            scan_options += f" --include-paths {shlex.quote(include_paths_arg(changed))}"
+
+                        if in_process:
+                            self.terminal_queue.put("<b>Running Slither detectors in-process... (This may take a moment)</b>\n")
+                            try:
+                                slither_findings = self._run_slither_detectors_in_process(target_path, custom_detector_path, changed)
+                                if changed:
+                                    slither_findings['results']['detectors'] = [r for r in slither_findings['results']['detectors'] if result_files(r) & changed]
+                                output = f"{len(slither_findings['results']['detectors'])} detector results from the in-process run."
+                            except Exception as e:
+                                self.terminal_queue.put(f"<span style='color:orange;'>In-process detectors failed ({html.escape(str(e))}). Falling back to the Slither CLI.</span>")
+                                slither_findings = None
+
+                        if slither_findings is None:
+                            # Analyze the shared compilation export so Slither does not run `forge build` again.
+                            try:
+                                scan_target = shlex.quote(get_build_export(target_path, log=self.terminal_queue.put))
+                            except Exception as e:
+                                self.terminal_queue.put(f"<span style='color:orange;'>Could not use shared build artifacts ({html.escape(str(e))}). Slither will compile the project itself.</span>")
+                            command = f"slither {scan_target}{scan_options} --json {shlex.quote(json_path)}"
+
+                            self.terminal_queue.put("<b>Running Slither... (This may take a moment)</b>\n")
+                            # Slither refuses to overwrite an existing JSON file, which would leave stale results behind.
+                            if os.path.exists(json_path):
+                                os.remove(json_path)
+                            cwd = self.get_project_root() or os.path.dirname(target_path)
+                            # Findings are parsed from the live output and shown before the JSON file exists.
+                            parser = get_stream_parser('slither', self.file_to_contract)
+                            limits = get_limits('slither')
+                            process = run_limited(command, cwd=cwd, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'],
+                                                  on_line=lambda line: self.publish_findings(parser.feed(line), 'slither'))
+                            output = process['output']
+                            if process['truncated']:
+                                self.terminal_queue.put(f"<span style='color:orange;'><b>⚠️ Truncated:</b> {html.escape(process['truncated_reason'])}. Showing the findings streamed so far.</span>")
+
+                            if os.path.exists(json_path):
+                                with open(json_path) as f:
+                                    slither_findings = json.load(f)
+
+                        if slither_findings is not None and changed:
+                            slither_findings = merge_slither_results(plan['previous']['results']['detectors'], slither_findings, changed)
+
+                    if slither_findings is not None:
+                        if plan and slither_findings.get('success'):
+                            save_scan_state(target_path, {"command": base_command, "solc_version": solc_version,
+                                                                 "closure_hashes": plan['hashes'], "results": slither_findings})
+                        if cache_key:
+                            cache.put(cache_key, {"output": output, "results": slither_findings})
                 
-                self.terminal_queue.put(f"<pre>{html.escape(process.stdout + process.stderr)}</pre>")
-
-                if os.path.exists(json_path):
-                    with open(json_path) as f:
-                        slither_findings = json.load(f)
-                    
-                    self.slither_findings = self.parse_slither_json(slither_findings)
-                    self.process_slither_findings()
-                    self.terminal_queue.put("FILTER_AND_UPDATE_VULNS")
+                self.register_terminal_source('slither')
+                for line in output.splitlines():
+                    self.terminal_queue.put(log_record('slither', line))
+
+                if slither_findings is not None:
+                    # The JSON result is authoritative and replaces the findings streamed during the scan.
+                    parsed_findings = self.parse_slither_json(slither_findings)
+                    with self.findings_lock:
+                        self.slither_findings = parsed_findings
+                        self.process_slither_findings()
+                    self.request_vuln_update()
                     self.terminal_queue.put("<span style='color: green;'>✅ Scan complete. Vulnerabilities loaded.</span>\n")
                 else:
                     self.terminal_queue.put("<span style='color: red;'><b>Scan failed.</b> Slither JSON results file not created. Check Slither output for errors.</span>")
@@ -1303,84 +1663,136 @@ class Application(QWidget):
                 self.terminal_queue.put(f"<span style='color: red;'>An unexpected error occurred during Slither scan: {e}</span>")
         threading.Thread(target=scan_thread, daemon=True).start()
 
+    def _run_slither_detectors_in_process(self, target_path, custom_detector_path=None, changed=None):
+        """Runs detectors on the mapped Slither instance, rebuilding it from the shared export only if sources changed."""
+        def on_results(results):
+            if changed:
+                results = [r for r in results if result_files(r) & changed]
+            self.publish_findings(parse_slither_findings({"results": {"detectors": results}}, self.contract_map_data), 'slither')
+
+        build_hash = get_build_hash(target_path)
+        with self.map_lock:
+            if self.slither_instance is None or self.slither_build_hash != build_hash:
+                self.terminal_queue.put("Mapped Slither instance is missing or stale. Loading the current build...")
+                Slither, _ = load_slither()
+                export_path = get_build_export(target_path, log=self.terminal_queue.put)
+                self.slither_instance = self.services.slither_instances.get(build_hash, lambda: Slither(load_build_export(export_path)[0]))
+                self.slither_build_hash = build_hash
+            # The instance may be shared with other sessions scanning the same build.
+            with self.services.slither_instances.lock_for(build_hash):
+                return run_detectors_in_process(self.slither_instance, custom_detector_path, on_results)
+
+    def _plan_slither_result_merge(self, project_root, base_command, solc_version):
+        """
+        Compares each file's transitive import closure with the last successful scan. 'changed' is
+        None when the full results are used, otherwise the set of files whose results are replaced
+        (empty when the previous results can be reused without running Slither).
+        """
+        graph = build_import_graph(project_root)
+        hashes = closure_hashes(project_root, graph)
+        plan = {"hashes": hashes, "changed": None, "previous": None}
+
+        state = load_scan_state(project_root)
+        if not state or state.get('command') != base_command or state.get('solc_version') != solc_version:
+            return plan
+
+        changed = changed_files(state.get('closure_hashes', {}), hashes)
+        # Past half the project the merge keeps little and the include list gets unwieldy.
+        if len(changed) > len(hashes) // 2:
+            return plan
+        plan['changed'] = changed
+        plan['previous'] = state['results']
+        return plan
+
     def parse_slither_json(self, data):
-        findings = []
         if not data.get("success", False):
             self.terminal_queue.put("<span style='color:orange;'>Slither analysis reported issues. Results may be incomplete.</span>")
-            if "results" not in data or "detectors" not in data["results"]:
-                 return []
-        
-        for result in data["results"]["detectors"]:
-            impact = result.get('impact', 'Informational')
-            for element in result.get('elements', []):
-                finding = {
-                    'check': result['check'], 
-                    'description': result['description'], 
-                    'impact': impact
-                }
-                if element.get('type') == 'function':
-                    finding['function_name'] = element.get('name', '')
-                    finding['contract'] = element.get('contract', {}).get('name', 'Unknown')
-                elif element.get('type') == 'contract':
-                    finding['function_name'] = '(contract-level)'
-                    finding['contract'] = element.get('name', 'Unknown')
-                else:
-                    source_file = element.get('source_mapping', {}).get('filename_relative', '')
-                    contract_name = 'Unknown'
-                    for c_name, c_data in self.contract_map_data.items():
-                        if c_data.get('source_file_relative') == source_file:
-                            contract_name = c_name
-                            break
-                    finding['function_name'] = '(file-level)'
-                    finding['contract'] = contract_name
-
-                findings.append(finding)
-        return findings
+        return parse_slither_findings(data, self.contract_map_data)
 
-    def process_slither_findings(self):
-        self.processed_slither_findings = []
-        impact_order = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3, "Informational": 4}
-        for finding in self.slither_findings:
-            display_impact = finding.get("impact", "Informational").capitalize()
-            exploit = next((ex for ex in EXPLOIT_TEMPLATES.values() if finding['check'] in ex.get("detector_ids", [])), None)
-            if exploit and 'impact' in exploit: display_impact = exploit['impact']
-            self.processed_slither_findings.append({'finding': finding, 'exploit': exploit, 'display_impact': display_impact})
-        
-        self.processed_slither_findings.sort(key=lambda x: (impact_order.get(x['display_impact'], 99), x['finding']['check']))
+    def file_to_contract(self, source_file):
+        source_file = source_file.replace('\\', '/')
+        for c_name, c_data in list(self.contract_map_data.items()):
+            if c_data.get('source_file_relative') == source_file:
+                return c_name
+        return None
 
-    def filter_and_update_slither_dropdown(self):
-        selected_impact = self.impact_filter_dropdown.currentText()
-        filtered_list = self.processed_slither_findings if selected_impact == "All" else [f for f in self.processed_slither_findings if f['display_impact'] == selected_impact]
-        self.update_slither_dropdown(filtered_list)
+    def publish_findings(self, findings, source):
+        """Adds findings parsed while a scanner is still running and schedules a findings list refresh."""
+        if not findings:
+            return
+        processed = [self.process_finding(finding) for finding in findings]
+        with self.findings_lock:
+            if source == 'slither':
+                self.slither_findings.extend(findings)
+            else:
+                self.tool_findings.extend(findings)
+            self.processed_slither_findings.extend(processed)
+            self.pending_findings_delta.extend(processed)
+        self.request_vuln_update()
+
+    def reset_streamed_findings(self, source):
+        with self.findings_lock:
+            if source == 'slither':
+                self.slither_findings = []
+            else:
+                self.tool_findings = [f for f in self.tool_findings if f.get('source') != source]
+            self.process_slither_findings()
+        self.request_vuln_update()
+
+    def request_vuln_update(self):
+        # Many findings can arrive between two timer ticks; the list is updated once per tick.
+        if not self.vuln_update_pending:
+            self.vuln_update_pending = True
+            self.terminal_queue.put("FILTER_AND_UPDATE_VULNS")
+
+    def process_finding(self, finding):
+        display_impact = finding.get("impact", "Informational").capitalize()
+        exploit = next((ex for ex in get_exploit_templates().values() if finding['check'] in ex.get("detector_ids", [])), None)
+        if exploit and 'impact' in exploit: display_impact = exploit['impact']
+        return {'finding': finding, 'exploit': exploit, 'display_impact': display_impact}
 
-    def update_slither_dropdown(self, findings_to_display):
-        dropdown = self.slither_vuln_dropdown
-        dropdown.blockSignals(True)
-        dropdown.clear()
-        
-        if not findings_to_display:
-            dropdown.addItem("No findings match filter")
-            dropdown.setEnabled(False)
+    def process_slither_findings(self):
+        # Replaces every finding; the model sorts them when the list is refreshed.
+        self.processed_slither_findings = [self.process_finding(f) for f in self.slither_findings + self.tool_findings]
+        self.pending_findings_delta = []
+        self.findings_reset_pending = True
+
+    def refresh_findings_list(self):
+        """Applies findings queued by scanner threads to the list model on the GUI thread."""
+        with self.findings_lock:
+            reset, self.findings_reset_pending = self.findings_reset_pending, False
+            delta, self.pending_findings_delta = self.pending_findings_delta, []
+            items = list(self.processed_slither_findings) if reset else None
+        selected = self.selected_finding_item()
+        if reset:
+            self.findings_model.set_items(items)
+            self.restore_finding_selection(selected)
         else:
-            for item in findings_to_display:
-                finding = item['finding']
-                impact = item['display_impact']
-                
-                poc_ready_signal = ""
-                if item.get('exploit'):
-                    poc_ready_signal = "[PoC Ready] "
-
-                prefix = f"[{impact.upper()}] "
-                location_name = f"{finding.get('contract', 'Unknown')}.{finding.get('function_name', '')}"
-                if ".(" in location_name:
-                    location_name = finding.get('contract', 'Unknown')
-
-                display_text = f"{poc_ready_signal}{prefix}{finding['check']} in {location_name}"
-                dropdown.addItem(display_text, userData=item)
-            dropdown.setEnabled(True)
-            
-        dropdown.blockSignals(False)
-        if dropdown.count() > 0: self.on_vulnerability_selected(0)
+            self.findings_model.add_items(delta)
+        if self.findings_model.rowCount() and not self.slither_vuln_list.currentIndex().isValid():
+            self.slither_vuln_list.setCurrentIndex(self.findings_model.index(0))
+        self.update_findings_count()
+
+    def filter_findings_list(self):
+        selected = self.selected_finding_item()
+        self.findings_model.set_filter(self.impact_filter_dropdown.currentText(), self.findings_filter_input.text())
+        self.restore_finding_selection(selected)
+        self.update_findings_count()
+
+    def restore_finding_selection(self, item):
+        row = self.findings_model.row_of(item)
+        if row >= 0:
+            self.slither_vuln_list.setCurrentIndex(self.findings_model.index(row))
+        elif self.findings_model.rowCount():
+            self.slither_vuln_list.setCurrentIndex(self.findings_model.index(0))
+
+    def update_findings_count(self):
+        shown, total = self.findings_model.rowCount(), self.findings_model.total_count()
+        self.findings_count_label.setText(f"{shown} of {total} findings" if total else "No findings yet")
+
+    def selected_finding_item(self):
+        index = self.slither_vuln_list.currentIndex()
+        return self.findings_model.item_at(index.row()) if index.isValid() else None
 
     def generate_contract_map(self):
         self.clear_output()
@@ -1394,6 +1806,7 @@ class Application(QWidget):
             return
             
         self.is_map_ready = False
+        load_exploit_templates()
         self.terminal_queue.put(f"<b>Mapping {os.path.basename(target_path)}...</b> This might take a moment.\n")
         threading.Thread(target=self._generate_contract_map_thread, args=(target_path,), daemon=True).start()
 
@@ -1480,6 +1893,7 @@ class Application(QWidget):
         threading.Thread(target=self._initialize_foreign_project_thread, daemon=True).start()
 
     def _initialize_foreign_project_thread(self):
+        import toml
         project_root = self.get_project_root()
         self.terminal_queue.put("<b>🤖 Starting Foreign Project Initialization...</b>")
         
@@ -1653,6 +2067,7 @@ class Application(QWidget):
         threading.Thread(target=self._run_coverage_with_fix_thread, daemon=True).start()
 
     def _run_coverage_with_fix_thread(self):
+        import toml
         project_root = self.get_project_root()
         toml_path = os.path.join(project_root, 'foundry.toml')
         original_toml_content = None
@@ -1755,6 +2170,20 @@ class Application(QWidget):
 
     def clear_output(self):
         self.terminal_output.clear()
+        self.scrollback.clear()
+        self.search_index.clear()
+        self.history_blocks = 0
+        self.next_history_page = -1
+        self.history_view_page = None
+        self.live_output_button.hide()
+
+    def release(self):
+        """Frees the terminal history and search index once the session's tab is closed."""
+        self.services.unregister_session(self.session_id)
+        for viewer in list(self.file_viewers):
+            viewer.close()
+        self.scrollback.clear()
+        self.search_index.close()
 
     def change_solc_version(self):
         self.clear_output()
@@ -1784,12 +2213,52 @@ class Application(QWidget):
 
     def run_mythril_scan(self):
         self.clear_output()
-        if self.selected_contract:
+        project_root = self.get_project_root()
+        if project_root and not self.selected_contract:
+            if not self.is_map_ready:
+                self.terminal_queue.put("<span style='color: orange;'>Project-wide Mythril needs the contract map. Run 'Generate/Refresh Project Map' first, or select a single contract file.</span>")
+                return
+            with self.map_lock:
+                contracts = get_deployable_contracts(self.contract_map_data)
+            threading.Thread(target=self._run_mythril_project_thread, args=(project_root, contracts, self.version_var.currentText()), daemon=True).start()
+        elif self.selected_contract:
             self.terminal_queue.put("<b>Running Mythril analysis...</b>")
             self.run_command(f"myth analyze {shlex.quote(self.selected_contract)}")
         else:
             self.terminal_queue.put("<span style='color: orange;'>Mythril analysis requires a single contract file to be selected.</span>")
 
+    def _run_mythril_project_thread(self, project_root, contracts, solc_version):
+        if not contracts:
+            self.terminal_queue.put("<span style='color: orange;'>No deployable contracts found in the project map.</span>")
+            return
+        workers = min(len(contracts), os.cpu_count() or 1)
+        self.terminal_queue.put(f"<b>🚀 Running Mythril on {len(contracts)} contracts with {workers} workers...</b>")
+        try:
+            start = time.monotonic()
+            results, issues = run_mythril_project(project_root, contracts, log=self.terminal_queue.put, max_workers=workers, solc_version=solc_version)
+        except Exception as e:
+            self.terminal_queue.put(f"<span style='color:red;'>Project-wide Mythril failed: {e}</span>")
+            return
+
+        rows = "".join(
+            f"<tr><td>{html.escape(r['contract'])}</td><td>{html.escape(r['file'])}</td><td>{html.escape(str(r['solc_version'] or '-'))}</td>"
+            f"<td>{'error' if r['error'] else 'truncated' if r['truncated'] else 'ok'}</td><td>{len(r['issues'])}</td><td>{r['elapsed']:.1f}s</td></tr>"
+            for r in results)
+        self.terminal_queue.put("<hr><b>Per-contract results</b><table border='1' cellpadding='3'>"
+                                "<tr><th>Contract</th><th>File</th><th>solc</th><th>Status</th><th>Issues</th><th>Time</th></tr>"
+                                f"{rows}</table>")
+
+        if issues:
+            self.terminal_queue.put(f"<hr><b>Aggregated Mythril findings ({len(issues)})</b>")
+            for issue in issues:
+                color = {'High': 'red', 'Medium': 'orange'}.get(issue.get('severity'), '#87CEEB')
+                location = f"{issue.get('filename', '')}:{issue.get('lineno', '?')}"
+                self.terminal_queue.put(f"<span style='color:{color};'>[{html.escape(str(issue.get('severity')))}] SWC-{html.escape(str(issue.get('swc-id')))} "
+                                        f"{html.escape(str(issue.get('title')))}</span> in <b>{html.escape(issue['analyzed_contract'])}</b>."
+                                        f"{html.escape(str(issue.get('function', '')))} ({html.escape(location)})")
+        findings_path = os.path.join(project_root, SCANNER_OUTPUT_DIR, MYTHRIL_OUTPUT_DIR, 'findings.json')
+        self.terminal_queue.put(f"<span style='color: green;'>✅ Mythril finished in {time.monotonic() - start:.1f}s. {len(issues)} findings saved to {html.escape(findings_path)}</span>")
+
     def run_solcscan_scan(self):
         self.clear_output()
         if self.selected_contract:
@@ -1811,7 +2280,7 @@ class Application(QWidget):
         self.clear_output()
         if project_root:
             self.terminal_queue.put("<b>Running Wake analysis...</b>")
-            self.run_command("wake detect all", cwd=project_root)
+            self.run_command("wake detect all", cwd=project_root, cache_scanner="wake", stream_findings="wake")
         else:
             self.terminal_queue.put("<span style='color: orange;'>Wake analysis requires a project to be selected.</span>")
 
@@ -1820,11 +2289,80 @@ class Application(QWidget):
         self.clear_output()
         if project_root:
             self.terminal_queue.put("<b>Running Aderyn analysis...</b>")
-            self.run_command("aderyn", cwd=project_root)
+            # --stdout prints the markdown report as it is produced so findings can be streamed.
+            self.run_command("aderyn --stdout", cwd=project_root, stream_findings="aderyn")
         else:
             self.terminal_queue.put("<span style='color: orange;'>Aderyn analysis requires a project to be selected.</span>")
 
 
+class Application(QWidget):
+    """Station window: one tab per project session, all sharing the job workers and caches."""
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Smart Contract Vulnerability Scanner - The Six-Shooter")
+        self.setGeometry(100, 100, 1800, 1000)
+
+        self.setStyleSheet("""
+            QWidget { background-color: #0d0d0d; color: #e0e0e0; font-family: 'monospace'; }
+            QGroupBox { font-weight: bold; border: 1px solid #444; border-radius: 5px; margin-top: 10px; }
+            QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 3px; }
+            QPushButton { background-color: #333; border: 1px solid #555; padding: 5px; border-radius: 3px; }
+            QPushButton:hover { background-color: #454545; }
+            QPushButton:pressed { background-color: #222; }
+            QComboBox, QLineEdit { background-color: #222; border: 1px solid #555; padding: 3px; }
+            QTextEdit, QTextBrowser { background-color: #1a1a1a; border: 1px solid #555; }
+            QTabBar::tab { background-color: #222; border: 1px solid #444; padding: 5px 12px; }
+            QTabBar::tab:selected { background-color: #333; }
+        """)
+
+        self.services = StationServices()
+        self.job_scheduler = self.services.job_scheduler
+
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(4, 4, 4, 4)
+        self.session_tabs = QTabWidget(self)
+        self.session_tabs.setTabsClosable(True)
+        self.session_tabs.setMovable(True)
+        self.session_tabs.tabCloseRequested.connect(self.close_session)
+        new_session_button = QPushButton("+ New Session")
+        new_session_button.setToolTip("Audit another project side by side. Sessions share the job workers and caches.")
+        new_session_button.clicked.connect(self.new_session)
+        self.session_tabs.setCornerWidget(new_session_button, Qt.TopRightCorner)
+        main_layout.addWidget(self.session_tabs)
+
+        first_session = self.new_session()
+        # Jobs left over from the last run are resumed once a session exists to show their output.
+        resumed_jobs = self.services.start()
+        if resumed_jobs:
+            load_exploit_templates()
+            first_session.terminal_queue.put(f"<span style='color:orange;'>Resuming {len(resumed_jobs)} unfinished job(s) from the last session:</span>")
+            for job in resumed_jobs:
+                first_session.terminal_queue.put(f"   - <span style='color:#87CEEB;'>{html.escape(job['command'])}</span>")
+
+    def new_session(self):
+        session = ScannerSession(self.services, self)
+        index = self.session_tabs.addTab(session, f"Session {self.session_tabs.count() + 1}")
+        session.title_changed.connect(lambda title, s=session: self.session_tabs.setTabText(self.session_tabs.indexOf(s), title))
+        self.session_tabs.setCurrentIndex(index)
+        return session
+
+    def close_session(self, index):
+        if self.session_tabs.count() == 1:
+            return
+        session = self.session_tabs.widget(index)
+        pending = self.job_scheduler.pending(session.session_id)
+        if pending:
+            reply = QMessageBox.question(self, "Close Session",
+                                         f"{len(pending)} job(s) of this session are queued or running. Close it anyway?\n"
+                                         "Queued jobs are cancelled; running jobs finish in the background.")
+            if reply != QMessageBox.Yes:
+                return
+        self.session_tabs.removeTab(index)
+        session.release()
+        session.deleteLater()
+
+
 if __name__ == "__main__":
     if sys.platform.startswith('linux'):
         if 'WAYLAND_DISPLAY' in os.environ and 'QT_QPA_PLATFORM' not in os.environ:
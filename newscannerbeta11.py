@@ -12,7 +12,6 @@ from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QP
 
 import shlex
 import html
-from queue import Queue
 import threading
 import re
 import shutil
@@ -36,6 +35,12 @@ except ImportError:
     print("Warning: exploit_db.py not found. Exploit generation will be limited.")
     EXPLOIT_TEMPLATES = {}
 
+from process_limits import get_limits_for_command, run_limited
+from terminal_log import TerminalBatcher, log_record, render_entry
+from signal_queue import SignalingQueue, QueueDrainer
+from transaction_feed import (TransactionFeedBuffer, format_feed_event, FEED_RENDER_BATCH, FEED_MAX_LINES,
+                              POLICY_NAMES)
+
 class Application(QWidget):
     def __init__(self):
         super().__init__()
@@ -67,8 +72,9 @@ class Application(QWidget):
         self.processed_slither_findings = []
         self.selected_project_path = None
         self.selected_contract = None
-        self.terminal_queue = Queue()
-        self.transaction_feed_queue = Queue()
+        self.terminal_queue = SignalingQueue()
+        self.terminal_batcher = TerminalBatcher(self.terminal_queue)
+        self.transaction_feed_queue = TransactionFeedBuffer()
         self.is_map_ready = False
         self.map_lock = threading.Lock()
         self.monitoring_active = False
@@ -117,9 +123,26 @@ class Application(QWidget):
 
         transaction_group = QGroupBox("Live Transaction Feed")
         transaction_layout = QVBoxLayout()
+        feed_controls_layout = QHBoxLayout()
+        feed_controls_layout.addWidget(QLabel("On overflow:"))
+        self.feed_policy_dropdown = QComboBox()
+        for policy, name in POLICY_NAMES.items():
+            self.feed_policy_dropdown.addItem(name, policy)
+        self.feed_policy_dropdown.currentIndexChanged.connect(self.change_feed_policy)
+        feed_controls_layout.addWidget(self.feed_policy_dropdown)
+        self.feed_stats_label = QLabel(self.transaction_feed_queue.stats_text())
+        feed_controls_layout.addWidget(self.feed_stats_label, 1)
+        transaction_layout.addLayout(feed_controls_layout)
         self.transaction_feed_output = QTextBrowser(self)
         self.transaction_feed_output.setReadOnly(True)
+        # The widget drops its oldest lines itself, so a long session does not grow the document.
+        self.transaction_feed_output.document().setMaximumBlockCount(FEED_MAX_LINES)
         transaction_layout.addWidget(self.transaction_feed_output)
+        # Refreshes the rate once the feed goes quiet; only runs while the rate is non-zero.
+        self.feed_stats_timer = QTimer(self)
+        self.feed_stats_timer.setSingleShot(True)
+        self.feed_stats_timer.setInterval(1000)
+        self.feed_stats_timer.timeout.connect(self.update_feed_stats)
         transaction_group.setLayout(transaction_layout)
         right_splitter.addWidget(transaction_group)
 
@@ -129,14 +152,10 @@ class Application(QWidget):
         main_layout.addWidget(main_splitter)
         self.setLayout(main_layout)
 
-        # --- Timers for UI Updates ---
-        self.analysis_timer = QTimer(self)
-        self.analysis_timer.timeout.connect(self.update_analysis_output)
-        self.analysis_timer.start(100)
-        
-        self.transaction_timer = QTimer(self)
-        self.transaction_timer.timeout.connect(self.update_transaction_feed)
-        self.transaction_timer.start(100)
+        # --- Event-driven UI Updates ---
+        # Workers wake the GUI through the queues; nothing runs while both are idle.
+        self.analysis_drainer = QueueDrainer(self.terminal_queue, self.update_analysis_output, parent=self)
+        self.transaction_drainer = QueueDrainer(self.transaction_feed_queue, self.update_transaction_feed, parent=self)
 
     def setup_left_panel(self):
         # --- Live Analysis & Monitoring Group ---
@@ -244,30 +263,46 @@ class Application(QWidget):
         self.right_panel_layout.addWidget(explorer_group, 1)
 
     def update_analysis_output(self):
-        while not self.terminal_queue.empty():
-            self.terminal_output.append(self.terminal_queue.get_nowait())
+        self.terminal_batcher.render(lambda entry: self.terminal_output.append(render_entry(entry)))
+        return bool(self.terminal_batcher.pending)
 
     def update_transaction_feed(self):
-        while not self.transaction_feed_queue.empty():
-            self.transaction_feed_output.append(self.transaction_feed_queue.get_nowait())
+        # Renders at most one batch per frame as a single append; the buffer absorbs anything faster.
+        # Each event is its own block so the widget's block limit counts events.
+        events = self.transaction_feed_queue.drain(FEED_RENDER_BATCH)
+        if events:
+            self.transaction_feed_output.append("".join(f"<div>{format_feed_event(event)}</div>" for event in events))
+        self.update_feed_stats()
+        return not self.transaction_feed_queue.empty()
+
+    def update_feed_stats(self):
+        self.feed_stats_label.setText(self.transaction_feed_queue.stats_text())
+        if self.transaction_feed_queue.rate() > 0:
+            self.feed_stats_timer.start()
+
+    def change_feed_policy(self, index):
+        self.transaction_feed_queue.set_policy(self.feed_policy_dropdown.itemData(index))
+        self.update_feed_stats()
 
     def run_command(self, command, cwd=None, on_success_callback=None):
         def target():
             try:
                 log_msg = f"<b>Executing:</b> <span style='color:#87CEEB;'>{command}</span>" + (f" in {cwd}" if cwd else "") + "\n"
                 self.terminal_queue.put(log_msg)
+                source = command.split()[0] if command.split() else command
                 # Use shell=True for complex commands, especially with npm/npx
-                process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=cwd, bufsize=1, universal_newlines=True)
-                
-                for line in iter(process.stdout.readline, ''):
-                    self.terminal_queue.put(html.escape(line).replace('\n', '<br>'))
-                process.wait()
-
-                if process.returncode == 0:
+                limits = get_limits_for_command(command)
+                result = run_limited(command, cwd=cwd, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'],
+                                     on_line=lambda line: self.terminal_queue.put(log_record(source, line)))
+
+                if result['truncated']:
+                    # A partial run must not trigger follow-up steps that expect a finished command.
+                    self.terminal_queue.put(f"<span style='color:orange;'><b>⚠️ Truncated:</b> {html.escape(result['truncated_reason'])}. The output above is partial.</span>")
+                elif result['returncode'] == 0:
                     if on_success_callback:
                         on_success_callback()
                 else:
-                    self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {process.returncode}</span>")
+                    self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {result['returncode']}</span>")
             except Exception as e:
                 self.terminal_queue.put(f"<span style='color:red;'>Error executing command: {e}</span><br><pre>{traceback.format_exc()}</pre>")
         threading.Thread(target=target, daemon=True).start()
@@ -502,6 +537,8 @@ class Application(QWidget):
         self.terminal_output.clear()
         if hasattr(self, 'transaction_feed_output'):
             self.transaction_feed_output.clear()
+            self.transaction_feed_queue.clear()
+            self.update_feed_stats()
         
     def run_forge_build(self):
         project_root = self.get_project_root()
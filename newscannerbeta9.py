@@ -7,9 +7,7 @@ from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPu
 
 import shlex
 import html
-from queue import Queue
 import threading
-from PyQt5.QtCore import QTimer
 import re
 import shutil
 
@@ -26,6 +24,10 @@ except ImportError:
     print("Warning: exploit_db.py not found. Exploit generation will be limited.")
     EXPLOIT_TEMPLATES = {}
 
+from process_limits import get_limits_for_command, run_limited
+from terminal_log import log_record, render_entry
+from signal_queue import SignalingQueue, QueueDrainer
+
 
 # =================================================================================
 # TROPHY EXPLOIT DEFINITIONS
@@ -500,7 +502,7 @@ class Application(QWidget):
         self.processed_slither_findings = []
         self.selected_project_path = None
         self.selected_contract = None
-        self.terminal_queue = Queue()
+        self.terminal_queue = SignalingQueue()
         self.is_map_ready = False
         self.map_lock = threading.Lock()
 
@@ -549,9 +551,8 @@ class Application(QWidget):
         main_layout.addWidget(main_splitter)
         self.setLayout(main_layout)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_output)
-        self.timer.start(100)
+        # Output is drained when workers post to the queue instead of polling it on a timer.
+        self.output_drainer = QueueDrainer(self.terminal_queue, self.update_output, parent=self)
 
     def setup_left_panel(self):
         single_file_group = QGroupBox("Single File Analysis")
@@ -953,7 +954,7 @@ class Application(QWidget):
                 text = self.terminal_queue.get_nowait()
                 if text == "FILTER_AND_UPDATE_VULNS": self.filter_and_update_slither_dropdown()
                 elif text == "UPDATE_EXPLOIT_UI": self.update_exploit_params()
-                else: self.terminal_output.append(text)
+                else: self.terminal_output.append(render_entry([text]))
             except Exception: pass 
 
     def copy_terminal_output(self):
@@ -1015,12 +1016,14 @@ class Application(QWidget):
                 log_msg = f"<b>Executing:</b> <span style='color:#87CEEB;'>{command}</span>" + (f" in {cwd}" if cwd else "") + "\n"
                 self.terminal_queue.put(log_msg)
 
-                process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=cwd, bufsize=1, universal_newlines=True)
-                for line in iter(process.stdout.readline, ''):
-                    self.terminal_queue.put(html.escape(line).replace('\n', '<br>'))
-                process.wait()
-                if process.returncode != 0:
-                    self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {process.returncode}</span>")
+                source = command.split()[0] if command.split() else command
+                limits = get_limits_for_command(command)
+                result = run_limited(command, cwd=cwd, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'],
+                                     on_line=lambda line: self.terminal_queue.put(log_record(source, line)))
+                if result['truncated']:
+                    self.terminal_queue.put(f"<span style='color:orange;'><b>⚠️ Truncated:</b> {html.escape(result['truncated_reason'])}. The output above is partial.</span>")
+                elif result['returncode'] != 0:
+                    self.terminal_queue.put(f"<span style='color:orange;'>Command finished with non-zero exit code: {result['returncode']}</span>")
             except Exception as e:
                 self.terminal_queue.put(f"<span style='color:red;'>Error executing command: {e}</span>\n")
 
@@ -0,0 +1,215 @@
+import os
+import json
+import signal
+import subprocess
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# =================================================================================
+# PER-SCANNER TIME & MEMORY LIMITS
+# =================================================================================
+# Child processes run in their own process group. A watchdog sums the RSS of every
+# process in the group and terminates the whole group (including solc, forge or z3
+# children) once the wall-clock or memory limit is hit. Output read so far is kept
+# and the run is reported as truncated.
+#
+# Limits can be overridden per tool in ~/.superscanner/limits.json, e.g.
+#   {"mythril": {"timeout": 1800, "max_rss_mb": 8192}, "default": {"timeout": null}}
+# A limit of null disables it.
+LIMITS_FILE = os.path.join(os.path.expanduser('~'), '.superscanner', 'limits.json')
+
+DEFAULT_LIMITS = {
+    "mythril": {"timeout": 60 * 60, "max_rss_mb": 8192},
+    "slither": {"timeout": 30 * 60, "max_rss_mb": 8192},
+    "wake": {"timeout": 30 * 60, "max_rss_mb": 8192},
+    "aderyn": {"timeout": 20 * 60, "max_rss_mb": 4096},
+    "default": {"timeout": 2 * 60 * 60, "max_rss_mb": None},
+}
+
+TOOL_ALIASES = {"myth": "mythril"}
+
+WATCHDOG_INTERVAL = 0.5
+# Seconds between SIGTERM and SIGKILL when stopping a group.
+TERMINATE_GRACE = 5
+
+
+def _load_limit_overrides():
+    try:
+        with open(LIMITS_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get_limits(tool):
+    """Returns {"timeout", "max_rss_mb"} for a tool (or command's first word), with user overrides applied."""
+    tool = TOOL_ALIASES.get(tool, tool).lower()
+    overrides = _load_limit_overrides()
+    limits = dict(DEFAULT_LIMITS['default'])
+    limits.update(overrides.get('default', {}))
+    limits.update(DEFAULT_LIMITS.get(tool, {}))
+    limits.update(overrides.get(tool, {}))
+    return limits
+
+
+def get_limits_for_command(command):
+    args = command.split() if isinstance(command, str) else list(command)
+    return get_limits(os.path.basename(args[0]) if args else "default")
+
+
+def _proc_rss_bytes(pid, page_size):
+    with open(f'/proc/{pid}/statm', 'r') as f:
+        return int(f.read().split()[1]) * page_size
+
+
+def _proc_children(pid):
+    """Child pids of `pid` from /proc (needs a kernel with /proc/<pid>/task/<tid>/children)."""
+    children = []
+    for tid in os.listdir(f'/proc/{pid}/task'):
+        with open(f'/proc/{pid}/task/{tid}/children', 'r') as f:
+            children += [int(child) for child in f.read().split()]
+    return children
+
+
+def _tree_rss_bytes(leader, pgid):
+    """Total resident memory of the leader's process tree, counting processes still in its group."""
+    if psutil:
+        leader_proc = psutil.Process(leader)
+        total = 0
+        for proc in [leader_proc] + leader_proc.children(recursive=True):
+            try:
+                if os.getpgid(proc.pid) == pgid:
+                    total += proc.memory_info().rss
+            except (psutil.Error, OSError):
+                continue
+        return total
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    stack = [leader]
+    while stack:
+        pid = stack.pop()
+        try:
+            if os.getpgid(pid) == pgid:
+                total += _proc_rss_bytes(pid, page_size)
+            stack += _proc_children(pid)
+        except (OSError, ValueError, IndexError):
+            if pid == leader:
+                raise
+    return total
+
+
+def _group_rss_bytes(pgid):
+    """
+    Total resident memory of all live processes in a process group. The group leader's
+    process tree is walked first; only if that fails (the leader has exited, or /proc has
+    no children files) is every process on the machine checked.
+    """
+    try:
+        return _tree_rss_bytes(pgid, pgid)
+    except (OSError, ValueError, IndexError) + ((psutil.Error,) if psutil else ()):
+        pass
+
+    total = 0
+    if psutil:
+        for proc in psutil.process_iter(['pid']):
+            try:
+                if os.getpgid(proc.info['pid']) == pgid:
+                    total += proc.memory_info().rss
+            except (psutil.Error, OSError):
+                continue
+        return total
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f'/proc/{pid}/stat', 'r') as f:
+                # The command name may contain spaces, so split after its closing paren.
+                fields = f.read().rsplit(')', 1)[1].split()
+            if int(fields[2]) == pgid:
+                total += int(fields[21]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def _can_measure_rss():
+    return psutil is not None or os.path.isdir('/proc')
+
+
+def _stop_group(process):
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=TERMINATE_GRACE)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+    else:
+        process.kill()
+    process.wait()
+
+
+def run_limited(command, cwd=None, timeout=None, max_rss_mb=None, on_line=None):
+    """
+    Runs `command` (a shell string or an argument list) with stdout and stderr merged,
+    calling `on_line(line)` as output arrives. Returns a dict with returncode, output,
+    elapsed, truncated and truncated_reason. Raises FileNotFoundError like subprocess
+    when an argument-list executable is missing.
+    """
+    popen_kwargs = {}
+    if hasattr(os, 'setsid'):
+        popen_kwargs['start_new_session'] = True
+    process = subprocess.Popen(command, shell=isinstance(command, str), cwd=cwd, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, errors='replace', bufsize=1, **popen_kwargs)
+
+    output_lines = []
+
+    def reader():
+        for line in iter(process.stdout.readline, ''):
+            output_lines.append(line)
+            if on_line:
+                on_line(line)
+        process.stdout.close()
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+
+    start = time.monotonic()
+    max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb and hasattr(os, 'killpg') and _can_measure_rss() else None
+    truncated_reason = None
+    while process.poll() is None:
+        elapsed = time.monotonic() - start
+        if timeout and elapsed > timeout:
+            truncated_reason = f"wall-clock limit of {timeout}s exceeded"
+        elif max_rss_bytes:
+            rss = _group_rss_bytes(process.pid)
+            if rss > max_rss_bytes:
+                truncated_reason = f"memory limit of {max_rss_mb} MB exceeded ({rss // (1024 * 1024)} MB resident)"
+        if truncated_reason:
+            _stop_group(process)
+            break
+        time.sleep(WATCHDOG_INTERVAL)
+
+    # Children that inherited stdout can keep the pipe open after the shell exits.
+    reader_thread.join(TERMINATE_GRACE)
+    return {
+        "returncode": process.returncode,
+        "output": "".join(output_lines),
+        "elapsed": time.monotonic() - start,
+        "truncated": truncated_reason is not None,
+        "truncated_reason": truncated_reason,
+    }
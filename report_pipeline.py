@@ -0,0 +1,209 @@
+import os
+import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from scan_cache import make_cache_key, project_fingerprint
+from build_artifacts import get_build_export
+from process_limits import get_limits, run_limited
+
+
+# =================================================================================
+# FULL REPORT SCANNERS
+# =================================================================================
+# The order of this list is the order the sections appear in the final report,
+# regardless of which scanner finishes first. Scanners with an "artifact_command"
+# accept the shared compilation export instead of compiling the project again.
+REPORT_SCANNERS = [
+    {"name": "Slither", "command": "slither .", "artifact_command": "slither {export}"},
+    {"name": "Aderyn", "command": "aderyn", "output_file": "report.md"},
+    {"name": "Wake", "command": "wake detect all"}
+]
+
+# Each scanner writes its raw output into <project>/.scanner_output/<scanner>/
+SCANNER_OUTPUT_DIR = '.scanner_output'
+
+
+def _noop_log(message):
+    pass
+
+
+def get_scanner_output_dir(project_root, scanner):
+    return os.path.join(project_root, SCANNER_OUTPUT_DIR, scanner['name'].lower())
+
+
+def run_report_scanner(scanner, project_root, log=None, cache=None, fingerprint=None, solc_version=None):
+    """
+    Runs a single report scanner in its own output area and returns a result dict.
+    With a ScanCache and project fingerprint, unchanged projects are served from the cache.
+    """
+    log = log or _noop_log
+    output_dir = get_scanner_output_dir(project_root, scanner)
+    os.makedirs(output_dir, exist_ok=True)
+
+    command = scanner['command']
+    report_file = None
+    if 'output_file' in scanner:
+        report_file = os.path.join(output_dir, scanner['output_file'])
+        if os.path.exists(report_file):
+            os.remove(report_file)
+        command += f" --output {shlex.quote(report_file)}"
+
+    result = {
+        "name": scanner['name'],
+        "command": command,
+        "returncode": None,
+        "output": "",
+        "report_file": report_file,
+        "error": None,
+        "not_found": False,
+        "cached": False,
+        "elapsed": 0.0,
+        "truncated": False,
+        "truncated_reason": None
+    }
+
+    cache_key = None
+    if cache and fingerprint:
+        cache_key = make_cache_key(fingerprint, scanner['name'], scanner['command'], solc_version)
+        start = time.monotonic()
+        entry = cache.get(cache_key)
+        if entry:
+            result.update(returncode=entry['returncode'], output=entry['output'], cached=True)
+            if report_file and entry.get('report') is not None:
+                with open(report_file, 'w', errors='ignore') as f:
+                    f.write(entry['report'])
+            result['elapsed'] = time.monotonic() - start
+            log(f"<span style='color:#87CEEB;'>♻️ {scanner['name']}: sources unchanged, using cached results.</span>")
+            return result
+
+    start = time.monotonic()
+    if 'artifact_command' in scanner:
+        try:
+            export_path = get_build_export(project_root, log=log)
+            command = scanner['artifact_command'].format(export=shlex.quote(export_path))
+            result['command'] = command
+        except Exception as e:
+            log(f"<span style='color:orange;'>{scanner['name']}: could not use shared build artifacts ({e}). Compiling directly.</span>")
+
+    log(f"<b>Running {scanner['name']}...</b>")
+    limits = get_limits(scanner['name'])
+    try:
+        process = run_limited(command, cwd=project_root, timeout=limits['timeout'], max_rss_mb=limits['max_rss_mb'])
+        result['returncode'] = process['returncode']
+        result['output'] = process['output']
+        result['truncated'] = process['truncated']
+        result['truncated_reason'] = process['truncated_reason']
+        if process['truncated']:
+            log(f"<span style='color:orange;'>{scanner['name']} was stopped: {process['truncated_reason']}. Keeping partial output.</span>")
+        # The shell reports a missing executable as exit code 127.
+        result['not_found'] = process['returncode'] == 127
+    except FileNotFoundError:
+        result['not_found'] = True
+    except Exception as e:
+        result['error'] = str(e)
+    result['elapsed'] = time.monotonic() - start
+
+    try:
+        with open(os.path.join(output_dir, 'output.txt'), 'w', errors='ignore') as f:
+            f.write(result['output'])
+    except OSError:
+        pass
+
+    # Truncated runs depend on machine load, so only complete runs are cached.
+    if cache_key and not result['not_found'] and not result['error'] and not result['truncated']:
+        report = None
+        if report_file and os.path.exists(report_file):
+            with open(report_file, 'r', errors='ignore') as f:
+                report = f.read()
+        cache.put(cache_key, {"returncode": result['returncode'], "output": result['output'], "report": report})
+
+    return result
+
+
+def run_report_scanners(project_root, scanners=None, log=None, max_workers=None, cache=None, solc_version=None):
+    """
+    Runs all report scanners concurrently on a bounded worker pool.
+    Results are returned in the same order as `scanners`, not completion order.
+    """
+    scanners = scanners if scanners is not None else REPORT_SCANNERS
+    log = log or _noop_log
+    if not scanners:
+        return []
+    if max_workers is None:
+        max_workers = min(len(scanners), os.cpu_count() or 1)
+
+    fingerprint = project_fingerprint(project_root) if cache else None
+
+    results = [None] * len(scanners)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="report-scanner") as pool:
+        futures = {pool.submit(run_report_scanner, scanner, project_root, log, cache, fingerprint, solc_version): i for i, scanner in enumerate(scanners)}
+        for future in as_completed(futures):
+            i = futures[future]
+            result = future.result()
+            results[i] = result
+            if result['cached']:
+                continue
+            if result['not_found']:
+                log(f"<span style='color:red;'>Error: `{scanners[i]['command'].split()[0]}` command not found. Is {result['name']} installed and in your PATH?</span>")
+            elif result['error']:
+                log(f"<span style='color:red;'>An unexpected error occurred while running {result['name']}: {result['error']}</span>")
+            elif result['truncated']:
+                log(f"<span style='color:orange;'>{result['name']} was truncated after {result['elapsed']:.1f}s.</span>")
+            elif result['returncode'] != 0:
+                log(f"<span style='color:orange;'>{result['name']} finished with a non-zero exit code in {result['elapsed']:.1f}s.</span>")
+            else:
+                log(f"<span style='color:green;'>✅ {result['name']} finished in {result['elapsed']:.1f}s.</span>")
+    return results
+
+
+def build_report_markdown(project_name, results):
+    report_content = []
+    report_content.append(f"# Full Security Report: {project_name}\n")
+    report_content.append(f"**Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+
+    report_content.append("| Scanner | Status | Wall-clock time |\n|---|---|---|\n")
+    for result in results:
+        if result['not_found'] or result['error']:
+            status = "error"
+        elif result.get('truncated'):
+            status = f"truncated ({result['truncated_reason']})"
+        elif result['returncode'] != 0:
+            status = f"exit code {result['returncode']}"
+        else:
+            status = "ok"
+        if result['cached']:
+            status += " (cached)"
+        report_content.append(f"| {result['name']} | {status} | {result['elapsed']:.2f}s |\n")
+    report_content.append("\n")
+
+    for result in results:
+        report_content.append(f"## {result['name']} Analysis\n\n")
+        report_content.append(f"**Wall-clock time:** {result['elapsed']:.2f}s\n\n")
+
+        if result['not_found']:
+            report_content.append(f"**❌ ERROR: `{result['command'].split()[0]}` not found.**\n\n")
+            continue
+        if result['error']:
+            report_content.append(f"**❌ ERROR: An unexpected error occurred: {result['error']}**\n\n")
+            continue
+        if result.get('truncated'):
+            report_content.append(f"**⚠️ TRUNCATED: {result['name']} was stopped ({result['truncated_reason']}). Partial output:**\n\n")
+        elif result['returncode'] != 0:
+            report_content.append(f"**⚠️ {result['name']} finished with errors. Output:**\n\n")
+
+        # Aderyn writes a markdown report instead of printing findings.
+        if result['report_file']:
+            if os.path.exists(result['report_file']):
+                with open(result['report_file'], 'r', errors='ignore') as f:
+                    report_content.append(f.read() + "\n\n")
+            else:
+                report_content.append(f"Could not find {result['name']}'s `{os.path.basename(result['report_file'])}` file.\n\n")
+        else:
+            output = result['output']
+            if not output.strip():
+                output = "(No findings or output from scanner)"
+            report_content.append(f"```text\n{output}\n```\n\n")
+
+    return "".join(report_content)
@@ -0,0 +1,174 @@
+import os
+import json
+import hashlib
+import subprocess
+import threading
+
+
+# =================================================================================
+# CONTENT-ADDRESSED SCAN RESULT CACHE
+# =================================================================================
+# Results are keyed by a hash of everything that can change a scanner's output:
+# the project's Solidity sources, its remapping/build configuration, the selected
+# solc version, the scanner's own version and the exact command line.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.superscanner', 'scan_cache')
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+# Build outputs and package folders that never influence the analysed sources.
+FINGERPRINT_SKIP_DIRS = {'.git', 'node_modules', 'out', 'cache', 'artifacts', 'crytic-export', 'broadcast', '.wake', '.scanner_output'}
+# Files outside of `.sol` sources that change how a project compiles.
+FINGERPRINT_CONFIG_FILES = ['foundry.toml', 'remappings.txt', 'package.json', 'package-lock.json', 'yarn.lock', 'hardhat.config.js', 'hardhat.config.ts', 'wake.toml', 'aderyn.toml', 'slither.config.json']
+
+SCANNER_VERSION_COMMANDS = {
+    "slither": "slither --version",
+    "aderyn": "aderyn --version",
+    "wake": "wake --version",
+    "mythril": "myth version",
+}
+
+_file_hash_memo = {}
+_file_hash_lock = threading.Lock()
+_scanner_versions = {}
+
+
+def hash_file(path):
+    """Returns the sha256 of a file, memoized on (size, mtime) so unchanged files are read once."""
+    st = os.stat(path)
+    memo_key = (path, st.st_size, st.st_mtime_ns)
+    with _file_hash_lock:
+        cached = _file_hash_memo.get(memo_key)
+    if cached:
+        return cached
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _file_hash_lock:
+        _file_hash_memo[memo_key] = digest
+    return digest
+
+
+def iter_solidity_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in FINGERPRINT_SKIP_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith('.sol'):
+                yield os.path.join(dirpath, filename)
+
+
+def project_fingerprint(target_path):
+    """Hashes the Solidity sources and build configuration of a project directory or single file."""
+    h = hashlib.sha256()
+    if os.path.isfile(target_path):
+        h.update(os.path.basename(target_path).encode())
+        h.update(hash_file(target_path).encode())
+        return h.hexdigest()
+
+    for path in iter_solidity_files(target_path):
+        h.update(os.path.relpath(path, target_path).replace('\\', '/').encode())
+        h.update(hash_file(path).encode())
+    for config_name in FINGERPRINT_CONFIG_FILES:
+        config_path = os.path.join(target_path, config_name)
+        if os.path.isfile(config_path):
+            h.update(config_name.encode())
+            h.update(hash_file(config_path).encode())
+    return h.hexdigest()
+
+
+def get_scanner_version(scanner):
+    """Returns the version string reported by a scanner, looked up once per process."""
+    scanner = scanner.lower()
+    if scanner not in _scanner_versions:
+        command = SCANNER_VERSION_COMMANDS.get(scanner, f"{scanner} --version")
+        try:
+            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=30)
+            _scanner_versions[scanner] = (result.stdout + result.stderr).strip() or "unknown"
+        except Exception:
+            _scanner_versions[scanner] = "unknown"
+    return _scanner_versions[scanner]
+
+
+def make_cache_key(fingerprint, scanner, command, solc_version=None):
+    payload = {
+        "fingerprint": fingerprint,
+        "scanner": scanner.lower(),
+        "scanner_version": get_scanner_version(scanner),
+        "command": command,
+        "solc_version": solc_version or "",
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class ScanCache:
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+    def key_for(self, target_path, scanner, command, solc_version=None):
+        return make_cache_key(project_fingerprint(target_path), scanner, command, solc_version)
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        path = self._entry_path(key)
+        with self.lock:
+            try:
+                with open(path, 'r') as f:
+                    entry = json.load(f)
+                # Touch the entry so eviction treats it as recently used.
+                os.utime(path, None)
+                return entry
+            except (OSError, ValueError):
+                return None
+
+    def put(self, key, entry):
+        path = self._entry_path(key)
+        with self.lock:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except OSError:
+                return False
+            self._evict()
+        return True
+
+    def _evict(self):
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self.lock:
+            for dirpath, _, filenames in os.walk(self.cache_dir):
+                for filename in filenames:
+                    try:
+                        os.remove(os.path.join(dirpath, filename))
+                    except OSError:
+                        pass
@@ -0,0 +1,72 @@
+from queue import Queue
+
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+
+# =================================================================================
+# EVENT-DRIVEN GUI QUEUES
+# =================================================================================
+# Worker threads hand output to the GUI through queues. Instead of a QTimer that
+# polls every queue ten times a second for the life of the window, the queue
+# posts one queued Qt signal when it goes from idle to holding data. Further puts
+# are coalesced into that wakeup until the GUI has drained the queue, so an idle
+# window does not wake up at all and a burst of output costs one wakeup per frame.
+
+# Upper bound on how often a busy queue is drained, roughly one display frame.
+FRAME_INTERVAL_MS = 16
+
+
+class QueueNotifier(QObject):
+    ready = pyqtSignal()
+
+
+class SignalingQueue(Queue):
+    """Queue that emits `notifier.ready` on the first put after each rearm()."""
+
+    def __init__(self, maxsize=0):
+        super().__init__(maxsize)
+        self.notifier = QueueNotifier()
+        self._armed = True
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        with self.mutex:
+            notify, self._armed = self._armed, False
+        # Emitted outside the queue lock; the connection is always queued, so this only posts an event.
+        if notify:
+            self.notifier.ready.emit()
+
+    def rearm(self):
+        """Called by the consumer before draining, so puts that race with the drain still wake it."""
+        with self.mutex:
+            self._armed = True
+
+
+class QueueDrainer(QObject):
+    """
+    Calls `drain()` on the GUI thread when `queue` has data, at most once per frame.
+    If `drain()` returns True (work left over, e.g. a time-budgeted render), it runs again next frame.
+    """
+
+    def __init__(self, queue, drain, interval=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.queue = queue
+        self.drain = drain
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self._run)
+        queue.notifier.ready.connect(self.schedule, Qt.QueuedConnection)
+        # Anything queued before the drainer existed fired a signal nobody was connected to.
+        queue.rearm()
+        if not queue.empty():
+            self.schedule()
+
+    def schedule(self):
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def _run(self):
+        self.queue.rearm()
+        if self.drain():
+            self.timer.start()
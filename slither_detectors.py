@@ -0,0 +1,93 @@
+import os
+import inspect
+import importlib.util
+
+
+# =================================================================================
+# IN-PROCESS SLITHER DETECTORS
+# =================================================================================
+# Runs detectors directly on an existing Slither instance and returns the same
+# structure as `slither --json`, so results go straight to parse_slither_json
+# without a process spawn, a recompile or a JSON round trip.
+
+
+# Loaded custom detector classes by (file, mtime). Re-executing an unchanged module would
+# create new classes with the same ARGUMENT on every scan.
+_CUSTOM_DETECTOR_CACHE = {}
+
+
+def _load_detector_module(file_path):
+    from slither.detectors.abstract_detector import AbstractDetector
+
+    module_name = f"custom_detector_{os.path.splitext(os.path.basename(file_path))[0]}"
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [obj for _, obj in inspect.getmembers(module, inspect.isclass)
+            if issubclass(obj, AbstractDetector) and obj is not AbstractDetector and obj.__module__ == module_name]
+
+
+def load_custom_detectors(path):
+    """Imports every .py file at `path` (file or directory) and returns the AbstractDetector subclasses it defines."""
+    if os.path.isdir(path):
+        files = [os.path.join(path, f) for f in sorted(os.listdir(path)) if f.endswith('.py') and not f.startswith('_')]
+    else:
+        files = [path]
+
+    detectors = []
+    for file_path in files:
+        key = (os.path.abspath(file_path), os.path.getmtime(file_path))
+        if key not in _CUSTOM_DETECTOR_CACHE:
+            _CUSTOM_DETECTOR_CACHE[key] = _load_detector_module(file_path)
+        detectors.extend(_CUSTOM_DETECTOR_CACHE[key])
+    return detectors
+
+
+def get_detector_classes():
+    from slither.detectors import all_detectors
+    from slither.detectors.abstract_detector import AbstractDetector
+
+    return [d for d in vars(all_detectors).values() if inspect.isclass(d) and issubclass(d, AbstractDetector)]
+
+
+def run_detectors_in_process(slither_instance, custom_detector_path=None, on_results=None):
+    """
+    Registers the built-in detectors on `slither_instance`, runs them together with the
+    custom detectors and returns a dict shaped like Slither's JSON output.
+    `on_results(results)` is called after each detector that produced results, so
+    findings can be shown immediately.
+
+    Custom detectors are instantiated for this run only and never registered, so the
+    shared instance does not keep detectors from an earlier session's custom path.
+    """
+    from slither.slither import logger_detector
+
+    registered = {d.ARGUMENT for d in slither_instance.detectors}
+    for detector_class in get_detector_classes():
+        if detector_class.ARGUMENT not in registered:
+            slither_instance.register_detector(detector_class)
+            registered.add(detector_class.ARGUMENT)
+
+    run_detectors = list(slither_instance.detectors)
+    for detector_class in load_custom_detectors(custom_detector_path) if custom_detector_path else []:
+        if detector_class.ARGUMENT in registered:
+            continue
+        registered.add(detector_class.ARGUMENT)
+        run_detectors += [detector_class(compilation_unit, slither_instance, logger_detector)
+                          for compilation_unit in slither_instance.compilation_units]
+
+    # Slither de-duplicates results by id for the lifetime of the instance; reset it so
+    # a second scan on the same instance reports everything again.
+    if hasattr(slither_instance, '_currently_seen_resuts'):
+        slither_instance._currently_seen_resuts = set()
+
+    # Same steps as Slither.run_detectors(), one detector at a time.
+    slither_instance.load_previous_results()
+    detectors = []
+    for detector in run_detectors:
+        detector_results = detector.detect()
+        detectors.extend(detector_results)
+        if detector_results and on_results:
+            on_results(detector_results)
+    slither_instance.write_results_to_hide()
+    return {"success": True, "error": None, "results": {"detectors": detectors}}
@@ -0,0 +1,108 @@
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+
+# =================================================================================
+# GUI STARTUP BENCHMARK
+# =================================================================================
+# Starts the scanner GUI in fresh interpreters and measures the time from process
+# launch until the window has been shown and the event loop has run once.
+#
+#   python3 startup_benchmark.py
+#   python3 startup_benchmark.py --runs 10 --budget 1.0 --offscreen
+#
+# Each run uses an empty temporary HOME so queued jobs from a real session are
+# not resumed. The exit code is 1 when the median exceeds the budget.
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET = 1.0
+LAZY_MODULES = ('slither', 'crytic_compile', 'toml', 'exploit_db')
+
+CHILD_SCRIPT = r'''
+import sys, time, json
+marks = {"interpreter": time.time()}
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+app = QApplication(sys.argv[:1])
+marks["qt"] = time.time()
+module = __import__(sys.argv[1])
+marks["import"] = time.time()
+window = module.Application()
+marks["construct"] = time.time()
+window.show()
+
+def shown():
+    marks["shown"] = time.time()
+    marks["loaded"] = [name for name in json.loads(sys.argv[2]) if name in sys.modules]
+    print(json.dumps(marks), flush=True)
+    scheduler = getattr(window, "job_scheduler", None)
+    if scheduler:
+        scheduler.shutdown()
+    app.quit()
+
+QTimer.singleShot(0, shown)
+app.exec_()
+'''
+
+
+def run_once(module, offscreen=False):
+    env = dict(os.environ)
+    if offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+    with tempfile.TemporaryDirectory(prefix="startup-bench-") as home:
+        env['HOME'] = home
+        start = time.time()
+        process = subprocess.run([sys.executable, '-c', CHILD_SCRIPT, module, json.dumps(LAZY_MODULES)],
+                                 cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+                                 capture_output=True, text=True, timeout=120)
+    marks = None
+    for line in process.stdout.splitlines():
+        if line.startswith('{'):
+            marks = json.loads(line)
+    if marks is None:
+        raise RuntimeError(f"{module} did not start:\n{process.stdout}{process.stderr}")
+    return {
+        "total": marks['shown'] - start,
+        "interpreter": marks['interpreter'] - start,
+        "qt": marks['qt'] - marks['interpreter'],
+        "import": marks['import'] - marks['qt'],
+        "construct": marks['construct'] - marks['import'],
+        "show": marks['shown'] - marks['construct'],
+        "loaded": marks['loaded'],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measures time from launch until the scanner window is shown.")
+    parser.add_argument('--module', default='newscannerbeta10', help="GUI module with an Application class.")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help="Number of fresh process launches.")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help="Maximum median startup time in seconds.")
+    parser.add_argument('--offscreen', action='store_true', help="Use the offscreen Qt platform (headless machines).")
+    args = parser.parse_args(argv)
+
+    phases = ('interpreter', 'qt', 'import', 'construct', 'show', 'total')
+    results = []
+    print(f"Starting {args.module} {args.runs} times...", flush=True)
+    for i in range(args.runs):
+        result = run_once(args.module, args.offscreen)
+        results.append(result)
+        print(f"  run {i + 1}: " + "  ".join(f"{p} {result[p] * 1000:.0f}ms" for p in phases), flush=True)
+
+    median = {p: statistics.median(r[p] for r in results) for p in phases}
+    print("median:  " + "  ".join(f"{p} {median[p] * 1000:.0f}ms" for p in phases))
+    loaded = sorted({name for r in results for name in r['loaded']})
+    print(f"Deferred modules loaded before the window appeared: {', '.join(loaded) if loaded else 'none'}")
+    if median['total'] > args.budget:
+        print(f"FAIL: median startup {median['total']:.2f}s exceeds the {args.budget:.2f}s budget.")
+        return 1
+    print(f"OK: median startup {median['total']:.2f}s is within the {args.budget:.2f}s budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+import os
+import threading
+import weakref
+
+from job_scheduler import JobScheduler
+from scan_cache import ScanCache
+
+
+# =================================================================================
+# SHARED STATION SERVICES
+# =================================================================================
+# Several project sessions (tabs) run in one window. Each session keeps its own
+# findings, contract map and terminal, but they share one job scheduler, so the
+# worker and per-tool limits apply to the whole station. They also share one scan
+# result cache and the Slither instances built from the same compiled build.
+#
+# Jobs are tagged with the submitting session's id and routed back to it. Jobs
+# resumed from a previous run belong to sessions that no longer exist; they go to
+# the session whose project contains their working directory, else the first one.
+
+
+class SharedSlitherInstances:
+    """
+    Slither instances by build hash. Sessions mapping the same build get the same instance;
+    it is held weakly, so it is freed once no session references it. Detectors mutate the
+    instance, so every use must hold `lock_for(build_hash)`.
+    """
+
+    def __init__(self):
+        self.instances = weakref.WeakValueDictionary()
+        self.locks = {}
+        self.guard = threading.Lock()
+
+    def lock_for(self, build_hash):
+        with self.guard:
+            return self.locks.setdefault(build_hash, threading.RLock())
+
+    def get(self, build_hash, load):
+        """Returns the instance for `build_hash`, calling `load()` to build it if no session holds one."""
+        if build_hash is None:
+            return load()
+        with self.lock_for(build_hash):
+            instance = self.instances.get(build_hash)
+            if instance is None:
+                instance = load()
+                self.instances[build_hash] = instance
+            return instance
+
+
+class StationServices:
+    def __init__(self, state_file=None):
+        scheduler_kwargs = {"state_file": state_file} if state_file else {}
+        self.job_scheduler = JobScheduler(self._run_job, **scheduler_kwargs)
+        self.scan_cache = ScanCache()
+        self.slither_instances = SharedSlitherInstances()
+        # session id -> (runner(job), project_root())
+        self.sessions = {}
+        self.sessions_lock = threading.Lock()
+
+    def register_session(self, session_id, runner, project_root):
+        with self.sessions_lock:
+            self.sessions[session_id] = (runner, project_root)
+
+    def unregister_session(self, session_id):
+        """Forgets a session and cancels its queued jobs. Returns how many were cancelled."""
+        with self.sessions_lock:
+            self.sessions.pop(session_id, None)
+        return self.job_scheduler.cancel_group(session_id)
+
+    def start(self):
+        """Starts the shared scheduler. Returns the jobs resumed from the last run."""
+        return self.job_scheduler.start()
+
+    def shutdown(self):
+        self.job_scheduler.shutdown()
+
+    def session_for(self, job):
+        with self.sessions_lock:
+            session = self.sessions.get(job.get('group'))
+            if session or not self.sessions:
+                return session
+            sessions = list(self.sessions.values())
+        cwd = os.path.abspath(job['cwd']) if job.get('cwd') else None
+        for session in sessions:
+            root = session[1]()
+            if cwd and root and os.path.commonpath([cwd, os.path.abspath(root)]) == os.path.abspath(root):
+                return session
+        return sessions[0]
+
+    def _run_job(self, job):
+        session = self.session_for(job)
+        if session is None:
+            raise RuntimeError("No open session to run the job in.")
+        return session[0](job)
@@ -0,0 +1,205 @@
+import re
+
+
+# =================================================================================
+# INCREMENTAL FINDING PARSERS
+# =================================================================================
+# Each parser is fed a scanner's live stdout one line at a time and returns the
+# findings whose block has just been completed. Findings use the same shape as
+# contract_map.parse_slither_findings, plus a "source" key naming the scanner, so
+# they can be shown in the findings list before the scanner exits.
+
+FUNCTION_RE = re.compile(r'\b([A-Za-z_]\w*)\.([A-Za-z_]\w*)\(')
+CONTRACT_RE = re.compile(r'^([A-Za-z_]\w*) \(')
+SOL_PATH_RE = re.compile(r'([\w@./-]+\.sol)')
+
+_slither_detector_index = None
+
+
+def _get_slither_detector_index():
+    """Maps detector argument and wiki URL to (argument, impact), loaded once from Slither if it is installed."""
+    global _slither_detector_index
+    if _slither_detector_index is None:
+        _slither_detector_index = {}
+        try:
+            from slither_detectors import get_detector_classes
+            from slither.detectors.abstract_detector import classification_txt
+            for detector in get_detector_classes():
+                entry = (detector.ARGUMENT, classification_txt[detector.IMPACT])
+                _slither_detector_index[detector.ARGUMENT] = entry
+                _slither_detector_index[detector.WIKI] = entry
+        except Exception:
+            pass
+    return _slither_detector_index
+
+
+def _locate(text, file_to_contract=None):
+    """Best-effort (contract, function_name) for a finding description."""
+    first_line = text.strip().splitlines()[0] if text.strip() else ""
+    match = FUNCTION_RE.search(first_line)
+    if match:
+        return match.group(1), match.group(2)
+    match = CONTRACT_RE.match(first_line)
+    if match:
+        return match.group(1), '(contract-level)'
+    match = SOL_PATH_RE.search(text)
+    if match and file_to_contract:
+        return file_to_contract(match.group(1)) or 'Unknown', '(file-level)'
+    return 'Unknown', '(file-level)'
+
+
+class StreamParser:
+    source = None
+
+    def __init__(self, file_to_contract=None):
+        self.file_to_contract = file_to_contract
+
+    def feed(self, line):
+        return []
+
+    def finish(self):
+        return []
+
+    def _finding(self, check, description, impact):
+        contract, function_name = _locate(description, self.file_to_contract)
+        return {'check': check, 'description': description, 'impact': impact,
+                'contract': contract, 'function_name': function_name, 'source': self.source}
+
+
+class SlitherStreamParser(StreamParser):
+    """
+    Slither prints each detector as `Detector: <check>`, one description per result
+    (continuation lines are tab-indented) and a closing `Reference: <wiki url>`.
+    """
+    source = 'slither'
+
+    def __init__(self, file_to_contract=None):
+        super().__init__(file_to_contract)
+        self.check = None
+        self.descriptions = []
+
+    def feed(self, line):
+        line = line.rstrip('\n')
+        if line.startswith('INFO:') or not line.strip():
+            return []
+        if line.startswith('Detector: '):
+            self.check = line[len('Detector: '):].strip()
+            self.descriptions = []
+            return []
+        if line.startswith('Reference: '):
+            return self._flush(line[len('Reference: '):].strip())
+        if line.startswith('\t') and self.descriptions:
+            self.descriptions[-1] += line + '\n'
+        elif self.check is not None or not line[:1].isspace():
+            self.descriptions.append(line + '\n')
+        return []
+
+    def _flush(self, wiki_url):
+        index = _get_slither_detector_index()
+        check, impact = index.get(self.check) or index.get(wiki_url) or (self.check or wiki_url.rsplit('#', 1)[-1], 'Informational')
+        findings = [self._finding(check, description, impact) for description in self.descriptions]
+        self.check = None
+        self.descriptions = []
+        return findings
+
+
+class AderynStreamParser(StreamParser):
+    """Parses the markdown report `aderyn --stdout` prints: severity sections with one `X-n: Title` heading per issue."""
+    source = 'aderyn'
+    SEVERITY_RE = re.compile(r'^#+\s+(High|Medium|Low|NC)\s+Issues', re.IGNORECASE)
+    ISSUE_RE = re.compile(r'^#+\s+((?:H|M|L|NC)-\d+):\s*(.+)$')
+    IMPACTS = {'high': 'High', 'medium': 'Medium', 'low': 'Low', 'nc': 'Informational'}
+
+    def __init__(self, file_to_contract=None):
+        super().__init__(file_to_contract)
+        self.impact = 'Informational'
+        self.current = None
+
+    def feed(self, line):
+        line = line.rstrip('\n')
+        severity = self.SEVERITY_RE.match(line)
+        issue = self.ISSUE_RE.match(line)
+        if not severity and not issue:
+            if self.current is not None:
+                self.current['lines'].append(line)
+            return []
+
+        findings = self.finish()
+        if severity:
+            self.impact = self.IMPACTS[severity.group(1).lower()]
+        else:
+            self.current = {'id': issue.group(1), 'title': issue.group(2).strip(), 'lines': []}
+        return findings
+
+    def finish(self):
+        if self.current is None:
+            return []
+        issue, self.current = self.current, None
+        body = "\n".join(issue['lines']).strip()
+        check = re.sub(r'[^a-z0-9]+', '-', issue['title'].lower()).strip('-')
+        description = f"{issue['id']}: {issue['title']}\n{body}\n"
+
+        # Aderyn lists every location as `Found in <file> [Line: n]`; attribute the issue to the first one.
+        contract, function_name = 'Unknown', '(file-level)'
+        match = re.search(r'Found in\s+' + SOL_PATH_RE.pattern, body)
+        if match and self.file_to_contract:
+            contract = self.file_to_contract(match.group(1)) or 'Unknown'
+        return [{'check': check, 'description': description, 'impact': self.impact,
+                 'contract': contract, 'function_name': function_name, 'source': self.source}]
+
+
+class WakeStreamParser(StreamParser):
+    """Parses `wake detect` panels: a `[IMPACT][CONFIDENCE] Title [detector]` header closed by a `╰` border."""
+    source = 'wake'
+    HEADER_RE = re.compile(r'\[(\w+)\]\[(\w+)\]\s+(.+?)\s+\[([\w-]+)\]')
+    FUNCTION_DEF_RE = re.compile(r'\bfunction\s+([A-Za-z_]\w*)')
+    IMPACTS = {'high': 'High', 'medium': 'Medium', 'low': 'Low', 'warning': 'Low', 'info': 'Informational'}
+
+    def __init__(self, file_to_contract=None):
+        super().__init__(file_to_contract)
+        self.current = None
+
+    def feed(self, line):
+        line = line.rstrip('\n')
+        header = self.HEADER_RE.search(line)
+        if header and line.lstrip().startswith('╭'):
+            findings = self.finish()
+            impact, confidence, title, detector = header.groups()
+            self.current = {'impact': self.IMPACTS.get(impact.lower(), 'Informational'), 'confidence': confidence,
+                            'title': title, 'detector': detector, 'lines': []}
+            return findings
+        if self.current is None:
+            return []
+        self.current['lines'].append(line)
+        if line.lstrip().startswith('╰'):
+            return self.finish()
+        return []
+
+    def finish(self):
+        if self.current is None:
+            return []
+        block, self.current = self.current, None
+        body = "\n".join(block['lines'])
+        description = f"{block['title']} (confidence: {block['confidence'].lower()})\n{body}\n"
+
+        contract, function_name = 'Unknown', '(file-level)'
+        path = SOL_PATH_RE.search(body)
+        if path and self.file_to_contract:
+            contract = self.file_to_contract(path.group(1)) or 'Unknown'
+        function = self.FUNCTION_DEF_RE.search(body)
+        if function:
+            function_name = function.group(1)
+        return [{'check': block['detector'], 'description': description, 'impact': block['impact'],
+                 'contract': contract, 'function_name': function_name, 'source': self.source}]
+
+
+STREAM_PARSERS = {
+    'slither': SlitherStreamParser,
+    'aderyn': AderynStreamParser,
+    'wake': WakeStreamParser,
+}
+
+
+def get_stream_parser(tool, file_to_contract=None):
+    parser_class = STREAM_PARSERS.get(tool)
+    return parser_class(file_to_contract) if parser_class else None
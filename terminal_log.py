@@ -0,0 +1,498 @@
+import os
+import re
+import gzip
+import html
+import json
+import time
+import heapq
+import itertools
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from datetime import datetime
+from queue import Queue, Empty
+
+
+# =================================================================================
+# STRUCTURED LOG RECORDS
+# =================================================================================
+# Command output is queued as raw LogRecords instead of pre-built HTML. Escaping,
+# level detection and coloring happen only when a record is actually rendered, so
+# lines dropped under load cost nothing and the view can be filtered by level or
+# by the command that produced them. Status messages stay plain HTML strings.
+LogRecord = namedtuple('LogRecord', ['source', 'stream', 'level', 'text'])
+
+LEVEL_INFO = 'info'
+LEVEL_WARNING = 'warning'
+LEVEL_ERROR = 'error'
+LEVEL_RANK = {LEVEL_INFO: 0, LEVEL_WARNING: 1, LEVEL_ERROR: 2}
+LEVEL_COLORS = {LEVEL_WARNING: 'orange', LEVEL_ERROR: 'red'}
+
+ERROR_RE = re.compile(r'\b(error|fatal|traceback|exception|panic)\b', re.IGNORECASE)
+WARNING_RE = re.compile(r'\bwarn(ing)?\b', re.IGNORECASE)
+
+
+def log_record(source, text, stream='stdout', level=None):
+    """Builds a record for one output line. A level of None is inferred from the text when it is rendered."""
+    return LogRecord(source, stream, level, text.rstrip('\n'))
+
+
+def record_level(record):
+    if record.level:
+        return record.level
+    if ERROR_RE.search(record.text):
+        return LEVEL_ERROR
+    if WARNING_RE.search(record.text):
+        return LEVEL_WARNING
+    return LEVEL_INFO
+
+
+def make_record_filter(min_level=LEVEL_INFO, source=None):
+    """Returns a predicate over records, or None when everything is shown."""
+    if min_level == LEVEL_INFO and not source:
+        return None
+    rank = LEVEL_RANK[min_level]
+    return lambda record: (not source or record.source == source) and LEVEL_RANK[record_level(record)] >= rank
+
+
+def render_record(record):
+    text = html.escape(record.text)
+    color = LEVEL_COLORS.get(record_level(record))
+    return f"<span style='color:{color};'>{text}</span>" if color else text
+
+
+def _as_record(item):
+    # Spilled pages come back from JSON as lists.
+    return item if isinstance(item, LogRecord) else LogRecord(*item)
+
+
+def render_entry(entry, accept=None):
+    """
+    Renders one terminal entry: a list of HTML strings and records. Records rejected
+    by `accept` are skipped; HTML status messages are always shown.
+    """
+    parts = []
+    for item in entry:
+        if isinstance(item, str):
+            parts.append(item[:-len('<br>')] if item.endswith('<br>') else item)
+            continue
+        record = _as_record(item)
+        if accept is None or accept(record):
+            parts.append(render_record(record))
+    return "<br>".join(parts)
+
+
+# =================================================================================
+# BATCHED TERMINAL RENDERING
+# =================================================================================
+# Scanners can print thousands of lines per second. Appending each line to a
+# QTextEdit on its own re-lays out the document every time and freezes the UI,
+# so queued lines are joined into chunks and rendered within a per-tick time
+# budget. Anything left over waits for the next tick. Once the backlog grows past
+# a limit, the oldest pending lines are dropped and replaced by a one-line summary.
+TERMINAL_FRAME_BUDGET = 0.015
+TERMINAL_CHUNK_LINES = 200
+TERMINAL_MAX_BACKLOG = 20000
+
+
+class TerminalBatcher:
+    def __init__(self, source_queue, control_messages=(), budget=TERMINAL_FRAME_BUDGET,
+                 chunk_lines=TERMINAL_CHUNK_LINES, max_backlog=TERMINAL_MAX_BACKLOG):
+        self.source_queue = source_queue
+        self.control_messages = set(control_messages)
+        self.budget = budget
+        self.chunk_lines = chunk_lines
+        self.max_backlog = max_backlog
+        self.pending = deque()
+        self.dropped_total = 0
+
+    def _pull(self, on_control):
+        while True:
+            try:
+                item = self.source_queue.get_nowait()
+            except Empty:
+                break
+            if item in self.control_messages:
+                on_control(item)
+            else:
+                self.pending.append(item)
+
+    def _drop_overflow(self):
+        overflow = len(self.pending) - self.max_backlog
+        if overflow <= 0:
+            return 0
+        for _ in range(overflow):
+            self.pending.popleft()
+        self.dropped_total += overflow
+        return overflow
+
+    def render(self, append, on_control=None):
+        """
+        Moves queued items into the pending buffer and passes them to `append` as entries
+        (lists of HTML strings and records, see render_entry) until the time budget for
+        this tick is used up. Returns the number of items rendered.
+        """
+        start = time.monotonic()
+        self._pull(on_control or (lambda message: None))
+        dropped = self._drop_overflow()
+        if dropped:
+            append([f"<span style='color:orange;'>… {dropped} lines skipped to keep the terminal responsive …</span>"])
+
+        rendered = 0
+        while self.pending and time.monotonic() - start < self.budget:
+            count = min(self.chunk_lines, len(self.pending))
+            append([self.pending.popleft() for _ in range(count)])
+            rendered += count
+        return rendered
+
+
+# =================================================================================
+# BOUNDED SCROLLBACK WITH DISK SPILL
+# =================================================================================
+# Only the most recent terminal entries are kept in memory (and in the widget).
+# Older entries are written to a per-session gzip log, one gzip member per spilled
+# batch, so a single page can be decompressed on its own when the user scrolls
+# back or searches.
+SESSION_LOG_DIR = os.path.join(os.path.expanduser('~'), '.superscanner', 'sessions')
+SCROLLBACK_MAX_LINES = 10000
+# Lines spilled at once, so the spill file is written in pages rather than per line.
+SCROLLBACK_SPILL_LINES = 2000
+MAX_SESSION_LOGS = 10
+
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Distinguishes the spill files of several terminals (session tabs) in one process.
+_log_sequence = itertools.count()
+
+
+def _html_to_text(text):
+    return html.unescape(TAG_RE.sub('', text.replace('<br>', '\n')))
+
+
+def entry_to_text(entry):
+    lines = [_html_to_text(item) if isinstance(item, str) else _as_record(item).text for item in entry]
+    return "\n".join(line[:-1] if line.endswith('\n') else line for line in lines)
+
+
+def entry_lines(entry):
+    """Splits an entry into the lines the search numbers: one (record or text, text) per line."""
+    lines = []
+    for item in entry:
+        if isinstance(item, str):
+            lines.extend((text, text) for text in _html_to_text(item).splitlines())
+        else:
+            record = _as_record(item)
+            lines.append((record, record.text))
+    return lines
+
+
+def normalize_line(text):
+    """Collapses whitespace the way the HTML view does."""
+    return " ".join(text.split())
+
+
+class ScrollbackBuffer:
+    def __init__(self, max_lines=SCROLLBACK_MAX_LINES, spill_lines=SCROLLBACK_SPILL_LINES, log_dir=SESSION_LOG_DIR):
+        self.max_lines = max_lines
+        self.spill_lines = spill_lines
+        self.log_dir = log_dir
+        self.log_path = None
+        # (entry, widget blocks, lines) for every entry still held in memory.
+        self.entries = deque()
+        self.line_count = 0
+        # One (byte offset, byte length, entry count) per gzip member in the spill file.
+        self.pages = []
+        self.spilled_count = 0
+
+    def _open_log(self):
+        os.makedirs(self.log_dir, exist_ok=True)
+        self.log_path = os.path.join(self.log_dir, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_log_sequence)}.log.gz")
+        # Logs of this process may still be open in other terminals.
+        own_prefix = f"-{os.getpid()}-"
+        logs = sorted(f for f in os.listdir(self.log_dir) if f.endswith('.log.gz'))
+        for stale_log in [f for f in logs[:-MAX_SESSION_LOGS] if own_prefix not in f]:
+            try:
+                os.remove(os.path.join(self.log_dir, stale_log))
+            except OSError:
+                pass
+
+    def append(self, entry, blocks=1):
+        """
+        Records an entry that was just shown. Returns how many widget blocks were spilled
+        to disk and should now be removed from the top of the widget.
+        """
+        lines = sum(1 if not isinstance(item, str) else max(item.count('<br>') + item.count('\n'), 1) for item in entry)
+        self.entries.append((entry, blocks, lines))
+        self.line_count += lines
+        if self.line_count <= self.max_lines:
+            return 0
+        batch = []
+        while len(self.entries) > 1 and self.line_count > self.max_lines - self.spill_lines:
+            spilled = self.entries.popleft()
+            self.line_count -= spilled[2]
+            batch.append(spilled)
+        self._spill([e for e, _, _ in batch])
+        return sum(b for _, b, _ in batch)
+
+    def _spill(self, entries):
+        try:
+            if self.log_path is None:
+                self._open_log()
+            payload = gzip.compress("".join(json.dumps(e) + "\n" for e in entries).encode('utf-8'))
+            with open(self.log_path, 'ab') as f:
+                offset = f.tell()
+                f.write(payload)
+            self.pages.append((offset, len(payload), len(entries)))
+        except OSError:
+            # Without a writable log the oldest output is simply discarded.
+            self.pages.append((None, 0, len(entries)))
+        self.spilled_count += len(entries)
+
+    def load_page(self, page_index):
+        """Decompresses one spilled page. Returns its entries, or [] if the page is unavailable."""
+        offset, length, _ = self.pages[page_index]
+        if offset is None:
+            return []
+        try:
+            with open(self.log_path, 'rb') as f:
+                f.seek(offset)
+                data = gzip.decompress(f.read(length)).decode('utf-8')
+        except (OSError, EOFError, ValueError):
+            return []
+        return [json.loads(line) for line in data.splitlines() if line]
+
+    def page_of_entry(self, entry_no):
+        """Index of the spilled page holding an entry, or None if the entry is still in memory."""
+        first = 0
+        for page_index, (_, _, count) in enumerate(self.pages):
+            if entry_no < first + count:
+                return page_index
+            first += count
+        return None
+
+    def replay(self, show):
+        """Shows every in-memory entry again through show(entry) -> widget blocks, e.g. after the view filter changed."""
+        self.entries = deque((entry, show(entry), lines) for entry, _, lines in self.entries)
+
+    def iter_entries(self, start=0, stop=None):
+        """
+        Yields (entry_no, entry) for entries `start` to `stop` (all by default), oldest first,
+        decompressing only the spilled pages in that range. Entries of unavailable pages are skipped.
+        """
+        first = 0
+        for page_index, (_, _, count) in enumerate(self.pages):
+            if stop is not None and first >= stop:
+                return
+            if first + count > start:
+                for entry_no, entry in enumerate(self.load_page(page_index), first):
+                    if start <= entry_no and (stop is None or entry_no < stop):
+                        yield entry_no, entry
+            first += count
+        for entry_no, (entry, _, _) in enumerate(list(self.entries), first):
+            if stop is not None and entry_no >= stop:
+                return
+            if entry_no >= start:
+                yield entry_no, entry
+
+    def search(self, needle, stop=None, limit=200):
+        """
+        Finds `needle` in the lower-cased, whitespace-normalized lines of the entries before `stop`,
+        reading spilled pages from disk. Returns ([(entry_no, line index in the entry, text)] for
+        the newest `limit` hits, oldest first, and whether there were more).
+        """
+        hits = deque(maxlen=limit)
+        total = 0
+        for entry_no, entry in self.iter_entries(0, stop):
+            for line_index, (_, text) in enumerate(entry_lines(entry)):
+                if needle in normalize_line(text).lower():
+                    hits.append((entry_no, line_index, text))
+                    total += 1
+        return list(hits), total > len(hits)
+
+    def clear(self):
+        self.entries.clear()
+        self.line_count = 0
+        self.pages = []
+        self.spilled_count = 0
+        if self.log_path:
+            try:
+                os.remove(self.log_path)
+            except OSError:
+                pass
+            self.log_path = None
+
+
+# =================================================================================
+# INCREMENTAL SEARCH INDEX
+# =================================================================================
+# Every line that reaches the terminal is numbered and indexed as it arrives, on
+# a background thread so the GUI only pays for a queue put: each word token maps
+# to the lines containing it, and each new token is also filed under its
+# trigrams, so a partial word in the query resolves to the tokens that contain it
+# without scanning the vocabulary. Candidate lines are then checked against the
+# whole query. Entries dropped from the index are searched in the scrollback, which
+# reads them back from its spill file.
+SEARCH_TOKEN_RE = re.compile(r'\w+')
+# When the index grows past this many lines, the oldest half (whole entries) is dropped from it.
+# It covers about what the scrollback keeps in memory; older lines are only on disk.
+SEARCH_INDEX_MAX_LINES = SCROLLBACK_MAX_LINES
+SEARCH_RESULT_LIMIT = 500
+SEARCH_MERGE_MAX_TOKENS = 64
+
+
+def _trigrams(token):
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class LogSearchIndex:
+    def __init__(self, scrollback, max_lines=SEARCH_INDEX_MAX_LINES):
+        self.scrollback = scrollback
+        self.max_lines = max_lines
+        # The text of every indexed line; lines[0] is line number `base`, the first line of entry `first_entry`.
+        # Only read and replaced under the lock.
+        self.lines = []
+        self.base = 0
+        self.first_entry = 0
+        self.postings = {}
+        self.token_trigrams = {}
+        # First line number of every entry ever added, so a line can be mapped back to its scrollback entry.
+        self.entry_first_line = array('q')
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.pending = Queue()
+        threading.Thread(target=self._index_worker, daemon=True, name="terminal-index").start()
+
+    def add_entry(self, entry):
+        self.pending.put((self.generation, entry))
+
+    def backlog(self):
+        return self.pending.qsize()
+
+    def _index_worker(self):
+        while True:
+            generation, entry = self.pending.get()
+            if entry is None:
+                return
+            with self.lock:
+                # Entries queued before a clear() belong to the old session.
+                if generation == self.generation:
+                    self._index_entry(entry)
+
+    def _index_entry(self, entry):
+        self.entry_first_line.append(self.base + len(self.lines))
+        for _, text in entry_lines(entry):
+            self._add_line(text)
+        if len(self.lines) > self.max_lines:
+            self._compact()
+
+    def _add_line(self, text):
+        line_no = self.base + len(self.lines)
+        self.lines.append(text)
+        for token in set(SEARCH_TOKEN_RE.findall(text.lower())):
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array('q')
+                for trigram in _trigrams(token):
+                    self.token_trigrams.setdefault(trigram, []).append(token)
+            postings.append(line_no)
+
+    def _compact(self):
+        # Cut on an entry boundary, so every entry is either fully indexed or left to the scrollback.
+        first_entry = bisect_left(self.entry_first_line, self.base + len(self.lines) // 2)
+        base = self.entry_first_line[first_entry] if first_entry < len(self.entry_first_line) else self.base + len(self.lines)
+        keep = self.lines[base - self.base:]
+        self.lines, self.base, self.first_entry, self.postings, self.token_trigrams = [], base, first_entry, {}, {}
+        for text in keep:
+            self._add_line(text)
+
+    def entry_of(self, line_no):
+        return bisect_right(self.entry_first_line, line_no) - 1
+
+    def _tokens_containing(self, term):
+        if len(term) < 3:
+            return [token for token in self.postings if term in token]
+        candidates = None
+        for trigram in _trigrams(term):
+            tokens = self.token_trigrams.get(trigram)
+            if not tokens:
+                return []
+            candidates = set(tokens) if candidates is None else candidates.intersection(tokens)
+            if not candidates:
+                return []
+        return [token for token in candidates if term in token]
+
+    def lines_between(self, start, stop):
+        """[(line_no, record or text, text)] for lines `start` to `stop`, read back through the scrollback."""
+        with self.lock:
+            first_entry, last_entry = self.entry_of(start), self.entry_of(stop - 1)
+            first_lines = self.entry_first_line[first_entry:last_entry + 1]
+        lines = []
+        for entry_no, entry in self.scrollback.iter_entries(first_entry, last_entry + 1):
+            line_no = first_lines[entry_no - first_entry]
+            lines += [(n, line, text) for n, (line, text) in enumerate(entry_lines(entry), line_no) if start <= n < stop]
+        return lines
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT, include_spilled=True):
+        """
+        Case-insensitive search for `query` as a substring of a line. Returns ([(line_no, text)]
+        for up to `limit` hits, oldest first, and whether there were more). With `include_spilled`,
+        entries no longer in the index are searched in the scrollback when the index has fewer
+        than `limit` hits; the newest of those older hits fill the list.
+        """
+        needle = normalize_line(query).lower()
+        with self.lock:
+            hits, more = self._search(needle, limit)
+            hits = [(line_no, self.lines[line_no - self.base]) for line_no in hits]
+            first_entry = self.first_entry
+        if include_spilled and len(hits) < limit and first_entry and needle:
+            older, older_more = self.scrollback.search(needle, first_entry, limit - len(hits))
+            with self.lock:
+                older = [(self.entry_first_line[entry_no] + index, text) for entry_no, index, text in older
+                         if entry_no < len(self.entry_first_line)]
+            hits, more = older + hits, more or older_more
+        return hits, more
+
+    def _search(self, needle, limit):
+        terms = set(SEARCH_TOKEN_RE.findall(needle))
+        if terms:
+            # Walk the postings of the most selective term only; the full query is checked per line anyway.
+            # Terms shorter than a trigram need a vocabulary scan, so they are only used when nothing else is given.
+            best = None
+            for term in [t for t in terms if len(t) >= 3] or terms:
+                tokens = self._tokens_containing(term)
+                size = sum(len(self.postings[token]) for token in tokens)
+                if not size:
+                    return [], False
+                if best is None or size < best[0]:
+                    best = (size, tokens)
+            postings = [self.postings[token] for token in best[1]]
+            # A lazy merge stops early once `limit` hits are found, but costs too much across thousands of tokens.
+            candidates = heapq.merge(*postings) if len(postings) <= SEARCH_MERGE_MAX_TOKENS else sorted(set().union(*postings))
+        elif needle:
+            # Punctuation-only queries have no tokens to look up.
+            candidates = range(self.base, self.base + len(self.lines))
+        else:
+            return [], False
+
+        hits, previous = [], None
+        for line_no in candidates:
+            if line_no == previous:
+                continue
+            previous = line_no
+            if needle in normalize_line(self.lines[line_no - self.base]).lower():
+                if len(hits) == limit:
+                    return hits, True
+                hits.append(line_no)
+        return hits, False
+
+    def close(self):
+        """Frees the index and stops the worker thread."""
+        self.clear()
+        self.pending.put((self.generation, None))
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.lines, self.base, self.first_entry, self.postings, self.token_trigrams = [], 0, 0, {}, {}
+            self.entry_first_line = array('q')
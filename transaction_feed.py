@@ -0,0 +1,173 @@
+import html
+import time
+import threading
+from collections import deque
+
+from signal_queue import QueueNotifier
+
+
+# =================================================================================
+# LIVE TRANSACTION FEED BUFFER
+# =================================================================================
+# A busy contract can emit events faster than a QTextBrowser can render them.
+# Producers put events into a bounded buffer and the GUI drains it in batches;
+# once the buffer is full the overflow policy decides what is kept, so memory and
+# latency stay flat whatever the input rate. Counters for the input rate and for
+# dropped, sampled-out and aggregated events are shown next to the feed.
+#
+# An event is a preformatted HTML string or a dict with "block" and optionally
+# "hash", "from", "to", "value" and "label". The buffer has the same put/rearm
+# interface as signal_queue.SignalingQueue, so a QueueDrainer wakes the GUI.
+FEED_BUFFER_SIZE = 5000
+# Events rendered per frame, and lines kept in the feed widget.
+FEED_RENDER_BATCH = 500
+FEED_MAX_LINES = 5000
+RATE_WINDOW = 5
+
+POLICY_DROP_OLDEST = 'drop_oldest'
+POLICY_SAMPLE = 'sample'
+POLICY_AGGREGATE = 'aggregate'
+POLICY_NAMES = {
+    POLICY_DROP_OLDEST: "Drop oldest",
+    POLICY_SAMPLE: "Sample",
+    POLICY_AGGREGATE: "Aggregate per block",
+}
+
+
+class TransactionFeedBuffer:
+    def __init__(self, capacity=FEED_BUFFER_SIZE, policy=POLICY_DROP_OLDEST):
+        self.capacity = capacity
+        self.policy = policy
+        self.items = deque()
+        self.lock = threading.Lock()
+        self.notifier = QueueNotifier()
+        self._armed = True
+        self.received = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.aggregated = 0
+        # Under the sample policy one in `sample_every` events is kept; drain() adjusts it once per frame.
+        self.sample_every = 1
+        self._sample_counter = 0
+        # [second, events received in that second] for the last RATE_WINDOW seconds.
+        self._rate_buckets = deque()
+
+    def put(self, event):
+        with self.lock:
+            self.received += 1
+            self._count_rate()
+            if self.policy == POLICY_SAMPLE:
+                self._put_sampled(event)
+            elif self.policy == POLICY_AGGREGATE:
+                self._put_aggregated(event)
+            else:
+                self._put_dropping_oldest(event)
+            notify, self._armed = self._armed, False
+        if notify:
+            self.notifier.ready.emit()
+
+    def _count_rate(self):
+        second = int(time.monotonic())
+        if self._rate_buckets and self._rate_buckets[-1][0] == second:
+            self._rate_buckets[-1][1] += 1
+        else:
+            self._rate_buckets.append([second, 1])
+        while self._rate_buckets[0][0] <= second - RATE_WINDOW:
+            self._rate_buckets.popleft()
+
+    def _drop_oldest(self):
+        oldest = self.items.popleft()
+        self.dropped += oldest.get('count', 1) if isinstance(oldest, dict) else 1
+
+    def _put_dropping_oldest(self, event):
+        if len(self.items) >= self.capacity:
+            self._drop_oldest()
+        self.items.append(event)
+
+    def _put_sampled(self, event):
+        self._sample_counter += 1
+        if self._sample_counter % self.sample_every:
+            self.sampled_out += 1
+            return
+        self._put_dropping_oldest(event)
+
+    def _put_aggregated(self, event):
+        if len(self.items) < self.capacity or not isinstance(event, dict):
+            self._put_dropping_oldest(event)
+            return
+        # Full: fold the event into the newest row if it is for the same block.
+        newest = self.items[-1]
+        if isinstance(newest, dict) and newest.get('block') == event.get('block'):
+            if not newest.get('aggregate'):
+                newest = self.items[-1] = {'block': newest.get('block'), 'aggregate': True, 'count': 1,
+                                           'value': newest.get('value') or 0}
+            newest['count'] += 1
+            newest['value'] += event.get('value') or 0
+            self.aggregated += 1
+            return
+        self._drop_oldest()
+        self.items.append({'block': event.get('block'), 'aggregate': True, 'count': 1, 'value': event.get('value') or 0})
+        self.aggregated += 1
+
+    def set_policy(self, policy):
+        with self.lock:
+            self.policy = policy
+            self.sample_every = 1
+
+    def rearm(self):
+        with self.lock:
+            self._armed = True
+
+    def empty(self):
+        return not self.items
+
+    def drain(self, limit=FEED_RENDER_BATCH):
+        with self.lock:
+            if self.policy == POLICY_SAMPLE:
+                # Sample more sparsely while the GUI falls behind, and back off as it catches up.
+                # Capped at 1 in `capacity`, so a long burst cannot push the interval so high that
+                # the feed stays nearly silent for many drains after it ends.
+                if len(self.items) > self.capacity // 2:
+                    self.sample_every = min(self.sample_every * 2, max(self.capacity, 1))
+                elif len(self.items) < self.capacity // 8 and self.sample_every > 1:
+                    self.sample_every //= 2
+            return [self.items.popleft() for _ in range(min(limit, len(self.items)))]
+
+    def rate(self):
+        with self.lock:
+            cutoff = int(time.monotonic()) - RATE_WINDOW
+            return sum(count for second, count in self._rate_buckets if second > cutoff) / RATE_WINDOW
+
+    def stats_text(self):
+        parts = [f"{self.rate():.1f} tx/s", f"buffered {len(self.items)}/{self.capacity}", f"dropped {self.dropped}"]
+        if self.sampled_out:
+            parts.append(f"sampled out {self.sampled_out} (1 in {self.sample_every})")
+        if self.aggregated:
+            parts.append(f"aggregated {self.aggregated}")
+        return " · ".join(parts)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.received = self.dropped = self.sampled_out = self.aggregated = 0
+            self.sample_every = 1
+            self._rate_buckets.clear()
+
+
+def format_feed_event(event):
+    if isinstance(event, str):
+        return event
+    block = f"<span style='color:#87CEEB;'>#{event.get('block', '?')}</span>"
+    if event.get('aggregate'):
+        value = f", total value {event['value']}" if event.get('value') else ""
+        return f"{block} <span style='color:orange;'>{event['count']} transactions aggregated{value}</span>"
+    parts = [block]
+    if event.get('label'):
+        parts.append(f"<b>{html.escape(str(event['label']))}</b>")
+    if event.get('hash'):
+        parts.append(html.escape(str(event['hash'])[:18]))
+    if event.get('from') or event.get('to'):
+        parts.append(f"{html.escape(str(event.get('from', '?')))} → {html.escape(str(event.get('to', '?')))}")
+    if event.get('value'):
+        parts.append(f"value {html.escape(str(event['value']))}")
+    return " ".join(parts)